@@ -0,0 +1,81 @@
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+from utils.essentials.timer_scheduler import command_timers
+from utils.cache.cache_metrics import (
+    cache_metrics_summary,
+    memory_snapshot_report,
+    start_memory_trace,
+    stop_memory_trace,
+)
+
+ALLOWED_USER_IDS = {952071312124313611}
+
+
+class CacheMemory(commands.Cog):
+    """🧠 Cache Memory Inspector Cog 🧠"""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @app_commands.command(
+        name="cache-memory",
+        description="Show cache sizes or exact tracemalloc snapshots (admin only) 🧠",
+    )
+    @app_commands.describe(mode="What to report")
+    @app_commands.choices(
+        mode=[
+            app_commands.Choice(name="Estimate (sampled)", value="estimate"),
+            app_commands.Choice(name="Start trace", value="start"),
+            app_commands.Choice(name="Snapshot (exact)", value="snapshot"),
+            app_commands.Choice(name="Stop trace", value="stop"),
+        ]
+    )
+    async def cache_memory(
+        self,
+        interaction: discord.Interaction,
+        mode: app_commands.Choice[str] = None,
+    ):
+        if interaction.user.id not in ALLOWED_USER_IDS:
+            await interaction.response.send_message(
+                content="Only Khy is allowed to use this!", ephemeral=True
+            )
+            return
+
+        mode_value = mode.value if mode else "estimate"
+
+        # -------------------- Sampled estimate --------------------
+        if mode_value == "estimate":
+            summary = cache_metrics_summary()
+            lines = [
+                f"**{m['name']}**: {m['entries']} entries · ~{m['approx_bytes'] // 1024} KB"
+                for m in summary
+            ]
+            total_kb = sum(m["approx_bytes"] for m in summary) // 1024
+            lines.append(f"**Total Approx:** ~{total_kb} KB")
+            lines.append(f"**Pending timers:** {command_timers.pending_counts() or 0}")
+            content = "\n".join(lines)
+
+        # -------------------- tracemalloc controls --------------------
+        elif mode_value == "start":
+            started = start_memory_trace()
+            content = (
+                "✅ tracemalloc started — take a snapshot later to see allocations."
+                if started
+                else "tracemalloc is already running."
+            )
+        elif mode_value == "stop":
+            stopped = stop_memory_trace()
+            content = (
+                "🛑 tracemalloc stopped." if stopped else "tracemalloc was not running."
+            )
+        else:
+            content = "```\n" + "\n".join(memory_snapshot_report()) + "\n```"
+
+        await interaction.response.send_message(content=content[:2000], ephemeral=True)
+
+
+# -------------------- Setup Cog --------------------
+async def setup(bot: commands.Bot):
+    await bot.add_cog(CacheMemory(bot))
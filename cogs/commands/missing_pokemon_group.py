@@ -59,8 +59,9 @@ class MissingPokemon(commands.Cog):
         name="box", description="Adds missing Pokémon from your ;list pokemon command"
     )
     @app_commands.describe(
-        message_link="Link to the PokéMeow message (must have embed with Pokémon list)",
+        message_link="Link(s) to PokéMeow box pages — paste several to import them all at once",
         exemption="What variant to exempt (if any)",
+        last_message_link="Optional: last page link — imports every PokéMeow page from message_link up to here",
     )
     async def missing_pokemon_box(
         self,
@@ -74,6 +75,7 @@ class MissingPokemon(commands.Cog):
             "Regular and Golden",
             "Shiny and Golden",
         ] = None,
+        last_message_link: str = None,
     ):
         slash_cmd_name = "checklist add"
 
@@ -84,6 +86,7 @@ class MissingPokemon(commands.Cog):
             command_func=missing_pokemon_box_func,
             message_link=message_link,
             exemption=exemption,
+            last_message_link=last_message_link,
         )
 
     # 🎀────────────────────────────────────────────
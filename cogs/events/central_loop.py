@@ -3,7 +3,8 @@ import asyncio
 from discord.ext import commands
 
 # 🧹 Import your scheduled tasks
-from utils.background_task.user_reminders_checker import process_due_reminders
+from utils.background_task.user_reminder_scheduler import user_reminder_scheduler
+from utils.background_task.user_reminders_checker import start_user_reminder_scheduler
 from utils.background_task.pokemeow_schedule_checker import pokemeow_schedule_checker
 from utils.logs.pretty_log import pretty_log
 from utils.background_task.special_battle_timer_checker import special_battle_timer_checker
@@ -12,6 +13,8 @@ from utils.background_task.spooky_hour_checker import check_and_handle_spooky_ho
 # 🍰──────────────────────────────
 #   🎀 Cog: CentralLoop
 #   Handles background tasks every 60 seconds
+#   (user reminders run on their own due-time scheduler;
+#   each tick (re)starts it if it isn't running)
 # 🍰──────────────────────────────
 class CentralLoop(commands.Cog):
     def __init__(self, bot: commands.Bot):
@@ -19,6 +22,7 @@ class CentralLoop(commands.Cog):
         self.loop_task = None
 
     def cog_unload(self):
+        user_reminder_scheduler.stop()
         if self.loop_task and not self.loop_task.done():
             self.loop_task.cancel()
             pretty_log(
@@ -38,6 +42,19 @@ class CentralLoop(commands.Cog):
             bot=self.bot,
         )
         while not self.bot.is_closed():
+            # 🦭 User reminders: (re)load and start the scheduler until it runs,
+            # so a failed startup load is retried on the next tick
+            if not user_reminder_scheduler.is_running():
+                try:
+                    await start_user_reminder_scheduler(self.bot)
+                except Exception as e:
+                    pretty_log(
+                        "error",
+                        f"Failed to start user reminder scheduler (retrying in 60s): {e}",
+                        label="CENTRAL LOOP ERROR",
+                        bot=self.bot,
+                    )
+
             try:
                 """pretty_log(
                     "",
@@ -46,9 +63,6 @@ class CentralLoop(commands.Cog):
                     bot=self.bot,
                 )"""
 
-                # 🦭 Check if any user reminder is due
-                await process_due_reminders(self.bot)
-
                 # 🐱 Check if any Pokemeow schedule reminder is due
                 await pokemeow_schedule_checker(self.bot)
 
@@ -83,7 +97,7 @@ async def setup(bot: commands.Bot):
 
     print("\n[📋 CENTRAL LOOP CHECKLIST] Scheduled tasks loaded:")
     print("  ─────────────────────────────────────────────")
-    print("  ✅ 🧭  process_due_reminders")
+    print("  ✅ 🧭  user reminders (due-time scheduler)")
     print("  ✅ 🐱  pokemeow_schedule_checker")
     #print("  ✅ 🌹  special_battle_timer_checker")
     #print("  ✅ 🍑  check_and_handle_spooky_hour_expiry")
@@ -0,0 +1,60 @@
+# 🟣────────────────────────────────────────────
+#        💜 Member Name Index Listener Cog 💜
+# ─────────────────────────────────────────────
+
+import discord
+from discord.ext import commands
+
+from utils.cache.member_name_cache import (
+    drop_guild,
+    index_all_guilds,
+    index_guild,
+    index_member,
+    unindex_member,
+)
+
+
+class MemberIndexListener(commands.Cog):
+    """Keeps the guild member name index in sync with member events."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        index_all_guilds(self.bot)
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild):
+        index_guild(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        drop_guild(guild.id)
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        index_member(member)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if before.name != after.name or before.display_name != after.display_name:
+            index_member(after)
+
+    @commands.Cog.listener()
+    async def on_user_update(self, before: discord.User, after: discord.User):
+        # Username / global name changes don't fire on_member_update
+        if before.name == after.name and before.global_name == after.global_name:
+            return
+        for guild in after.mutual_guilds:
+            member = guild.get_member(after.id)
+            if member:
+                index_member(member)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        unindex_member(member.guild.id, member.id)
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(MemberIndexListener(bot))
@@ -3,13 +3,13 @@
 # ─────────────────────────────────────────────
 
 import asyncio
-import re
 
 import discord
 from discord.ext import commands
 
 from config.settings import *
 from config.settings import VALID_SERVER_IDS
+from utils.essentials.trigger_dispatch import Trigger, TriggerDispatcher, has, has_lower
 from utils.listener_func.auction_command_listener import auction_command_listener
 from utils.listener_func.battle_icon_unlock import battle_unlock_listener
 from utils.listener_func.battle_timer import battle_timer_handler
@@ -52,6 +52,7 @@ from utils.listener_func.special_battle_listener import special_battle_npc_liste
 from utils.listener_func.spooky_hour_listener import handle_spooky_hour_hw_embed
 from utils.listener_func.tcg_inv import parse_tcg_inventory_embed
 from utils.logs.pretty_log import pretty_log
+from utils.parsers.pokemeow_patterns import CATCHBOT_SPENT_PATTERN
 
 BOT_LOG_ID = 1422414881944240148
 # 💜────────────────────────────────────────────
@@ -65,10 +66,6 @@ cb_command_embed_trigger = (
     ":battery: Your CatchBot is currently catching Pokemon for you!"
 )
 cb_checklist_trigger = "View your event checklist with ;e cl"
-CATCHBOT_SPENT_PATTERN = re.compile(
-    r"You spent <:[^:]+:\d+> \*\*[\d,]+ PokeCoins\*\* to run your catch bot\.",
-    re.IGNORECASE,
-)
 held_item_trigger = "<:held_item:"
 FACTIONS = ["aqua", "flare", "galactic", "magma", "plasma", "rocket", "skull", "yell"]
 hw_embed_trigger = "happy halloween pokemeow! participate in activities for rewards!"
@@ -87,6 +84,238 @@ auction_command_trigger = "Auctions on this page"
 class MessageCreateListener(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.dispatcher = TriggerDispatcher(self.build_triggers())
+
+    # 💜────────────────────────────────────────────
+    #           🗂 Trigger Table (built once on cog load)
+    # 💜────────────────────────────────────────────
+    def build_triggers(self) -> list[Trigger]:
+        bot = self.bot
+        return [
+            # 🛒 Purchase
+            Trigger(
+                "purchase",
+                lambda m: get_purchased_pokemon(bot, m),
+                all_of=[has("content", purchase_trigger)],
+            ),
+            # 🤝 Single Trade
+            Trigger(
+                "single_trade",
+                lambda m: handle_single_trade_message(bot, m),
+                all_of=[has("content", ":handshake:")],
+            ),
+            # 🤝 Multi Trade
+            Trigger(
+                "multi_trade",
+                lambda m: handle_multitrade_message(bot, m),
+                all_of=[has("content", multi_trade_trigger)],
+            ),
+            # 🧬 Dex
+            Trigger(
+                "dex",
+                lambda m: dex_message_handler(bot, m),
+                all_of=[has("description", dex_trigger)],
+            ),
+            # 🐣 Egg Hatch Rare Spawn
+            Trigger(
+                "egg_rarespawn",
+                lambda m: egg_rarespawn_handler(bot, m),
+                all_of=[
+                    has("author", "hatched an Egg!"),
+                    has("content", "just hatched a"),
+                ],
+            ),
+            # 🔄 Swap Rare Spawn
+            Trigger(
+                "swap_rarespawn",
+                lambda m: swap_rarespawn_handler(bot, m),
+                all_of=[has("author", "PokeMeow Swaps")],
+                any_of=[
+                    has("content", "received:"),
+                    has_lower("content", "from a swap"),
+                ],
+            ),
+            # 📢 Market Alert
+            Trigger(
+                "market_alert",
+                lambda m: process_market_alert_message(bot, m, Categories.Market_Feed),
+                predicate=lambda f: bool(
+                    f.message.guild
+                    and f.message.guild.id == MAIN_SERVER_ID
+                    and f.message.channel.category_id == Categories.Market_Feed
+                ),
+                timeout=120.0,  # one send per subscriber
+            ),
+            # ⏲️ Pokemon Timer
+            Trigger(
+                "pokemon_timer",
+                pokemon_timer_handler,
+                all_of=[has("description", "found a wild")],
+            ),
+            # 🎣 Fish Timer
+            Trigger(
+                "fish_timer",
+                fish_timer_handler,
+                all_of=[
+                    has("description", "cast a"),
+                    has("description", "into the water"),
+                ],
+            ),
+            # ⚔️ Battle Timer
+            Trigger(
+                "battle_timer",
+                lambda m: battle_timer_handler(bot, m),
+                all_of=[has("author", "PokeMeow Battles")],
+            ),
+            # 🎒 Held Item Ping
+            Trigger(
+                "held_item_ping",
+                held_item_ping,
+                all_of=[has("description", held_item_trigger)],
+            ),
+            # 🟣 Faction Ball (A. ;fa command, B. daily message)
+            Trigger(
+                "faction_ball_fa",
+                lambda m: extract_faction_ball_from_fa(bot, m),
+                any_of=[has_lower("author", f) for f in FACTIONS],
+            ),
+            Trigger(
+                "faction_ball_daily",
+                lambda m: extract_faction_ball_from_daily(bot, m),
+                all_of=[has_lower("description", "daily streak")],
+            ),
+            # 💎 Golden Stone Mega Chamber
+            Trigger(
+                "golden_stone",
+                golden_stone_listener,
+                all_of=[has("content", t) for t in golden_stone_triggers],
+                announce="Golden Stone Mega Chamber",
+            ),
+            # 🖼️ Battle Icon Unlock
+            Trigger(
+                "battle_icon_unlock",
+                battle_unlock_listener,
+                all_of=[has("content", t) for t in battle_icon_triggers],
+                announce="Battle Icon Unlock",
+            ),
+            # 🎈 Faction Ball Alert
+            Trigger(
+                "faction_hunt_alert",
+                lambda m: faction_hunt_alert(bot, before=m, after=m),
+                all_of=[
+                    has("description", "<:team_logo:"),
+                    has("description", "found a wild"),
+                ],
+            ),
+            # 📦 TCG Inventory
+            Trigger(
+                "tcg_inventory",
+                lambda m: parse_tcg_inventory_embed(message=m),
+                all_of=[has_lower("title", "tcg inventory")],
+            ),
+            # ⏰ Auction Command
+            Trigger(
+                "auction_command",
+                lambda m: auction_command_listener(
+                    bot=bot, before_message=m, message=m
+                ),
+                all_of=[has("footer", auction_command_trigger)],
+                announce="Auction Command",
+            ),
+            # ⏰ Special Battle NPC Timer (Disabled for now)
+            # Trigger(
+            #     "special_battle_npc",
+            #     lambda m: special_battle_npc_listener(bot, m),
+            #     all_of=[has("description", "challenged <:irida:1428149067673767996> **Irida** to a battle!")],
+            # ),
+            # 🎃 Spooky Hour HW Embed (Disabled for now)
+            # Trigger(
+            #     "spooky_hour_hw",
+            #     lambda m: handle_spooky_hour_hw_embed(bot, m),
+            #     all_of=[has_lower("author", hw_embed_trigger)],
+            # ),
+            # 🏆 Quest Embed
+            Trigger(
+                "quest_embed",
+                lambda m: handle_quest_embed(bot, m),
+                all_of=[has("title", "Complete your quests for rewards!")],
+            ),
+            # 📝 Quest Complete
+            Trigger(
+                "quest_complete",
+                lambda m: handle_quest_complete_message(bot, m),
+                all_of=[
+                    has("content", ":notepad_spiral"),
+                    has("content", "completed the quest"),
+                ],
+            ),
+            # 🏰 Battle Tower (Disabled for now)
+            # Trigger(
+            #     "bt_register",
+            #     lambda m: bt_register_listener(bot, m),
+            #     any_of=[has_lower("content", t) for t in bt_register_triggers],
+            #     announce="Battle Tower registration",
+            # ),
+            # Trigger(
+            #     "bt_npc_battle",
+            #     lambda m: bt_register_listener(bot, m),
+            #     all_of=[has("description", "challenged <:battletower")],
+            #     announce="Battle Tower NPC battle",
+            # ),
+            # Trigger(
+            #     "bt_command",
+            #     lambda m: bt_command_listener(bot, m),
+            #     all_of=[has("author", "PokeMeow Battle Tower")],
+            #     announce="Battle Tower command",
+            # ),
+            # 💎 Patreon Rank (A. perks embed, B. pro embed)
+            Trigger(
+                "patreon_perks",
+                lambda m: extract_patreon_rank_from_perks_embed(bot, m),
+                all_of=[has("author", "perks")],
+            ),
+            Trigger(
+                "patreon_pro",
+                lambda m: extract_patreon_rank_from_pro_embed(bot, m),
+                all_of=[has_lower("footer", "to view badge information")],
+            ),
+            # 🤖 CatchBot return text / run message
+            Trigger(
+                "catchbot_return",
+                lambda m: handle_cb_return_message(bot=bot, message=m),
+                all_of=[has_lower("content", cb_return_trigger)],
+                announce="CatchBot return",
+            ),
+            Trigger(
+                "catchbot_run",
+                lambda m: handle_cb_run_message(bot=bot, message=m),
+                all_of=[has_lower("content", "to run your catch bot")],
+                none_of=[has_lower("content", cb_return_trigger)],
+                predicate=lambda f: bool(
+                    CATCHBOT_SPENT_PATTERN.search(f.get("content"))
+                ),
+                announce="CatchBot spent",
+            ),
+            # 🤖 CatchBot command embed (field name or value)
+            Trigger(
+                "catchbot_command",
+                lambda m: handle_cb_command_embed(bot=bot, message=m),
+                all_of=[has_lower("fields", cb_command_embed_trigger)],
+                announce="CatchBot command",
+            ),
+            # 🤖 CatchBot + quest checklist (;cl footer)
+            Trigger(
+                "catchbot_checklist",
+                lambda m: handle_cb_checklist_message(bot=bot, message=m),
+                all_of=[has_lower("footer", cb_checklist_trigger)],
+                announce="CatchBot and quest checklist",
+            ),
+            Trigger(
+                "quest_checklist",
+                lambda m: handle_quest_checklist_message(bot=bot, message=m),
+                all_of=[has_lower("footer", cb_checklist_trigger)],
+            ),
+        ]
 
     # 💜 Helper: Retry Discord calls on 503
     async def retry_discord_call(self, func, *args, retries=3, delay=2, **kwargs):
@@ -136,332 +365,8 @@ class MessageCreateListener(commands.Cog):
                     )
                 return
 
-            first_embed = message.embeds[0] if message.embeds else None
-            first_embed_description = first_embed.description if first_embed else None
-            first_embed_author = (
-                first_embed.author.name if first_embed and first_embed.author else ""
-            )
-            first_embed_title = first_embed.title if first_embed else ""
-            first_embed_footer = (
-                first_embed.footer.text if first_embed and first_embed.footer else ""
-            )
-            # 💖────────────────────────────────────────────
-            #           🛒 Purchase Processing Only
-            # 💖────────────────────────────────────────────
-            if message.content and purchase_trigger in message.content:
-                await get_purchased_pokemon(self.bot, message)
-
-            # 💖────────────────────────────────────────────
-            #           🤝 Single Trade Processing Only
-            # 💖────────────────────────────────────────────
-            if message.content and ":handshake:" in message.content:
-                await handle_single_trade_message(self.bot, message)
-
-            # 💖────────────────────────────────────────────
-            #           🤝 Multi Trade Processing Only
-            # 💖────────────────────────────────────────────
-            if message.content and multi_trade_trigger in message.content:
-                await handle_multitrade_message(self.bot, message)
-
-            # 💖────────────────────────────────────────────
-            #           🧬 Dex Processing Only
-            # 💖────────────────────────────────────────────
-            if message.embeds and message.embeds[0]:
-                embed = message.embeds[0]
-                embed_description = embed.description
-                if embed_description and dex_trigger in embed_description:
-                    await dex_message_handler(self.bot, message)
-            # 💖────────────────────────────────────────────
-            #           🐣 Egg Hatch Rare Spawn Processing Only
-            # 💖────────────────────────────────────────────
-            # User hatched an Egg! in author text
-            if (
-                message.embeds
-                and message.embeds[0]
-                and message.content
-                and message.embeds[0].author
-                and "hatched an Egg!" in (message.embeds[0].author.name or "")
-                and "just hatched a" in message.content
-            ):
-                await egg_rarespawn_handler(self.bot, message)
-
-            # 💖────────────────────────────────────────────
-            #           🔄 Swap Rare Spawn Processing Only
-            # 💖────────────────────────────────────────────
-            if (
-                message.embeds
-                and message.embeds[0]
-                and message.content
-                and message.embeds[0].author
-                and "PokeMeow Swaps" in (message.embeds[0].author.name or "")
-                and (
-                    "received:" in message.content
-                    or "from a swap" in message.content.lower()
-                )
-            ):
-                await swap_rarespawn_handler(self.bot, message)
-            # 💖────────────────────────────────────────────
-            #           📢 Market Alert Processing Only
-            # 💖────────────────────────────────────────────
-            if (
-                message.guild
-                and message.guild.id == MAIN_SERVER_ID
-                and message.channel.category_id == Categories.Market_Feed
-            ):
-
-                await process_market_alert_message(
-                    self.bot, message, Categories.Market_Feed
-                )
-            # 💜────────────────────────────────────────────
-            #           ⏲️ Pokemon Timer Processing Only
-            # 💜────────────────────────────────────────────
-            if message.embeds and message.embeds[0]:
-                embed = message.embeds[0]
-                embed_description = embed.description if embed else None
-                if embed_description and "found a wild" in embed_description:
-                    await pokemon_timer_handler(message)
-            # 💜────────────────────────────────────────────
-            #           🎣 Fish Timer Processing Only
-            # 💜────────────────────────────────────────────
-            if message.embeds and message.embeds[0]:
-                embed = message.embeds[0]
-                embed_description = embed.description if embed else None
-                if (
-                    embed_description
-                    and "cast a" in embed_description
-                    and "into the water" in embed_description
-                ):
-                    await fish_timer_handler(message)
-            # 💜────────────────────────────────────────────
-            #           ⚔️ Battle Timer Processing Only
-            # 💜────────────────────────────────────────────
-
-            if message.embeds and message.embeds[0]:
-                await battle_timer_handler(self.bot, message)
-
-            # 💜────────────────────────────────────────────
-            #           🎒 Held Item Ping Processing Only
-            # 💜────────────────────────────────────────────
-            if (
-                message.embeds
-                and message.embeds[0]
-                and message.embeds[0].description
-                and held_item_trigger in message.embeds[0].description
-            ):
-                await held_item_ping(message)
-            # 💜────────────────────────────────────────────
-            #           🟣 Faction Ball Processing Only
-            # 💜────────────────────────────────────────────
-            # A. From ;fa command
-            if first_embed:
-                if first_embed.author and any(
-                    f in first_embed.author.name.lower() for f in FACTIONS
-                ):
-                    await extract_faction_ball_from_fa(self.bot, message)
-
-            # B. From daily message
-            if first_embed:
-                if (
-                    first_embed.description
-                    and "daily streak" in first_embed.description.lower()
-                ):
-                    await extract_faction_ball_from_daily(self.bot, message)
-            # 💜────────────────────────────────────────────
-            #        💎 Golden Stone Mega Chamber Processing Only
-            # 💜────────────────────────────────────────────
-            if message.content and all(
-                trigger in message.content for trigger in golden_stone_triggers
-            ):
-                pretty_log(
-                    "info",
-                    f"Matched Golden Stone Mega Chamber triggers | Message ID: {message.id} | Channel: {message.channel.name}",
-                )
-                await golden_stone_listener(message)
-            # 💜────────────────────────────────────────────
-            #        🖼️ Battle Icon Unlock Processing Only
-            # 💜────────────────────────────────────────────
-            if message.content and all(
-                trigger in message.content for trigger in battle_icon_triggers
-            ):
-                pretty_log(
-                    "info",
-                    f"Matched Battle Icon Unlock triggers | Message ID: {message.id} | Channel: {message.channel.name}",
-                )
-                await battle_unlock_listener(message)
-            # 💜────────────────────────────────────────────
-            #        🎈 Faction Ball Alert Processing Only
-            # 💜────────────────────────────────────────────
-            if first_embed:
-                if (
-                    first_embed.description
-                    and "<:team_logo:" in first_embed.description
-                    and "found a wild" in first_embed.description
-                ):
-                    await faction_hunt_alert(self.bot, before=message, after=message)
-                #
-            # 💜────────────────────────────────────────────
-            #        📦 TCG Inventory Embed Processing Only
-            # 💜────────────────────────────────────────────
-            if first_embed:
-                if first_embed_title and "tcg inventory" in first_embed_title.lower():
-                    await parse_tcg_inventory_embed(
-                        message=message,
-                    )
-            # 💜────────────────────────────────────────────
-            #        ⏰ Auction Command Listener Processing Only
-            # 💜────────────────────────────────────────────
-            if first_embed:
-                if (
-                    first_embed.footer
-                    and auction_command_trigger in first_embed.footer.text
-                ):
-                    pretty_log(
-                        "info",
-                        f"Matched Auction Command trigger | Message ID: {message.id} | Channel: {message.channel.name}",
-                    )
-                    await auction_command_listener(
-                        bot=self.bot,
-                        before_message=message,
-                        message=message,
-                    )
-
-            # 💜────────────────────────────────────────────
-            #        ⏰ Special Battle NPC Timer Processing Only (Disabled for now)
-            # 💜────────────────────────────────────────────
-            """if first_embed:
-                if (
-                    first_embed.description
-                    and "challenged <:irida:1428149067673767996> **Irida** to a battle!"
-                    in first_embed.description
-                ):
-                    await special_battle_npc_listener(self.bot, message)"""
-
-            # 💜────────────────────────────────────────────
-            #        🎃 Spooky Hour HW Embed Processing Only (Disabled for now)
-            # 💜────────────────────────────────────────────
-            """if first_embed:
-                embed_author_text = first_embed.author.name if first_embed.author else ""
-                if hw_embed_trigger in embed_author_text.lower():
-                    await handle_spooky_hour_hw_embed(self.bot, message)"""
-            # 💜────────────────────────────────────────────
-            #        🏆 Quest Embed Processing Only
-            # 💜────────────────────────────────────────────
-            if first_embed:
-                title = first_embed.title or ""
-                if title and "Complete your quests for rewards!" in title:
-                    await handle_quest_embed(self.bot, message)
-
-            # 💜────────────────────────────────────────────
-            #        📝 Quest Complete Processing Only
-            # 💜────────────────────────────────────────────
-            if (
-                message.content
-                and ":notepad_spiral" in message.content
-                and "completed the quest" in message.content
-            ):
-                await handle_quest_complete_message(self.bot, message)
-
-            """# 💜────────────────────────────────────────────
-            #        🏰 Battle Tower Registration Processing Only
-            # 💜────────────────────────────────────────────
-            if message.content:
-                content_lower = message.content.lower()
-                # BT Register
-                if any(trigger in content_lower for trigger in bt_register_triggers):
-                    pretty_log(
-                        "info",
-                        f"Matched Battle Tower registration trigger in ;bt register | Message ID: {message.id} | Channel: {message.channel.name}",
-                    )
-                    await bt_register_listener(self.bot, message)
-            # 💜────────────────────────────────────────────
-            #        🏰 ; B npc bt command listener
-            # 💜────────────────────────────────────────────
-            if first_embed:
-                if (
-                    first_embed.description
-                    and "challenged <:battletower" in first_embed.description
-                ):
-                    pretty_log(
-                        "info",
-                        f"Matched Battle Tower NPC battle trigger in ;b npc bt | Message ID: {message.id} | Channel: {message.channel.name}",
-                    )
-                    await bt_register_listener(self.bot, message)
-            # 💜────────────────────────────────────────────
-            #        🏰 Battle Tower Command Listener
-            # 💜────────────────────────────────────────────
-            if first_embed and first_embed_author:
-                if "PokeMeow Battle Tower" in first_embed_author:
-                    pretty_log(
-                        "info",
-                        f"Matched Battle Tower command trigger | Message ID: {message.id} | Channel: {message.channel.name}",
-                    )
-                    await bt_command_listener(self.bot, message)"""
-            # 💜────────────────────────────────────────────
-            #        💎 Patreon Rank Processing Only
-            # 💜────────────────────────────────────────────
-            if first_embed:
-                author_text = first_embed.author.name if first_embed.author else ""
-                footer_text = first_embed.footer.text if first_embed.footer else ""
-
-                # A. Perks Embed
-                if author_text and "perks" in author_text:
-                    await extract_patreon_rank_from_perks_embed(self.bot, message)
-
-                # B. Pro Embed
-                if footer_text and "to view badge information" in footer_text.lower():
-                    await extract_patreon_rank_from_pro_embed(self.bot, message)
-
-            # 💜────────────────────────────────────────────
-            #           🤖 CatchBot Processing Only
-            # 💜────────────────────────────────────────────
-            if message.content:
-                # 1️⃣ CatchBot return text
-                if cb_return_trigger.lower() in message.content.lower():
-                    pretty_log(
-                        "info",
-                        f"Matched CatchBot return trigger | Message ID: {message.id} | Channel: {message.channel.name}",
-                    )
-                    await handle_cb_return_message(bot=self.bot, message=message)
-
-                # 2️⃣ CatchBot run message
-                elif CATCHBOT_SPENT_PATTERN.search(message.content):
-                    pretty_log(
-                        "info",
-                        f"Matched CatchBot spent pattern | Message ID: {message.id} | Channel: {message.channel.name}",
-                    )
-                    await handle_cb_run_message(bot=self.bot, message=message)
-
-            # 3️⃣ CatchBot embeds
-            if first_embed:
-
-                # 🔹 Check fields
-                for field in first_embed.fields:
-                    name = field.name.lower() if field.name else ""
-                    value = field.value.lower() if field.value else ""
-
-                    if (
-                        cb_command_embed_trigger.lower() in name
-                        or cb_command_embed_trigger.lower() in value
-                    ):
-                        pretty_log(
-                            "embed",
-                            f"Matched CatchBot command trigger in embed field: {field.name}",
-                        )
-                        await handle_cb_command_embed(bot=self.bot, message=message)
-                        break
-
-                # 🔹 Check footer for ;cl command
-                if first_embed.footer and first_embed.footer.text:
-                    footer_text = first_embed.footer.text.lower()
-                    if cb_checklist_trigger.lower() in footer_text:
-                        pretty_log(
-                            "embed",
-                            f"Matched CatchBot and quest checklist trigger in embed footer: {footer_text}",
-                        )
-                        await handle_cb_checklist_message(bot=self.bot, message=message)
-                        await handle_quest_checklist_message(
-                            bot=self.bot, message=message
-                        )
+            # 🎯 Classify once, then run the matching handlers concurrently
+            await self.dispatcher.dispatch(message)
         except Exception as e:
             pretty_log(
                 "critical",
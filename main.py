@@ -15,8 +15,12 @@ from discord.ext import commands, tasks
 from dotenv import load_dotenv
 
 from utils.background_task.scheduler import setup_scheduler
-from utils.cache.centralized_cache import load_all_caches
+from utils.cache.centralized_cache import load_all_caches, refresh_caches_delta
 from utils.db.get_pg_pool import *
+from utils.db.market_value_db_func import (
+    MARKET_VALUE_FLUSH_SECONDS,
+    flush_market_value_buffer,
+)
 from utils.logs.pretty_log import pretty_log, set_mew_bot
 from utils.cache.processed_msg_ids import clear_processed_msg_ids
 # ❀───────────────────────────────❀
@@ -114,6 +118,9 @@ def pick_status_tuple():
 # ❀───────────────────────────────❀
 #      💖  Refresh All Caches 💖
 # ❀───────────────────────────────❀
+FULL_CACHE_RELOAD_EVERY = 6  # hours between full reloads; delta refresh in between
+
+
 @tasks.loop(hours=1)
 async def refresh_all_caches():
     # ❀ Skip the very first run ❀
@@ -121,12 +128,24 @@ async def refresh_all_caches():
         refresh_all_caches.has_run = True
         return
 
-    await load_all_caches(bot)
+    # ❀ Delta refresh hourly, full reload every FULL_CACHE_RELOAD_EVERY hours ❀
+    if refresh_all_caches.current_loop % FULL_CACHE_RELOAD_EVERY == 0:
+        await load_all_caches(bot)
+    else:
+        await refresh_caches_delta(bot)
 
     # Clear processed messsage ids
     clear_processed_msg_ids()
 
 
+# ❀───────────────────────────────❀
+#      💖  Flush Market Values 💖
+# ❀───────────────────────────────❀
+@tasks.loop(seconds=MARKET_VALUE_FLUSH_SECONDS)
+async def flush_market_values():
+    await flush_market_value_buffer(bot)
+
+
 # ❀───────────────────────────────❀
 #      💖  Status Rotator 💖
 # ❀───────────────────────────────❀
@@ -171,6 +190,10 @@ async def startup_tasks():
     if not refresh_all_caches.is_running():
         refresh_all_caches.start()
 
+    # ❀ Start market value write-behind flusher if not running ❀
+    if not flush_market_values.is_running():
+        flush_market_values.start()
+
     # ❀ Start status rotator if not running ❀
     await bot.change_presence(
         activity=discord.Activity(type=discord.ActivityType.playing, name="🩷 Playing with Skaia")
@@ -275,6 +298,21 @@ async def main():
             pretty_log("ready", f"Restarting Mew Bot in {retry_delay} seconds...")
             await asyncio.sleep(retry_delay)
             retry_delay = min(retry_delay * 2, 60)
+        finally:
+            # ❀ Never lose buffered DB writes on crash or shutdown ❀
+            await flush_pending_writes()
+
+
+# ❀───────────────────────────────❀
+#   💖  Flush Write-Behind Buffers 💖
+# ❀───────────────────────────────❀
+async def flush_pending_writes():
+    if not getattr(bot, "pg_pool", None):
+        return
+    try:
+        await flush_market_value_buffer(bot)
+    except Exception as e:
+        pretty_log("error", f"Failed to flush pending writes on shutdown: {e}")
 
 
 # ❀───────────────────────────────❀
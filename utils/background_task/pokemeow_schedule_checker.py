@@ -1,9 +1,11 @@
+import time
 from datetime import datetime
 
 import discord
 
 from config.aesthetic import *
-from utils.db.schedule_db_func import delete_reminder, fetch_due_reminders
+from utils.cache.schedule_cache import get_due_reminders_cached
+from utils.db.schedule_db_func import delete_reminder
 from utils.logs.pretty_log import pretty_log
 
 # ────────────────────────────────────────────
@@ -26,9 +28,10 @@ async def pokemeow_schedule_checker(bot: discord.Client):
     """
     Background task to check Pokemeow schedules every minute.
     Sends reminders to users when their scheduled time arrives.
+    Reads due schedules from the cache; delete_reminder clears both DB and cache.
     """
 
-    due_schedules = await fetch_due_reminders(bot)
+    due_schedules = get_due_reminders_cached(int(time.time()))
     if not due_schedules:
         return
 
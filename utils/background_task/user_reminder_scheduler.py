@@ -0,0 +1,166 @@
+# 🌸───────────────────────────────────────────────🌸
+#        🩷 User Reminder Scheduler 🩷
+#   Min-heap of upcoming remind_on times, loaded once
+#   at startup and kept in sync by the reminder DB
+#   functions. The driver sleeps until the next due
+#   reminder and is woken whenever one is inserted.
+# 🌸───────────────────────────────────────────────🌸
+import asyncio
+import heapq
+import itertools
+import time
+from datetime import datetime
+
+from utils.logs.pretty_log import pretty_log
+
+# Upper bound on a single sleep, so wall-clock jumps can't strand a reminder
+MAX_SLEEP_SECONDS = 300
+# Rebuild the heap once stale entries outnumber live ones by this much
+COMPACT_SLACK = 256
+
+
+def remind_on_ts(value) -> float:
+    """remind_on is stored as unix seconds, but tolerate datetimes."""
+    if isinstance(value, datetime):
+        return value.timestamp()
+    return float(value)
+
+
+class UserReminderScheduler:
+    """
+    Keeps every user reminder row in memory, keyed by
+    (user_id, user_reminder_id), plus a heap of due times.
+      - upsert() / discard() / discard_user() mirror DB writes
+      - due rows are handed to the deliver coroutine in one batch
+    """
+
+    def __init__(self):
+        self._heap: list[list] = []  # [due_ts, seq, key, live]
+        self._entries: dict[tuple[int, int], list] = {}
+        self._rows: dict[tuple[int, int], dict] = {}
+        self._seq = itertools.count()
+        self._wakeup: asyncio.Event | None = None
+        self._driver: asyncio.Task | None = None
+        self._bot = None
+        self._deliver = None
+
+    # ── Sync with DB writes ──
+    def load(self, rows):
+        """Replace the schedule with a full table snapshot."""
+        self._heap.clear()
+        self._entries.clear()
+        self._rows.clear()
+        for row in rows:
+            self.upsert(row, wake=False)
+        self._wake()
+
+    def upsert(self, row, wake: bool = True):
+        """Add or refresh one reminder row (full row, e.g. from RETURNING *)."""
+        row = dict(row)
+        key = (row["user_id"], row["user_reminder_id"])
+        self._rows[key] = row
+        self._push(key, remind_on_ts(row["remind_on"]), wake)
+
+    def retry_later(self, user_id: int, user_reminder_id: int, delay: float):
+        """Re-arm a reminder whose delivery failed, without touching its row."""
+        key = (user_id, user_reminder_id)
+        if key in self._rows and key not in self._entries:
+            self._push(key, time.time() + delay, wake=True)
+
+    def discard(self, user_id: int, user_reminder_id: int):
+        key = (user_id, user_reminder_id)
+        self._rows.pop(key, None)
+        self._cancel(key)
+
+    def discard_user(self, user_id: int):
+        for key in [k for k in self._rows if k[0] == user_id]:
+            self.discard(*key)
+
+    # ── Introspection ──
+    def pending_total(self) -> int:
+        return len(self._entries)
+
+    def next_due(self) -> float | None:
+        self._drop_stale_top()
+        return self._heap[0][0] if self._heap else None
+
+    def is_running(self) -> bool:
+        return self._driver is not None and not self._driver.done()
+
+    # ── Driver ──
+    def start(self, bot, deliver):
+        """Start the driver. deliver(bot, rows) is awaited with each due batch."""
+        self._bot = bot
+        self._deliver = deliver
+        if self._driver is None or self._driver.done():
+            self._wakeup = asyncio.Event()
+            self._driver = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self):
+        if self._driver and not self._driver.done():
+            self._driver.cancel()
+        self._driver = None
+
+    # ── Internals ──
+    def _push(self, key, due_ts: float, wake: bool):
+        self._cancel(key)
+        entry = [due_ts, next(self._seq), key, True]
+        self._entries[key] = entry
+        heapq.heappush(self._heap, entry)
+        if wake and self._heap[0] is entry:
+            self._wake()
+
+    def _cancel(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            entry[3] = False  # tombstone; skipped when it reaches the top
+            if len(self._heap) > 2 * len(self._entries) + COMPACT_SLACK:
+                self._heap = [e for e in self._heap if e[3]]
+                heapq.heapify(self._heap)
+
+    def _wake(self):
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _drop_stale_top(self):
+        while self._heap and not self._heap[0][3]:
+            heapq.heappop(self._heap)
+
+    def _pop_due(self, now: float) -> list[dict]:
+        due = []
+        self._drop_stale_top()
+        while self._heap and self._heap[0][0] <= now:
+            _, _, key, _ = heapq.heappop(self._heap)
+            del self._entries[key]
+            due.append(dict(self._rows[key]))
+            self._drop_stale_top()
+        return due
+
+    async def _run(self):
+        while True:
+            self._wakeup.clear()
+            due = self._pop_due(time.time())
+            if due:
+                try:
+                    await self._deliver(self._bot, due)
+                except Exception as e:
+                    pretty_log(
+                        tag="error",
+                        message=f"Reminder delivery batch failed: {e}",
+                        label="🩷 REMINDER SCHEDULER",
+                        include_trace=True,
+                    )
+                continue  # re-check: more may have come due meanwhile
+
+            next_due = self.next_due()
+            timeout = None
+            if next_due is not None:
+                timeout = min(MAX_SLEEP_SECONDS, max(0.0, next_due - time.time()))
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+
+# 🌐 Shared instance for the user_reminders table
+user_reminder_scheduler = UserReminderScheduler()
@@ -7,189 +7,228 @@ from discord.ui import Button, View
 
 from config.aesthetic import *
 from config.settings import Channels
+from utils.background_task.user_reminder_scheduler import (
+    remind_on_ts,
+    user_reminder_scheduler,
+)
 from utils.group_func.reminders.reminders_db_func import (
-    fetch_due_reminders,
-    remove_user_reminder,
-    update_user_reminder,
+    apply_reminder_transitions,
+    fetch_all_reminders,
 )
 from utils.logs.pretty_log import pretty_log
 from utils.visuals.design_embed import design_embed
 from utils.visuals.pretty_defer import pretty_defer, pretty_error
 
 REMINDER_CHANNEL_ID = Channels.reminders
+# Failed sends are re-armed in memory and retried after this many seconds
+RETRY_DELAY_SECONDS = 60
+# Reminders sent concurrently per chunk, and chunk size per DB commit
+SEND_CONCURRENCY = 5
+BATCH_SIZE = 50
+
+# Checkpoint: (user_id, user_reminder_id) -> remind_on already delivered,
+# cleared once that occurrence's reschedule/delete has been committed
+_delivered: dict[tuple[int, int], float] = {}
+
+
+# 🌸───────────────────────────────────────────────🌸
+# 🩷 ⏰ START USER REMINDER SCHEDULER              🩷
+# 🌸───────────────────────────────────────────────🌸
+async def start_user_reminder_scheduler(bot):
+    """Load every reminder once, then let the scheduler wake us when one is due."""
+    rows = await fetch_all_reminders(bot)
+    user_reminder_scheduler.load(rows)
+    user_reminder_scheduler.start(bot, process_due_reminders)
+    pretty_log(
+        tag="",
+        message=f"Scheduled {user_reminder_scheduler.pending_total()} user reminders",
+        label="🩷 REMINDER SCHEDULER",
+        bot=bot,
+    )
 
 
 # 🌸───────────────────────────────────────────────🌸
-# 🩷 ⏰ PROCESS DUE REMINDERS LOOP FUNCTION        🩷
+# 🩷 ⏰ PROCESS DUE REMINDERS (BATCHED)             🩷
 # 🌸───────────────────────────────────────────────🌸
-async def process_due_reminders(bot):
-    """Check due reminders and send them to the reminder channel.
-    Repeats reminders if repeat_interval is set, otherwise deletes them.
+async def process_due_reminders(bot, reminders: list[dict]):
+    """Send due reminders (handed over by the scheduler) to the reminder channel.
+    Sends run concurrently in chunks; each chunk's repeats/deletions are then
+    committed in one transaction. Already-sent reminders are checkpointed, so a
+    retried chunk only redoes the DB step instead of sending again.
     """
-    try:
-        # Add timeout protection for the entire function
-        async with asyncio.timeout(60):  # 60 second timeout
-
-            reminders = await fetch_due_reminders(bot)
-
-            if not reminders:
-                return  # nothing to process
-
-            reminder_channel = bot.get_channel(REMINDER_CHANNEL_ID)
-            if not reminder_channel:
-                pretty_log(
-                    tag="error",
-                    message=f"Reminder channel {REMINDER_CHANNEL_ID} not found",
-                )
-                return
-
-            successful_reminders = 0
-            failed_reminders = 0
-
-            for i, r in enumerate(reminders):
-                try:
-                    pretty_log(
-                        "debug",
-                        f"Processing reminder {i+1}/{len(reminders)}: ID {r.get('user_reminder_id')}",
-                    )
-
-                    # 📝 Make sure remind_on is a datetime (convert if stored as Unix int)
-                    remind_on = (
-                        datetime.fromtimestamp(r["remind_on"])
-                        if isinstance(r["remind_on"], (int, float))
-                        else r["remind_on"]
-                    )
-
-                    # Build the embed for the reminder
-                    embed = discord.Embed(
-                        title=r["title"] or "Reminder",
-                        description=r["message"],
-                        color=r["color"] or 0xFF66A3,
-                        timestamp=datetime.now(),
-                    )
-                    if r.get("image_url"):
-                        embed.set_image(url=r["image_url"])
-                    if r.get("thumbnail_url"):
-                        embed.set_thumbnail(url=r["thumbnail_url"])
-                    if r.get("footer_text"):
-                        guild_icon_url = (
-                            reminder_channel.guild.icon.url
-                            if reminder_channel.guild.icon
-                            else None
-                        )
-                        embed.set_footer(text=r["footer_text"], icon_url=guild_icon_url)
-
-                    # Prepare ping roles if any
-                    ping_text = ""
-                    if r.get("ping_role_1"):
-                        ping_text += f"<@&{r['ping_role_1']}> "
-                    if r.get("ping_role_2"):
-                        ping_text += f"<@&{r['ping_role_2']}> "
-
-                    # 📤 Send the reminder with timeout protection
-                    try:
-                        async with asyncio.timeout(
-                            10
-                        ):  # 10 second timeout for Discord send
-                            await reminder_channel.send(
-                                content=ping_text or None, embed=embed
-                            )
-                            pretty_log(
-                                "debug",
-                                f"Successfully sent reminder {r.get('user_reminder_id')}",
-                            )
-                    except asyncio.TimeoutError:
-                        pretty_log(
-                            "warn",
-                            f"Timeout sending reminder {r.get('user_reminder_id')} - Discord API slow",
-                        )
-                        failed_reminders += 1
-                        continue
-                    except discord.HTTPException as e:
-                        if e.status == 503:
-                            pretty_log(
-                                "warn",
-                                f"Discord API unavailable (503) for reminder {r.get('user_reminder_id')}",
-                            )
-                            failed_reminders += 1
-                            continue
-                        else:
-                            raise
-
-                    # 🔁 Handle repeat vs one-off with timeout protection
-                    try:
-                        async with asyncio.timeout(
-                            5
-                        ):  # 5 second timeout for DB operations
-                            if r.get("repeat_interval"):
-                                # If remind_on is datetime → convert to unix int before adding
-                                if isinstance(remind_on, datetime):
-                                    new_remind_on = int(remind_on.timestamp()) + int(
-                                        r["repeat_interval"]
-                                    )
-                                else:
-                                    # Already unix int
-                                    new_remind_on = int(remind_on) + int(
-                                        r["repeat_interval"]
-                                    )
-
-                                await update_user_reminder(
-                                    bot,
-                                    r["user_id"],
-                                    r["user_reminder_id"],
-                                    {"remind_on": new_remind_on},  # always int
-                                )
-                                pretty_log(
-                                    tag="success",
-                                    message=(
-                                        f"🔁 Repeated reminder {r['user_reminder_id']} for user {r['user_id']}, "
-                                        f"next at <t:{new_remind_on}:F>"
-                                    ),
-                                )
-                            else:
-                                await remove_user_reminder(
-                                    bot, r["user_id"], r["user_reminder_id"]
-                                )
-                                pretty_log(
-                                    tag="success",
-                                    message=(
-                                        f"🗑️ One-off reminder {r['user_reminder_id']} sent and deleted "
-                                        f"for user {r['user_id']}"
-                                    ),
-                                )
-                    except asyncio.TimeoutError:
-                        pretty_log(
-                            "warn",
-                            f"Timeout updating/removing reminder {r.get('user_reminder_id')} - database slow",
-                        )
-                        failed_reminders += 1
-                        continue
-
-                    successful_reminders += 1
-
-                except Exception as e:
-                    failed_reminders += 1
-                    pretty_log(
-                        tag="error",
-                        message=(
-                            f"Failed to send/process reminder {r.get('user_reminder_id')} "
-                            f"for user {r.get('user_id')}: {e}"
-                        ),
-                        include_trace=True,
-                    )
-                    # Continue processing other reminders instead of stopping
+    if not reminders:
+        return  # nothing to process
 
+    reminder_channel = bot.get_channel(REMINDER_CHANNEL_ID)
+    if not reminder_channel:
+        pretty_log(
+            tag="error",
+            message=f"Reminder channel {REMINDER_CHANNEL_ID} not found",
+        )
+        _retry_all(reminders)
+        return
+
+    # Discord allows ~5 messages / 5s per channel; discord.py waits out 429s
+    send_slots = asyncio.Semaphore(SEND_CONCURRENCY)
+    successful_reminders = 0
+    failed_reminders = 0
+
+    for start in range(0, len(reminders), BATCH_SIZE):
+        chunk = reminders[start : start + BATCH_SIZE]
+        try:
+            sent_flags = await asyncio.gather(
+                *(_send_reminder(reminder_channel, r, send_slots) for r in chunk)
+            )
+            delivered = [r for r, sent in zip(chunk, sent_flags) if sent]
+            failed_reminders += len(chunk) - len(delivered)
+
+            if await _commit_delivered(bot, delivered):
+                successful_reminders += len(delivered)
+            else:
+                failed_reminders += len(delivered)
+        except Exception as e:
+            failed_reminders += len(chunk)
+            _retry_all(chunk)
             pretty_log(
-                "info",
-                f"Reminder batch complete: {successful_reminders} successful, {failed_reminders} failed",
+                "error",
+                f"Critical error in reminder batch: {e}",
+                include_trace=True,
+            )
+
+    pretty_log(
+        "info",
+        f"Reminder batch complete: {successful_reminders} successful, {failed_reminders} failed",
+    )
+
+
+# 🩷 Build + send one reminder (skips the send if it was checkpointed)
+async def _send_reminder(reminder_channel, r: dict, send_slots) -> bool:
+    key = (r["user_id"], r["user_reminder_id"])
+    due_ts = remind_on_ts(r["remind_on"])
+    if _delivered.get(key) == due_ts:
+        pretty_log(
+            "debug",
+            f"Reminder {r['user_reminder_id']} already sent, resuming DB update only",
+        )
+        return True
+
+    try:
+        # Build the embed for the reminder
+        embed = discord.Embed(
+            title=r["title"] or "Reminder",
+            description=r["message"],
+            color=r["color"] or 0xFF66A3,
+            timestamp=datetime.now(),
+        )
+        if r.get("image_url"):
+            embed.set_image(url=r["image_url"])
+        if r.get("thumbnail_url"):
+            embed.set_thumbnail(url=r["thumbnail_url"])
+        if r.get("footer_text"):
+            guild_icon_url = (
+                reminder_channel.guild.icon.url if reminder_channel.guild.icon else None
             )
+            embed.set_footer(text=r["footer_text"], icon_url=guild_icon_url)
+
+        # Prepare ping roles if any
+        ping_text = ""
+        if r.get("ping_role_1"):
+            ping_text += f"<@&{r['ping_role_1']}> "
+        if r.get("ping_role_2"):
+            ping_text += f"<@&{r['ping_role_2']}> "
+
+        # 📤 Send the reminder with timeout protection
+        async with send_slots:
+            async with asyncio.timeout(10):  # 10 second timeout for Discord send
+                await reminder_channel.send(content=ping_text or None, embed=embed)
+
+        _delivered[key] = due_ts  # ✅ checkpoint before any DB work
+        pretty_log("debug", f"Successfully sent reminder {r['user_reminder_id']}")
+        return True
 
     except asyncio.TimeoutError:
         pretty_log(
-            "error",
-            "Reminder processing timed out after 60 seconds - this indicates a serious issue",
+            "warn",
+            f"Timeout sending reminder {r.get('user_reminder_id')} - Discord API slow",
         )
+    except discord.HTTPException as e:
+        if e.status == 503:
+            pretty_log(
+                "warn",
+                f"Discord API unavailable (503) for reminder {r.get('user_reminder_id')}",
+            )
+        else:
+            pretty_log(
+                tag="error",
+                message=(
+                    f"Failed to send reminder {r.get('user_reminder_id')} "
+                    f"for user {r.get('user_id')}: {e}"
+                ),
+                include_trace=True,
+            )
+    except Exception as e:
+        pretty_log(
+            tag="error",
+            message=(
+                f"Failed to send/process reminder {r.get('user_reminder_id')} "
+                f"for user {r.get('user_id')}: {e}"
+            ),
+            include_trace=True,
+        )
+    _retry(r)
+    return False
+
+
+# 🔁 Commit repeats vs one-offs for a delivered chunk in one transaction
+async def _commit_delivered(bot, delivered: list[dict]) -> bool:
+    if not delivered:
+        return True
+
+    reschedules = []
+    deletions = []
+    for r in delivered:
+        if r.get("repeat_interval"):
+            new_remind_on = int(remind_on_ts(r["remind_on"])) + int(r["repeat_interval"])
+            reschedules.append((r["user_id"], r["user_reminder_id"], new_remind_on))
+        else:
+            deletions.append((r["user_id"], r["user_reminder_id"]))
+
+    try:
+        async with asyncio.timeout(10):  # 10 second timeout for the batch commit
+            await apply_reminder_transitions(bot, reschedules, deletions)
     except Exception as e:
         pretty_log(
-            "error", f"Critical error in reminder processing: {e}", include_trace=True
+            "warn",
+            f"Failed to commit {len(delivered)} delivered reminders - will retry without resending: {e}",
+        )
+        _retry_all(delivered)
+        return False
+
+    for r in delivered:
+        _delivered.pop((r["user_id"], r["user_reminder_id"]), None)
+
+    for user_id, user_reminder_id, new_remind_on in reschedules:
+        pretty_log(
+            tag="success",
+            message=(
+                f"🔁 Repeated reminder {user_reminder_id} for user {user_id}, "
+                f"next at <t:{new_remind_on}:F>"
+            ),
         )
+    if deletions:
+        pretty_log(
+            tag="success",
+            message=f"🗑️ {len(deletions)} one-off reminder(s) sent and deleted",
+        )
+    return True
+
+
+def _retry(r: dict):
+    user_reminder_scheduler.retry_later(
+        r["user_id"], r["user_reminder_id"], RETRY_DELAY_SECONDS
+    )
+
+
+def _retry_all(reminders: list[dict]):
+    for r in reminders:
+        _retry(r)
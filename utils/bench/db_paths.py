@@ -0,0 +1,360 @@
+# 🌸──────────────────────────────────────────────
+#        🐾 DB Path Bench 🐾
+#   Runs the startup, refresh and sync paths against
+#   the in-memory pool (utils.bench.memory_pool) seeded
+#   with synthetic rows, and reports round-trips,
+#   rows moved, wall time and simulated latency.
+#   Run from the repo root:
+#       python -m utils.bench.db_paths
+#       python -m utils.bench.db_paths --users 5000 --latency-ms 2
+#       python -m utils.bench.db_paths --latency-ms 2 --sleep
+#   --sleep actually waits out the latency (so concurrent
+#   loaders overlap like they would against Postgres);
+#   without it latency is only added up.
+# 🌸──────────────────────────────────────────────
+import argparse
+import asyncio
+import sys
+import time
+from datetime import datetime, timedelta
+
+from config.settings import Channels
+from utils.bench.fakes import CallLog, FakeBot, FakeGuild, next_snowflake
+from utils.bench.memory_pool import MemoryPool
+from utils.logs.pretty_log import LEVEL_CRITICAL, set_log_level
+
+BENCH_GUILD_ID = 1
+MISSING_PER_USER = 20
+ALERTS_PER_USER = 2
+
+
+# ❀─────────────────────────────────────────❀
+#      💖 Synthetic Data
+# ❀─────────────────────────────────────────❀
+def seed_pool(pool: MemoryPool, users: int, market_rows: int, now: int):
+    """Fill every table the startup loaders read."""
+    user_ids = [100_000 + i for i in range(users)]
+    names = {uid: f"trainer{uid}" for uid in user_ids}
+    utcnow = datetime.utcnow()
+
+    pool.seed(
+        "market_value",
+        [
+            {
+                "pokemon_name": f"pokemon{i}",
+                "dex_number": i,
+                "is_exclusive": i % 50 == 0,
+                "lowest_market": 10_000 + i,
+                "current_listing": 12_000 + i,
+                "true_lowest": 9_000 + i,
+                "listing_seen": "1 hour ago",
+                "image_link": None,
+                "last_updated": utcnow - timedelta(hours=3, seconds=i),
+            }
+            for i in range(1, market_rows + 1)
+        ],
+    )
+    pool.seed(
+        "market_alerts",
+        [
+            {
+                "user_id": uid,
+                "pokemon": f"pokemon{(uid + n) % market_rows + 1}",
+                "dex_number": (uid + n) % market_rows + 1,
+                "max_price": 50_000,
+                "channel_id": 200_000 + n,
+                "role_id": None,
+                "notify": True,
+            }
+            for uid in user_ids
+            for n in range(ALERTS_PER_USER)
+        ],
+    )
+    pool.seed(
+        "missing_pokemon",
+        [
+            {
+                "user_id": uid,
+                "user_name": names[uid],
+                "dex": dex,
+                "pokemon_name": f"pokemon{dex}",
+                "role_id": None,
+                "channel_id": None,
+            }
+            for uid in user_ids
+            for dex in range(1, MISSING_PER_USER + 1)
+        ],
+    )
+    pool.seed(
+        "timers",
+        [
+            {
+                "user_id": uid,
+                "user_name": names[uid],
+                "pokemon_setting": "react",
+                "fish_setting": "on",
+                "battle_setting": "off",
+                "catchbot_setting": "on",
+                "quest_setting": "on",
+            }
+            for uid in user_ids
+        ],
+    )
+    pool.seed(
+        "pokemeow_reminders_schedule",
+        [
+            {
+                "user_id": uid,
+                "user_name": names[uid],
+                "type": type_,
+                "scheduled_on": now + 3600,
+                "channel_id": 200_000,
+            }
+            for uid in user_ids
+            for type_ in ("pokemon", "fish")
+        ],
+    )
+    pool.seed(
+        "utilities",
+        [
+            {
+                "user_id": uid,
+                "user_name": names[uid],
+                "fish_rarity": "rare",
+                "faction_ball_alert": "on",
+            }
+            for uid in user_ids
+        ],
+    )
+    pool.seed(
+        "user_info",
+        [
+            {
+                "user_id": uid,
+                "user_name": names[uid],
+                "faction": "team_rocket",
+                "patreon_tier": None,
+                "max_quests": 3,
+                "current_quest_num": 1,
+            }
+            for uid in user_ids
+        ],
+    )
+    pool.seed(
+        "battletower",
+        [
+            {"user_id": str(uid), "user_name": names[uid], "registered_at": now}
+            for uid in user_ids[::10]
+        ],
+    )
+    pool.seed(
+        "auction_reminders",
+        [
+            {
+                "ends_on": now + 7200,
+                "user_id": uid,
+                "user_name": names[uid],
+                "alarm_set": True,
+            }
+            for uid in user_ids[::10]
+        ],
+    )
+    # Every other reminder repeats (reschedule), the rest are one-offs (delete)
+    pool.seed(
+        "user_reminders",
+        [
+            {
+                "user_id": uid,
+                "user_reminder_id": 1,
+                "user_name": names[uid],
+                "message": "Claim your daily!",
+                "ping_role_1": None,
+                "ping_role_2": None,
+                "remind_on": now - 5,
+                "repeat_interval": 86_400 if uid % 2 else None,
+                "title": None,
+                "color": None,
+                "image_url": None,
+                "thumbnail_url": None,
+                "footer_text": None,
+            }
+            for uid in user_ids
+        ],
+    )
+
+
+# ❀─────────────────────────────────────────❀
+#      💖 Paths
+# ❀─────────────────────────────────────────❀
+async def _startup(bot, pool):
+    from utils.cache.centralized_cache import load_all_caches
+
+    await load_all_caches(bot)
+
+
+async def _refresh(bot, pool, changed: int):
+    from utils.cache.centralized_cache import refresh_caches_delta
+
+    # Pretend a tenth of the market moved since the last load
+    moved = datetime.utcnow()
+    for row in pool._tables["market_value"][:changed]:
+        row["last_updated"] = moved
+    await refresh_caches_delta(bot)
+
+
+async def _market_flush(bot, pool, rows: int):
+    from utils.db.market_value_db_func import (
+        flush_market_value_buffer,
+        queue_market_value,
+    )
+
+    for i in range(1, rows + 1):
+        queue_market_value(
+            bot, f"pokemon{i}", i, lowest_market=11_000, current_listing=11_500,
+            true_lowest=8_500, listing_seen="just now",
+        )
+    await flush_market_value_buffer(bot)
+
+
+async def _market_sync(bot, pool):
+    from utils.cache.cache_list import market_value_cache
+    from utils.db.market_value_db_func import sync_market_cache_to_db
+
+    await sync_market_cache_to_db(bot, market_value_cache)
+
+
+async def _missing_import(bot, pool, users: int):
+    from utils.db.missing_pokemon_db_func import bulk_upsert_missing_pokemon
+
+    # Half re-imports (conflict → update), half new dex numbers
+    entries = [
+        {
+            "user_id": 100_000 + u,
+            "user_name": f"trainer{100_000 + u}",
+            "dex": dex,
+            "pokemon_name": f"pokemon{dex}",
+            "role_id": None,
+            "channel_id": None,
+        }
+        for u in range(min(users, 50))
+        for dex in range(MISSING_PER_USER // 2, MISSING_PER_USER * 3 // 2)
+    ]
+    await bulk_upsert_missing_pokemon(bot, entries)
+
+
+async def _reminder_delivery(bot, pool):
+    from utils.background_task.user_reminders_checker import process_due_reminders
+    from utils.group_func.reminders.reminders_db_func import fetch_due_reminders
+
+    due = await fetch_due_reminders(bot)
+    await process_due_reminders(bot, [dict(r) for r in due])
+
+
+async def run_paths(
+    users: int = 1000,
+    market_rows: int = 1000,
+    latency: float = 0.0,
+    row_latency: float = 0.0,
+    sleep: bool = False,
+) -> dict[str, dict]:
+    """Seed a fresh pool, run every path once and return stats per path."""
+    pool = MemoryPool(latency=latency, row_latency=row_latency, sleep=sleep)
+    seed_pool(pool, users, market_rows, int(time.time()))
+
+    calls = CallLog()
+    bot = FakeBot(calls, pg_pool=pool)
+    guild = FakeGuild(BENCH_GUILD_ID, "DB Bench Guild", calls)
+    guild.add_channel(Channels.reminders, "reminders")
+    bot.add_guild(guild)
+    bot.user = guild.add_member(next_snowflake(), "Mew", bot=True)
+
+    paths = [
+        ("startup", lambda: _startup(bot, pool)),
+        ("refresh", lambda: _refresh(bot, pool, max(1, market_rows // 10))),
+        ("market_flush", lambda: _market_flush(bot, pool, market_rows)),
+        ("market_sync", lambda: _market_sync(bot, pool)),
+        ("missing_import", lambda: _missing_import(bot, pool, users)),
+        ("reminder_delivery", lambda: _reminder_delivery(bot, pool)),
+    ]
+
+    results = {}
+    for name, path in paths:
+        pool.stats.reset()
+        calls.reset()
+        started = time.perf_counter()
+        await path()
+        wall = time.perf_counter() - started
+        results[name] = {
+            **pool.stats.snapshot(),
+            "wall_ms": wall * 1000,
+            "side_effects": dict(calls.counts),
+        }
+    return results
+
+
+# ❀─────────────────────────────────────────❀
+#      💖 Report
+# ❀─────────────────────────────────────────❀
+def print_report(results: dict[str, dict], verbose: bool = False):
+    width = max([len("path")] + [len(name) for name in results])
+    print(
+        f"{'path'.ljust(width)}  {'trips':>6}  {'rows':>8}  "
+        f"{'wall ms':>9}  {'sim ms':>9}"
+    )
+    for name, r in results.items():
+        print(
+            f"{name.ljust(width)}  {r['round_trips']:6d}  {r['rows']:8d}  "
+            f"{r['wall_ms']:9.1f}  {r['simulated_ms']:9.1f}"
+        )
+
+    if verbose:
+        for name, r in results.items():
+            print(f"\n{name}:")
+            for statement, count in sorted(r["statements"].items()):
+                print(f"  {statement}: {count}")
+            for kind, count in sorted(r["side_effects"].items()):
+                print(f"  [{kind}]: {count}")
+
+    unsupported = {q for r in results.values() for q in r["unsupported"]}
+    for query in sorted(unsupported):
+        print(f"❌ unsupported: {query}")
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Count round-trips on the startup / refresh / sync DB paths."
+    )
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--market", type=int, default=1000, help="market_value rows")
+    parser.add_argument(
+        "--latency-ms", type=float, default=0.0, help="simulated ms per round-trip"
+    )
+    parser.add_argument(
+        "--row-latency-us", type=float, default=0.0, help="simulated µs per row"
+    )
+    parser.add_argument(
+        "--sleep", action="store_true", help="actually wait out simulated latency"
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="per-statement counts and logs"
+    )
+    args = parser.parse_args(argv)
+
+    if not args.verbose:
+        set_log_level(LEVEL_CRITICAL + 1)
+
+    results = asyncio.run(
+        run_paths(
+            users=args.users,
+            market_rows=args.market,
+            latency=args.latency_ms / 1000,
+            row_latency=args.row_latency_us / 1_000_000,
+            sleep=args.sleep,
+        )
+    )
+    print_report(results, verbose=args.verbose)
+    return 1 if any(r["unsupported"] for r in results.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,336 @@
+# 🌸──────────────────────────────────────────────
+#        🐾 Offline Discord / DB Fakes 🐾
+#   Just enough of discord.Message / Member / Guild /
+#   channel / Bot and bot.pg_pool for the listeners to
+#   run without a gateway or Postgres connection.
+#   Every outbound call (send, reply, react, query) is
+#   recorded instead of performed.
+# 🌸──────────────────────────────────────────────
+import asyncio
+import itertools
+import time
+from collections import Counter
+from datetime import datetime, timezone
+
+import discord
+from discord.utils import time_snowflake
+
+# Monotonic fake snowflakes (current time, so created_at looks sane)
+_snowflakes = itertools.count(time_snowflake(datetime.now(timezone.utc)))
+
+
+def next_snowflake() -> int:
+    return next(_snowflakes)
+
+
+# ❀─────────────────────────────────────────❀
+#      💖 Outbound Call Log
+# ❀─────────────────────────────────────────❀
+class CallLog:
+    """Counts every side effect a handler attempted (send, reply, query...)."""
+
+    def __init__(self):
+        self.counts: Counter[str] = Counter()
+
+    def record(self, kind: str):
+        self.counts[kind] += 1
+
+    def reset(self):
+        self.counts.clear()
+
+
+# ❀─────────────────────────────────────────❀
+#      💖 Members
+# ❀─────────────────────────────────────────❀
+class FakeMember(discord.Member):
+    """discord.Member stand-in (isinstance checks pass, no gateway state)."""
+
+    # Plain class attributes shadow Member's read-only properties
+    id = name = display_name = global_name = mention = bot = None
+    display_avatar = avatar = roles = None
+
+    def __init__(self, guild, member_id: int, name: str, *, bot: bool = False):
+        self.guild = guild
+        self.id = member_id
+        self.name = name
+        self.display_name = name
+        self.global_name = name
+        self.mention = f"<@{member_id}>"
+        self.bot = bot
+        self.nick = None
+        self.roles = []
+        self.display_avatar = self.avatar = None
+
+    def __str__(self):
+        return self.name
+
+    def __repr__(self):
+        return f"<FakeMember id={self.id} name={self.name!r}>"
+
+    async def send(self, *args, **kwargs):
+        self.guild.calls.record("member.send")
+
+    async def add_roles(self, *args, **kwargs):
+        self.guild.calls.record("member.add_roles")
+
+    async def remove_roles(self, *args, **kwargs):
+        self.guild.calls.record("member.remove_roles")
+
+
+# ❀─────────────────────────────────────────❀
+#      💖 Channels / Guild
+# ❀─────────────────────────────────────────❀
+class FakeChannel:
+    def __init__(self, guild, channel_id: int, name: str, category_id: int = None):
+        self.guild = guild
+        self.id = channel_id
+        self.name = name
+        self.category_id = category_id
+        self.mention = f"<#{channel_id}>"
+        self.jump_url = f"https://discord.com/channels/{guild.id}/{channel_id}"
+
+    async def send(self, *args, **kwargs):
+        self.guild.calls.record("channel.send")
+        return None
+
+    async def fetch_message(self, message_id: int):
+        self.guild.calls.record("channel.fetch_message")
+        raise discord.NotFound(_FakeResponse(404), "Unknown Message")
+
+    async def history(self, *args, **kwargs):
+        self.guild.calls.record("channel.history")
+        return
+        yield  # async generator with no items
+
+
+class _FakeResponse:
+    """Minimal aiohttp-like response for discord.HTTPException subclasses."""
+
+    def __init__(self, status: int):
+        self.status = status
+        self.reason = "Fake"
+
+
+class FakeRole:
+    def __init__(self, role_id: int):
+        self.id = role_id
+        self.name = f"role-{role_id}"
+        self.mention = f"<@&{role_id}>"
+
+
+class FakeGuild:
+    def __init__(self, guild_id: int, name: str, calls: CallLog):
+        self.id = guild_id
+        self.name = name
+        self.calls = calls
+        self.icon = None
+        self.members: list[FakeMember] = []
+        self.channels: dict[int, FakeChannel] = {}
+        self._members_by_id: dict[int, FakeMember] = {}
+        self.me = None
+
+    def add_member(self, member_id: int, name: str, *, bot: bool = False):
+        member = FakeMember(self, member_id, name, bot=bot)
+        self.members.append(member)
+        self._members_by_id[member_id] = member
+        return member
+
+    def add_channel(self, channel_id: int, name: str, category_id: int = None):
+        channel = FakeChannel(self, channel_id, name, category_id)
+        self.channels[channel_id] = channel
+        return channel
+
+    def get_member(self, member_id: int):
+        return self._members_by_id.get(member_id)
+
+    def get_channel(self, channel_id: int):
+        return self.channels.get(channel_id)
+
+    def get_role(self, role_id: int):
+        return FakeRole(role_id)
+
+    async def fetch_role(self, role_id: int):
+        self.calls.record("guild.fetch_role")
+        return FakeRole(role_id)
+
+    async def leave(self):
+        self.calls.record("guild.leave")
+
+
+# ❀─────────────────────────────────────────❀
+#      💖 Messages
+# ❀─────────────────────────────────────────❀
+class FakeReference:
+    def __init__(self, resolved):
+        self.resolved = resolved
+        self.message_id = resolved.id if resolved else None
+
+
+class FakeMessage(discord.Message):
+    """discord.Message stand-in built from plain text + embed dicts."""
+
+    # Plain class attributes shadow Message's read-only properties
+    guild = channel = id = jump_url = created_at = None
+
+    def __init__(
+        self,
+        *,
+        channel: FakeChannel,
+        author,
+        content: str = "",
+        embeds: list[discord.Embed] = (),
+        reference=None,
+        webhook_id: int = None,
+        message_id: int = None,
+    ):
+        self.id = message_id or next_snowflake()
+        self.channel = channel
+        self.guild = channel.guild
+        self.author = author
+        self.content = content or ""
+        self.embeds = list(embeds)
+        self.reference = reference
+        self.webhook_id = webhook_id
+        self.attachments = []
+        self.mentions = []
+        self.created_at = discord.utils.snowflake_time(self.id)
+        self.jump_url = f"{channel.jump_url}/{self.id}"
+        self.interaction_metadata = None
+
+    def __repr__(self):
+        return f"<FakeMessage id={self.id} channel={self.channel.name!r}>"
+
+    async def reply(self, *args, **kwargs):
+        self.guild.calls.record("message.reply")
+
+    async def add_reaction(self, *args, **kwargs):
+        self.guild.calls.record("message.add_reaction")
+
+    async def edit(self, *args, **kwargs):
+        self.guild.calls.record("message.edit")
+
+    async def delete(self, *args, **kwargs):
+        self.guild.calls.record("message.delete")
+
+
+# ❀─────────────────────────────────────────❀
+#      💖 Recording Pool (bot.pg_pool stand-in)
+# ❀─────────────────────────────────────────❀
+class RecordingConnection:
+    """Accepts every query and answers with an empty result."""
+
+    def __init__(self, calls: CallLog):
+        self.calls = calls
+
+    def _record(self, method: str, query: str):
+        verb = query.lstrip().split(None, 1)[0].upper() if query.strip() else "?"
+        self.calls.record(f"db.{method}")
+        self.calls.record(f"db.{verb}")
+
+    async def fetch(self, query, *args, **kwargs):
+        self._record("fetch", query)
+        return []
+
+    async def fetchrow(self, query, *args, **kwargs):
+        self._record("fetchrow", query)
+        return None
+
+    async def fetchval(self, query, *args, **kwargs):
+        self._record("fetchval", query)
+        return None
+
+    async def execute(self, query, *args, **kwargs):
+        self._record("execute", query)
+        return "OK 0"
+
+    async def executemany(self, query, args, **kwargs):
+        self._record("executemany", query)
+
+    async def copy_records_to_table(self, table_name, *, records, **kwargs):
+        self.calls.record("db.copy_records_to_table")
+        return f"COPY {len(records)}"
+
+    def transaction(self):
+        return _NullTransaction()
+
+
+class _NullTransaction:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class RecordingPool:
+    """bot.pg_pool stand-in: acquire() yields a RecordingConnection."""
+
+    def __init__(self, calls: CallLog):
+        self.calls = calls
+
+    def acquire(self):
+        return _Acquire(RecordingConnection(self.calls))
+
+    async def close(self):
+        pass
+
+
+class _Acquire:
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def __aenter__(self):
+        return self.conn
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+# ❀─────────────────────────────────────────❀
+#      💖 Bot
+# ❀─────────────────────────────────────────❀
+class FakeBot:
+    """The slice of commands.Bot the listeners touch."""
+
+    def __init__(self, calls: CallLog, pg_pool=None):
+        self.calls = calls
+        self.pg_pool = pg_pool or RecordingPool(calls)
+        self.guilds: list[FakeGuild] = []
+        self.user = None
+        self.started_at = time.time()
+
+    @property
+    def loop(self):
+        return asyncio.get_running_loop()
+
+    def add_guild(self, guild: FakeGuild):
+        self.guilds.append(guild)
+
+    def get_guild(self, guild_id: int):
+        return next((g for g in self.guilds if g.id == guild_id), None)
+
+    def get_channel(self, channel_id: int):
+        for guild in self.guilds:
+            channel = guild.get_channel(channel_id)
+            if channel:
+                return channel
+        return None
+
+    async def fetch_channel(self, channel_id: int):
+        self.calls.record("bot.fetch_channel")
+        channel = self.get_channel(channel_id)
+        if channel is None:
+            raise discord.NotFound(_FakeResponse(404), "Unknown Channel")
+        return channel
+
+    def get_user(self, user_id: int):
+        for guild in self.guilds:
+            member = guild.get_member(user_id)
+            if member:
+                return member
+        return None
+
+    async def wait_for(self, event: str, *, check=None, timeout=None):
+        # Recorded follow-ups never arrive; fail fast like an expired wait
+        self.calls.record(f"bot.wait_for.{event}")
+        raise asyncio.TimeoutError
@@ -0,0 +1,314 @@
+# 🌸──────────────────────────────────────────────
+#        🐾 Listener Replay Bench 🐾
+#   Feeds recorded PokéMeow messages through
+#   MessageCreateListener.on_message and
+#   MessageEditListener.on_message_edit with fake
+#   Discord objects and a recording bot.pg_pool.
+#   Run from the repo root:
+#       python -m utils.bench.listener_replay
+#       python -m utils.bench.listener_replay --iterations 500 --members 2000
+#       python -m utils.bench.listener_replay --corpus dump.json
+#       python -m utils.bench.listener_replay --pool memory
+#   Reports messages/sec, p50/p99 per scenario and
+#   per dispatcher handler, and memory allocated per
+#   message (tracemalloc).
+# 🌸──────────────────────────────────────────────
+import argparse
+import asyncio
+import json
+import sys
+import time
+import tracemalloc
+
+import discord
+
+from config.settings import Categories, MAIN_SERVER_ID, POKEMEOW_APPLICATION_ID
+from utils.bench.fakes import (
+    CallLog,
+    FakeBot,
+    FakeGuild,
+    FakeMessage,
+    FakeReference,
+    next_snowflake,
+)
+from utils.bench.replay_corpus import RECORDED_MESSAGES, TRAINER_NAME
+from utils.cache.cache_list import timer_cache
+from utils.cache.member_name_cache import index_guild
+from utils.bench.memory_pool import MemoryPool
+from utils.essentials.trigger_dispatch import HandlerStats
+from utils.logs.pretty_log import LEVEL_CRITICAL, set_log_level
+
+TRAINER_ID = 100000000000000001
+# Timer settings seeded for the trainer so the timer paths run end to end
+TRAINER_TIMER_SETTINGS = {
+    "user_name": TRAINER_NAME,
+    "pokemon_setting": "react",
+    "fish_setting": "on",
+    "battle_setting": "on",
+    "catchbot_setting": "on",
+    "quest_setting": "on",
+}
+
+
+# ❀─────────────────────────────────────────❀
+#      💖 Fake World
+# ❀─────────────────────────────────────────❀
+class ReplayWorld:
+    """One fake guild with PokéMeow, the trainer, filler members and channels."""
+
+    def __init__(self, members: int = 500, pg_pool=None):
+        self.calls = CallLog()
+        self.bot = FakeBot(self.calls, pg_pool=pg_pool)
+        self.guild = FakeGuild(MAIN_SERVER_ID, "Replay Guild", self.calls)
+        self.bot.add_guild(self.guild)
+
+        self.pokemeow = self.guild.add_member(
+            POKEMEOW_APPLICATION_ID, "PokéMeow", bot=True
+        )
+        self.bot.user = self.guild.add_member(next_snowflake(), "Mew", bot=True)
+        self.guild.me = self.bot.user
+        self.trainer = self.guild.add_member(TRAINER_ID, TRAINER_NAME)
+        for i in range(members):
+            self.guild.add_member(next_snowflake(), f"trainer{i}")
+
+        self.channels = {
+            "spawns": self.guild.add_channel(next_snowflake(), "spawns"),
+            "market_feed": self.guild.add_channel(
+                next_snowflake(), "market-feed", category_id=Categories.Market_Feed
+            ),
+        }
+        index_guild(self.guild)
+        timer_cache[TRAINER_ID] = dict(TRAINER_TIMER_SETTINGS)
+
+    def build_message(self, entry: dict, part: dict = None) -> FakeMessage:
+        """Fresh FakeMessage (new snowflake) from a corpus entry."""
+        part = entry if part is None else part
+        channel = self.channels[entry.get("channel", "spawns")]
+        author = {
+            "pokemeow": self.pokemeow,
+            "trainer": self.trainer,
+            "webhook": self.pokemeow,
+        }[entry.get("author", "pokemeow")]
+
+        reference = None
+        if entry.get("reply"):
+            command = FakeMessage(channel=channel, author=self.trainer, content=";p")
+            reference = FakeReference(command)
+
+        return FakeMessage(
+            channel=channel,
+            author=author,
+            content=part.get("content", ""),
+            embeds=[discord.Embed.from_dict(e) for e in part.get("embeds", [])],
+            reference=reference,
+            webhook_id=entry.get("webhook_id"),
+        )
+
+
+def load_corpus(path: str = None) -> list[dict]:
+    """Built-in corpus, or a JSON list of entries in the same shape."""
+    if not path:
+        return RECORDED_MESSAGES
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+# ❀─────────────────────────────────────────❀
+#      💖 Replay
+# ❀─────────────────────────────────────────❀
+def _build_batch(world: ReplayWorld, corpus: list[dict], iterations: int) -> list:
+    """Pre-build every (entry, before, after) so timing excludes construction."""
+    batch = []
+    for _ in range(iterations):
+        for entry in corpus:
+            after = world.build_message(entry)
+            before = None
+            if entry.get("event") == "edit":
+                before = world.build_message(entry, entry.get("before", {}))
+                before.id = after.id
+            batch.append((entry, before, after))
+    return batch
+
+
+async def _deliver(create_cog, edit_cog, entry: dict, before, after):
+    if entry.get("event") == "edit":
+        await edit_cog.on_message_edit(before, after)
+    else:
+        await create_cog.on_message(after)
+
+
+async def replay(
+    corpus: list[dict],
+    iterations: int = 200,
+    members: int = 500,
+    measure_allocations: bool = True,
+    pg_pool=None,
+) -> dict:
+    """Replay the corpus and return throughput, latency and allocation stats."""
+    # Cogs pull in every listener module; only import them when replaying
+    from cogs.events.message_create_listener import MessageCreateListener
+    from cogs.events.message_edit_listener import MessageEditListener
+
+    world = ReplayWorld(members=members, pg_pool=pg_pool)
+    create_cog = MessageCreateListener(world.bot)
+    edit_cog = MessageEditListener(world.bot)
+
+    # 🔥 Warm-up: first-call imports, caches and regex state
+    for entry, before, after in _build_batch(world, corpus, 1):
+        await _deliver(create_cog, edit_cog, entry, before, after)
+
+    # Fresh stats sized to hold every timed sample
+    samples = iterations * len(corpus)
+    create_cog.dispatcher.stats = {
+        t.name: HandlerStats(window=samples) for t in create_cog.dispatcher.triggers
+    }
+    scenario_stats: dict[str, HandlerStats] = {}
+    world.calls.reset()
+    db_stats = getattr(pg_pool, "stats", None)  # MemoryPool query accounting
+    if db_stats is not None:
+        db_stats.reset()
+
+    # ⏱ Timed pass
+    batch = _build_batch(world, corpus, iterations)
+    started = time.perf_counter()
+    for entry, before, after in batch:
+        stats = scenario_stats.get(entry["name"])
+        if stats is None:
+            stats = scenario_stats[entry["name"]] = HandlerStats(window=samples)
+        t0 = time.perf_counter()
+        await _deliver(create_cog, edit_cog, entry, before, after)
+        stats.record(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - started
+    side_effects = dict(world.calls.counts)
+    db = db_stats.snapshot() if db_stats is not None else None
+
+    # 🧠 Allocation pass (separate, tracemalloc slows everything down)
+    allocations: dict[str, tuple[int, int]] = {}
+    if measure_allocations:
+        batch = _build_batch(world, corpus, 1)
+        tracemalloc.start()
+        try:
+            for entry, before, after in batch:
+                tracemalloc.reset_peak()
+                base = tracemalloc.get_traced_memory()[0]
+                await _deliver(create_cog, edit_cog, entry, before, after)
+                current, peak = tracemalloc.get_traced_memory()
+                allocations[entry["name"]] = (peak - base, current - base)
+        finally:
+            tracemalloc.stop()
+
+    scenarios = {}
+    for name, stats in scenario_stats.items():
+        peak, retained = allocations.get(name, (None, None))
+        scenarios[name] = {
+            **stats.summary(),
+            "alloc_peak_bytes": peak,
+            "alloc_retained_bytes": retained,
+        }
+
+    return {
+        "messages": samples,
+        "seconds": elapsed,
+        "messages_per_second": samples / elapsed if elapsed else 0.0,
+        "scenarios": scenarios,
+        "handlers": create_cog.dispatcher.stats_summary(),
+        "side_effects": side_effects,
+        "db": db,
+    }
+
+
+# ❀─────────────────────────────────────────❀
+#      💖 Report
+# ❀─────────────────────────────────────────❀
+def print_report(result: dict):
+    print(
+        f"{result['messages']} messages in {result['seconds']:.3f}s → "
+        f"{result['messages_per_second']:,.0f} msg/s"
+    )
+
+    rows = result["scenarios"]
+    width = max([len("scenario")] + [len(name) for name in rows])
+    print(
+        f"\n{'scenario'.ljust(width)}  {'p50 ms':>8}  {'p99 ms':>8}  "
+        f"{'alloc KiB':>9}  {'kept B':>7}"
+    )
+    for name, s in rows.items():
+        if s["alloc_peak_bytes"] is None:
+            alloc = f"{'-':>9}  {'-':>7}"
+        else:
+            alloc = (
+                f"{s['alloc_peak_bytes'] / 1024:9.1f}  {s['alloc_retained_bytes']:7d}"
+            )
+        print(
+            f"{name.ljust(width)}  {s['p50_ms']:8.3f}  {s['p99_ms']:8.3f}  {alloc}"
+        )
+
+    handlers = result["handlers"]
+    if handlers:
+        width = max([len("handler")] + [len(name) for name in handlers])
+        print(
+            f"\n{'handler'.ljust(width)}  {'calls':>6}  {'errors':>6}  "
+            f"{'p50 ms':>8}  {'p99 ms':>8}"
+        )
+        for name, s in sorted(handlers.items(), key=lambda kv: -kv[1]["p99_ms"]):
+            print(
+                f"{name.ljust(width)}  {s['calls']:6d}  {s['errors']:6d}  "
+                f"{s['p50_ms']:8.3f}  {s['p99_ms']:8.3f}"
+            )
+
+    if result["side_effects"]:
+        print("\nside effects (timed pass):")
+        for kind, count in sorted(result["side_effects"].items()):
+            print(f"  {kind}: {count}")
+
+    db = result.get("db")
+    if db:
+        print(
+            f"\ndb (timed pass): {db['round_trips']} round-trips, "
+            f"{db['round_trips'] / result['messages']:.2f} per message"
+        )
+        for statement, count in sorted(db["statements"].items()):
+            print(f"  {statement}: {count}")
+        for query in db["unsupported"]:
+            print(f"  ❌ unsupported: {query}")
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Replay recorded PokéMeow messages through the listeners."
+    )
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--members", type=int, default=500)
+    parser.add_argument("--corpus", help="JSON list of recorded messages")
+    parser.add_argument(
+        "--no-alloc", action="store_true", help="skip the tracemalloc pass"
+    )
+    parser.add_argument(
+        "--verbose", action="store_true", help="keep pretty_log output on"
+    )
+    parser.add_argument(
+        "--pool",
+        choices=("recording", "memory"),
+        default="recording",
+        help="bot.pg_pool stand-in (memory runs the SQL against utils.bench.memory_pool)",
+    )
+    args = parser.parse_args(argv)
+
+    if not args.verbose:
+        set_log_level(LEVEL_CRITICAL + 1)
+
+    result = asyncio.run(
+        replay(
+            load_corpus(args.corpus),
+            iterations=args.iterations,
+            members=args.members,
+            measure_allocations=not args.no_alloc,
+            pg_pool=MemoryPool(strict=False) if args.pool == "memory" else None,
+        )
+    )
+    print_report(result)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1668 @@
+# 🟣────────────────────────────────────────────
+#        In-Memory pg_pool Backend (tests / benches)
+# 🟣────────────────────────────────────────────
+# Drop-in stand-in for SafePool: acquire() yields a connection with
+# fetch / fetchrow / fetchval / execute / executemany /
+# copy_records_to_table / transaction, backed by plain dicts.
+#
+# It understands the SQL subset the bot actually sends (SELECT with
+# WHERE / ORDER BY / LIMIT / aggregates, INSERT VALUES / SELECT with
+# ON CONFLICT and RETURNING, UPDATE ... FROM unnest, DELETE ... USING
+# unnest, CREATE [TEMP] TABLE, TRUNCATE, DROP TABLE) and counts every
+# round-trip, so tests can assert "this path is N queries" and benches
+# can add simulated network latency per round-trip / per row.
+#
+#   pool = MemoryPool(latency=0.002)        # 2 ms per round-trip
+#   pool.seed("timers", [{"user_id": 1, "pokemon_setting": "on"}])
+#   bot.pg_pool = pool
+#   ...
+#   pool.stats.round_trips, pool.stats.statements, pool.stats.snapshot()
+#
+# Never wired into get_pg_pool(): benches and tests inject it themselves.
+import asyncio
+import re
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import zip_longest
+
+import asyncpg
+
+from utils.logs.pretty_log import pretty_log
+
+# Production id columns that are SERIAL (filled in when an INSERT omits them)
+SERIAL_COLUMNS = {
+    "pokemeow_reminders_schedule": "reminder_id",
+    "user_reminders": "reminder_id",
+}
+
+
+class MemoryPoolError(Exception):
+    """SQL the in-memory backend does not understand, or a misused query."""
+
+
+# --------------------
+#  Records
+# --------------------
+class MemoryRecord(dict):
+    """asyncpg.Record look-alike: lookup by column name or position."""
+
+    def __getitem__(self, key):
+        if isinstance(key, int):
+            return list(self.values())[key]
+        return dict.__getitem__(self, key)
+
+
+# --------------------
+#  Tokenizer
+# --------------------
+_TOKEN_PATTERN = re.compile(
+    r"""
+      (?P<ws>\s+|--[^\n]*)
+    | (?P<str>'(?:[^']|'')*')
+    | (?P<num>\d+(?:\.\d+)?)
+    | (?P<param>\$\d+)
+    | (?P<qname>"[^"]+")
+    | (?P<name>[A-Za-z_][A-Za-z0-9_]*)
+    | (?P<op>::|<=|>=|<>|!=|\|\||[=<>+\-*/%(),.;\[\]])
+    """,
+    re.VERBOSE,
+)
+
+# Words that end an expression / select item instead of naming a column
+_RESERVED = {
+    "AND", "AS", "ASC", "BY", "CROSS", "DESC", "DO", "FROM", "FULL", "GROUP",
+    "HAVING", "ILIKE", "IN", "INNER", "IS", "JOIN", "LEFT", "LIKE", "LIMIT",
+    "NOT", "NULLS", "OFFSET", "ON", "OR", "ORDER", "RETURNING", "RIGHT",
+    "SELECT", "SET", "USING", "VALUES", "WHERE", "WITH",
+}
+
+
+def _tokenize(sql: str) -> list[tuple[str, str]]:
+    tokens = []
+    pos = 0
+    while pos < len(sql):
+        match = _TOKEN_PATTERN.match(sql, pos)
+        if not match:
+            raise MemoryPoolError(f"Cannot tokenize SQL near {sql[pos:pos + 20]!r}")
+        pos = match.end()
+        kind = match.lastgroup
+        if kind != "ws":
+            tokens.append((kind, match.group()))
+    return tokens
+
+
+def _split_statements(tokens: list) -> list[list]:
+    """Split on top-level ';' (execute() without args may run a script)."""
+    statements, current, depth = [], [], 0
+    for token in tokens:
+        if token == ("op", "("):
+            depth += 1
+        elif token == ("op", ")"):
+            depth -= 1
+        if token == ("op", ";") and depth == 0:
+            if current:
+                statements.append(current)
+            current = []
+        else:
+            current.append(token)
+    if current:
+        statements.append(current)
+    return statements
+
+
+# --------------------
+#  Value helpers (SQL NULL semantics)
+# --------------------
+def _align(a, b):
+    """Let naive (timestamp) and aware (timestamptz) datetimes compare."""
+    if isinstance(a, datetime) and isinstance(b, datetime):
+        if a.tzinfo is None and b.tzinfo is not None:
+            a = a.replace(tzinfo=timezone.utc)
+        elif b.tzinfo is None and a.tzinfo is not None:
+            b = b.replace(tzinfo=timezone.utc)
+    return a, b
+
+
+def _compare(op: str, a, b):
+    if a is None or b is None:
+        return None
+    a, b = _align(a, b)
+    if op == "=":
+        return a == b
+    if op in ("<>", "!="):
+        return a != b
+    if op == "<":
+        return a < b
+    if op == "<=":
+        return a <= b
+    if op == ">":
+        return a > b
+    return a >= b
+
+
+def _arith(op: str, a, b):
+    if a is None or b is None:
+        return None
+    if op == "+":
+        return a + b
+    if op == "-":
+        return a - b
+    if op == "*":
+        return a * b
+    if op == "/":
+        if isinstance(a, int) and isinstance(b, int):
+            return int(a / b)  # integer division truncates toward zero
+        return a / b
+    if op == "%":
+        return a % b
+    return f"{a}{b}"  # ||
+
+
+def _cast(value, type_name: str, is_array: bool):
+    if value is None or is_array:
+        return value
+    if type_name in ("int", "int2", "int4", "int8", "integer", "bigint", "smallint"):
+        return int(value)
+    if type_name in ("text", "varchar", "char"):
+        return str(value)
+    if type_name in ("bool", "boolean"):
+        return bool(value)
+    if type_name in ("float", "float4", "float8", "real", "numeric", "double"):
+        return float(value)
+    if type_name == "timestamp" and isinstance(value, datetime) and value.tzinfo:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    if type_name == "timestamptz" and isinstance(value, datetime) and not value.tzinfo:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+_INTERVAL_UNITS = {
+    "second": "seconds",
+    "minute": "minutes",
+    "hour": "hours",
+    "day": "days",
+    "week": "weeks",
+}
+
+
+def _interval(text: str) -> timedelta:
+    parts = text.split()
+    if len(parts) != 2:
+        raise MemoryPoolError(f"Unsupported INTERVAL {text!r}")
+    unit = parts[1].lower().rstrip("s")
+    if unit not in _INTERVAL_UNITS:
+        raise MemoryPoolError(f"Unsupported INTERVAL unit {parts[1]!r}")
+    return timedelta(**{_INTERVAL_UNITS[unit]: float(parts[0])})
+
+
+def _like(pattern: str, flags=0):
+    regex = "".join(
+        ".*" if ch == "%" else "." if ch == "_" else re.escape(ch) for ch in pattern
+    )
+    return re.compile(regex, flags | re.DOTALL)
+
+
+# --------------------
+#  Evaluation environment
+# --------------------
+class _Source:
+    """One FROM item bound to its current row."""
+
+    __slots__ = ("alias", "table", "row", "columns")
+
+    def __init__(self, alias, table, row, columns=None):
+        self.alias = alias
+        self.table = table
+        self.row = row
+        self.columns = columns  # declared column set, None = schemaless
+
+
+class _Env:
+    __slots__ = ("params", "sources", "group", "now")
+
+    def __init__(self, params, sources=(), group=None, now=None):
+        self.params = params
+        self.sources = sources
+        self.group = group
+        self.now = now
+
+    def lookup(self, qualifier, name):
+        for source in self.sources:
+            if qualifier is None or qualifier in (source.alias, source.table):
+                if name in source.row:
+                    return source.row[name]
+
+        # Not in any bound row: NULL if the column may exist, else an error
+        matched = [
+            s for s in self.sources if qualifier is None or qualifier in (s.alias, s.table)
+        ]
+        if qualifier is not None and not matched:
+            raise MemoryPoolError(f'missing FROM-clause entry for table "{qualifier}"')
+        if any(s.columns is None or name in s.columns for s in matched):
+            return None
+        raise asyncpg.exceptions.UndefinedColumnError(f'column "{name}" does not exist')
+
+    def with_sources(self, sources):
+        return _Env(self.params, sources, None, self.now)
+
+
+class _Expr:
+    __slots__ = ("fn", "name", "aggregate", "ref", "equalities")
+
+    def __init__(self, fn, name="?column?", aggregate=False):
+        self.fn = fn
+        self.name = name
+        self.aggregate = aggregate
+        self.ref = None  # (qualifier, column) for plain column references
+        self.equalities = ()  # ANDed "ref = ref" pairs, used as hash-join keys
+
+
+def _aggregate(name, arg, star=False):
+    def fn(env):
+        rows = env.group or []
+        if star:
+            return len(rows)
+        values = [arg.fn(env.with_sources(sources)) for sources in rows]
+        values = [v for v in values if v is not None]
+        if name == "COUNT":
+            return len(values)
+        if not values:
+            return None
+        if name == "MAX":
+            return max(values)
+        if name == "MIN":
+            return min(values)
+        return sum(values)
+
+    return _Expr(fn, name.lower(), aggregate=True)
+
+
+# --------------------
+#  Parser
+# --------------------
+class _Parser:
+    def __init__(self, tokens: list):
+        self.tokens = tokens
+        self.pos = 0
+        self.max_param = 0
+
+    # 🍬 token helpers
+    def peek(self, offset: int = 0):
+        index = self.pos + offset
+        return self.tokens[index] if index < len(self.tokens) else ("eof", "")
+
+    def next(self):
+        token = self.peek()
+        self.pos += 1
+        return token
+
+    def at(self, *words) -> bool:
+        for offset, word in enumerate(words):
+            kind, value = self.peek(offset)
+            if kind != "name" or value.upper() != word:
+                return False
+        return True
+
+    def accept(self, *words) -> bool:
+        if self.at(*words):
+            self.pos += len(words)
+            return True
+        return False
+
+    def expect(self, *words):
+        if not self.accept(*words):
+            self.fail(f"expected {' '.join(words)}")
+
+    def at_op(self, op: str) -> bool:
+        return self.peek() == ("op", op)
+
+    def accept_op(self, op: str) -> bool:
+        if self.at_op(op):
+            self.pos += 1
+            return True
+        return False
+
+    def expect_op(self, op: str):
+        if not self.accept_op(op):
+            self.fail(f"expected {op!r}")
+
+    def ident(self) -> str:
+        kind, value = self.next()
+        if kind == "name":
+            return value.lower()
+        if kind == "qname":
+            return value[1:-1]
+        self.pos -= 1
+        self.fail("expected an identifier")
+
+    def ident_list(self) -> list[str]:
+        self.expect_op("(")
+        names = [self.ident()]
+        while self.accept_op(","):
+            names.append(self.ident())
+        self.expect_op(")")
+        return names
+
+    def skip_parens(self):
+        self.expect_op("(")
+        depth = 1
+        while depth:
+            kind, value = self.next()
+            if kind == "eof":
+                self.fail("unbalanced parentheses")
+            if (kind, value) == ("op", "("):
+                depth += 1
+            elif (kind, value) == ("op", ")"):
+                depth -= 1
+
+    def done(self) -> bool:
+        return self.pos >= len(self.tokens)
+
+    def fail(self, reason: str):
+        near = " ".join(value for _, value in self.tokens[self.pos : self.pos + 6])
+        raise MemoryPoolError(f"Unsupported SQL ({reason}) near {near!r}")
+
+    # 🍬 expressions
+    def expr(self) -> _Expr:
+        left = self.and_expr()
+        while self.accept("OR"):
+            left = self._logical(left, self.and_expr(), is_and=False)
+        return left
+
+    def and_expr(self) -> _Expr:
+        left = self.not_expr()
+        while self.accept("AND"):
+            left = self._logical(left, self.not_expr(), is_and=True)
+        return left
+
+    @staticmethod
+    def _logical(left: _Expr, right: _Expr, is_and: bool) -> _Expr:
+        lf, rf = left.fn, right.fn
+
+        def fn(env):
+            a, b = lf(env), rf(env)
+            if is_and:
+                if a is False or b is False:
+                    return False
+                return None if a is None or b is None else True
+            if a is True or b is True:
+                return True
+            return None if a is None or b is None else False
+
+        expr = _Expr(fn, aggregate=left.aggregate or right.aggregate)
+        if is_and:
+            expr.equalities = left.equalities + right.equalities
+        return expr
+
+    def not_expr(self) -> _Expr:
+        if self.accept("NOT"):
+            inner = self.not_expr()
+            return _Expr(
+                lambda env: None if (v := inner.fn(env)) is None else not v,
+                aggregate=inner.aggregate,
+            )
+        return self.comparison()
+
+    def comparison(self) -> _Expr:
+        left = self.additive()
+        kind, value = self.peek()
+
+        if kind == "op" and value in ("=", "<>", "!=", "<", "<=", ">", ">="):
+            self.next()
+            if self.accept("ANY"):
+                self.expect_op("(")
+                array = self.expr()
+                self.expect_op(")")
+                lf, af = left.fn, array.fn
+                return _Expr(
+                    lambda env: None
+                    if (v := lf(env)) is None
+                    else any(_compare(value, v, item) for item in (af(env) or ())),
+                    aggregate=left.aggregate,
+                )
+            right = self.additive()
+            lf, rf = left.fn, right.fn
+            expr = _Expr(
+                lambda env: _compare(value, lf(env), rf(env)),
+                aggregate=left.aggregate or right.aggregate,
+            )
+            if value == "=" and left.ref and right.ref:
+                expr.equalities = ((left.ref, right.ref),)
+            return expr
+
+        if self.accept("IS"):
+            negate = self.accept("NOT")
+            if self.accept("NULL"):
+                lf = left.fn
+                return _Expr(lambda env: (lf(env) is None) != negate)
+            for word, literal in (("TRUE", True), ("FALSE", False)):
+                if self.accept(word):
+                    lf = left.fn
+                    return _Expr(lambda env: (lf(env) is literal) != negate)
+            self.fail("expected NULL / TRUE / FALSE after IS")
+
+        negate = self.at("NOT", "IN") or self.at("NOT", "LIKE") or self.at("NOT", "ILIKE")
+        if negate:
+            self.next()
+        if self.accept("IN"):
+            self.expect_op("(")
+            items = [self.expr()]
+            while self.accept_op(","):
+                items.append(self.expr())
+            self.expect_op(")")
+            lf = left.fn
+
+            def in_fn(env):
+                v = lf(env)
+                if v is None:
+                    return None
+                return any(_compare("=", v, item.fn(env)) for item in items) != negate
+
+            return _Expr(in_fn)
+
+        for word, flags in (("LIKE", 0), ("ILIKE", re.IGNORECASE)):
+            if self.accept(word):
+                pattern = self.additive()
+                lf, pf = left.fn, pattern.fn
+
+                def like_fn(env, flags=flags):
+                    v, p = lf(env), pf(env)
+                    if v is None or p is None:
+                        return None
+                    return bool(_like(p, flags).fullmatch(v)) != negate
+
+                return _Expr(like_fn)
+
+        return left
+
+    def additive(self) -> _Expr:
+        left = self.multiplicative()
+        while self.peek() in (("op", "+"), ("op", "-"), ("op", "||")):
+            op = self.next()[1]
+            left = self._binary(op, left, self.multiplicative())
+        return left
+
+    def multiplicative(self) -> _Expr:
+        left = self.unary()
+        while self.peek() in (("op", "*"), ("op", "/"), ("op", "%")):
+            op = self.next()[1]
+            left = self._binary(op, left, self.unary())
+        return left
+
+    @staticmethod
+    def _binary(op: str, left: _Expr, right: _Expr) -> _Expr:
+        lf, rf = left.fn, right.fn
+        return _Expr(
+            lambda env: _arith(op, lf(env), rf(env)),
+            aggregate=left.aggregate or right.aggregate,
+        )
+
+    def unary(self) -> _Expr:
+        if self.accept_op("-"):
+            inner = self.unary()
+            return _Expr(
+                lambda env: None if (v := inner.fn(env)) is None else -v,
+                aggregate=inner.aggregate,
+            )
+        expr = self.primary()
+        while self.accept_op("::"):
+            type_name = self.ident()
+            if type_name == "double":
+                self.accept("PRECISION")
+            is_array = False
+            if self.accept_op("["):
+                self.expect_op("]")
+                is_array = True
+            inner = expr
+            expr = _Expr(
+                lambda env, f=inner.fn, t=type_name, a=is_array: _cast(f(env), t, a),
+                inner.name,
+                inner.aggregate,
+            )
+        return expr
+
+    def primary(self) -> _Expr:
+        kind, value = self.next()
+
+        if kind == "num":
+            number = float(value) if "." in value else int(value)
+            return _Expr(lambda env: number)
+        if kind == "str":
+            text = value[1:-1].replace("''", "'")
+            return _Expr(lambda env: text)
+        if kind == "param":
+            index = int(value[1:])
+            self.max_param = max(self.max_param, index)
+            return _Expr(lambda env: env.params[index - 1])
+        if (kind, value) == ("op", "("):
+            inner = self.expr()
+            self.expect_op(")")
+            return inner
+        if kind == "qname":
+            return self._column_ref(value[1:-1])
+        if kind != "name":
+            self.pos -= 1
+            self.fail("expected an expression")
+
+        word = value.upper()
+        if word in ("TRUE", "FALSE", "NULL"):
+            literal = {"TRUE": True, "FALSE": False, "NULL": None}[word]
+            return _Expr(lambda env: literal, word.lower())
+        if word in ("CURRENT_TIMESTAMP", "LOCALTIMESTAMP"):
+            return _Expr(lambda env: env.now, word.lower())
+        if word == "INTERVAL" and self.peek()[0] == "str":
+            delta = _interval(self.next()[1][1:-1])
+            return _Expr(lambda env: delta, "interval")
+        if word == "EXTRACT" and self.at_op("("):
+            self.next()
+            self.expect("EPOCH")
+            self.expect("FROM")
+            inner = self.expr()
+            self.expect_op(")")
+            return _Expr(
+                lambda env: None if (v := inner.fn(env)) is None else _epoch(v),
+                "extract",
+            )
+        if word in _RESERVED:
+            self.pos -= 1
+            self.fail(f"unexpected {value}")
+        if self.at_op("("):
+            return self._function(word)
+        return self._column_ref(value.lower())
+
+    def _column_ref(self, name: str) -> _Expr:
+        qualifier = None
+        if self.accept_op("."):
+            qualifier, name = name, self.ident()
+        expr = _Expr(lambda env: env.lookup(qualifier, name), name)
+        expr.ref = (qualifier, name)
+        return expr
+
+    def _function(self, word: str) -> _Expr:
+        self.expect_op("(")
+        if word in ("COUNT", "MAX", "MIN", "SUM"):
+            if word == "COUNT" and self.accept_op("*"):
+                self.expect_op(")")
+                return _aggregate(word, None, star=True)
+            arg = self.expr()
+            self.expect_op(")")
+            return _aggregate(word, arg)
+
+        args = []
+        if not self.accept_op(")"):
+            args.append(self.expr())
+            while self.accept_op(","):
+                args.append(self.expr())
+            self.expect_op(")")
+        fns = [a.fn for a in args]
+        aggregate = any(a.aggregate for a in args)
+        name = word.lower()
+
+        if word == "NOW":
+            return _Expr(lambda env: env.now, name)
+        if word == "COALESCE":
+
+            def coalesce(env):
+                for f in fns:
+                    v = f(env)
+                    if v is not None:
+                        return v
+                return None
+
+            return _Expr(coalesce, name, aggregate)
+        if word in ("LEAST", "GREATEST"):
+            pick = min if word == "LEAST" else max
+
+            def least_greatest(env):
+                values = [v for v in (f(env) for f in fns) if v is not None]
+                return pick(values) if values else None
+
+            return _Expr(least_greatest, name, aggregate)
+        if word in ("LOWER", "UPPER", "LENGTH", "ABS") and len(fns) == 1:
+            op = {"LOWER": str.lower, "UPPER": str.upper, "LENGTH": len, "ABS": abs}[
+                word
+            ]
+            f = fns[0]
+            return _Expr(
+                lambda env: None if (v := f(env)) is None else op(v), name, aggregate
+            )
+        self.fail(f"unknown function {word}")
+
+    # 🍬 shared clauses
+    def select_items(self) -> list:
+        """[(expr | None, name, star_qualifier)] — star items have expr None."""
+        items = [self._select_item()]
+        while self.accept_op(","):
+            items.append(self._select_item())
+        return items
+
+    def _select_item(self):
+        if self.accept_op("*"):
+            return (None, "*", None)
+        kind, value = self.peek()
+        if kind in ("name", "qname") and self.peek(1) == ("op", ".") and self.peek(2) == ("op", "*"):
+            qualifier = self.ident()
+            self.pos += 2
+            return (None, "*", qualifier)
+        expr = self.expr()
+        name = expr.name
+        if self.accept("AS"):
+            name = self.ident()
+        elif self.peek()[0] == "qname" or (
+            self.peek()[0] == "name" and self.peek()[1].upper() not in _RESERVED
+        ):
+            name = self.ident()
+        return (expr, name, None)
+
+    def from_item(self) -> dict:
+        """Table reference or unnest(...) with an optional alias / column list."""
+        if self.at("UNNEST") and self.peek(1) == ("op", "("):
+            self.next()
+            self.expect_op("(")
+            arrays = [self.expr()]
+            while self.accept_op(","):
+                arrays.append(self.expr())
+            self.expect_op(")")
+            item = {"unnest": arrays, "table": None, "alias": None, "columns": None}
+        else:
+            item = {"unnest": None, "table": self.ident(), "alias": None, "columns": None}
+
+        if self.accept("AS") or (
+            self.peek()[0] in ("name", "qname") and self.peek()[1].upper() not in _RESERVED
+        ):
+            item["alias"] = self.ident()
+            if self.at_op("("):
+                item["columns"] = self.ident_list()
+        return item
+
+    def assignments(self) -> list[tuple[str, _Expr]]:
+        pairs = []
+        while True:
+            column = self.ident()
+            if self.accept_op("."):  # SET tbl.col = ... is not valid SQL, be strict
+                self.fail("qualified SET target")
+            self.expect_op("=")
+            pairs.append((column, self.expr()))
+            if not self.accept_op(","):
+                return pairs
+
+    def returning(self):
+        return self.select_items() if self.accept("RETURNING") else None
+
+    # 🍬 statements
+    def statement(self):
+        if self.accept("SELECT"):
+            stmt = self.select_body()
+        elif self.accept("INSERT"):
+            stmt = self.insert_body()
+        elif self.accept("UPDATE"):
+            stmt = self.update_body()
+        elif self.accept("DELETE"):
+            stmt = self.delete_body()
+        elif self.accept("CREATE"):
+            stmt = self.create_body()
+        elif self.accept("TRUNCATE"):
+            stmt = self.truncate_body()
+        elif self.accept("DROP"):
+            stmt = self.drop_body()
+        else:
+            self.fail("unknown statement")
+        if not self.done():
+            self.fail("trailing tokens")
+        stmt.max_param = self.max_param
+        return stmt
+
+    def select_body(self) -> "_Select":
+        if self.at("DISTINCT"):
+            self.fail("DISTINCT")
+        items = self.select_items()
+        source = self.from_item() if self.accept("FROM") else None
+        if self.at_op(",") or self.at("JOIN") or self.at("LEFT") or self.at("INNER"):
+            self.fail("joins")
+        where = self.expr() if self.accept("WHERE") else None
+        if self.at("GROUP"):
+            self.fail("GROUP BY")
+
+        order = []
+        if self.accept("ORDER", "BY"):
+            while True:
+                expr = self.expr()
+                descending = self.accept("DESC")
+                if not descending:
+                    self.accept("ASC")
+                nulls_first = descending
+                if self.accept("NULLS"):
+                    nulls_first = self.accept("FIRST")
+                    if not nulls_first:
+                        self.expect("LAST")
+                order.append((expr, descending, nulls_first))
+                if not self.accept_op(","):
+                    break
+
+        limit = offset = None
+        while self.at("LIMIT") or self.at("OFFSET"):
+            word = self.next()[1].upper()
+            value = self.additive()
+            if word == "LIMIT":
+                limit = value
+            else:
+                offset = value
+        return _Select(items, source, where, order, limit, offset)
+
+    def insert_body(self) -> "_Insert":
+        self.expect("INTO")
+        table = self.ident()
+        alias = self.ident() if self.accept("AS") else None
+        columns = self.ident_list() if self.at_op("(") else None
+
+        values = select = None
+        if self.accept("VALUES"):
+            values = []
+            while True:
+                self.expect_op("(")
+                row = [self.expr()]
+                while self.accept_op(","):
+                    row.append(self.expr())
+                self.expect_op(")")
+                values.append(row)
+                if not self.accept_op(","):
+                    break
+        elif self.accept("SELECT"):
+            select = self.select_body()
+        else:
+            self.fail("expected VALUES or SELECT")
+
+        conflict = None
+        if self.accept("ON", "CONFLICT"):
+            target = self.ident_list() if self.at_op("(") else None
+            self.expect("DO")
+            if self.accept("NOTHING"):
+                conflict = {"target": target, "set": None, "where": None}
+            else:
+                self.expect("UPDATE")
+                self.expect("SET")
+                pairs = self.assignments()
+                where = self.expr() if self.accept("WHERE") else None
+                conflict = {"target": target, "set": pairs, "where": where}
+        return _Insert(table, alias, columns, values, select, conflict, self.returning())
+
+    def update_body(self) -> "_Update":
+        table = self.ident()
+        alias = self.ident() if self.accept("AS") else None
+        self.expect("SET")
+        pairs = self.assignments()
+        joined = self.from_item() if self.accept("FROM") else None
+        where = self.expr() if self.accept("WHERE") else None
+        return _Update(table, alias, pairs, joined, where, self.returning())
+
+    def delete_body(self) -> "_Delete":
+        self.expect("FROM")
+        table = self.ident()
+        alias = self.ident() if self.accept("AS") else None
+        joined = self.from_item() if self.accept("USING") else None
+        where = self.expr() if self.accept("WHERE") else None
+        return _Delete(table, alias, joined, where, self.returning())
+
+    def create_body(self) -> "_Create":
+        temp = self.accept("TEMP") or self.accept("TEMPORARY")
+        self.expect("TABLE")
+        if_not_exists = self.accept("IF", "NOT", "EXISTS")
+        table = self.ident()
+        stmt = _Create(table, temp, if_not_exists)
+
+        if self.at_op("("):
+            self._column_defs(stmt)
+        if self.accept("ON", "COMMIT"):
+            if self.accept("DROP"):
+                stmt.on_commit_drop = True
+            elif not (self.accept("PRESERVE", "ROWS") or self.accept("DELETE", "ROWS")):
+                self.fail("ON COMMIT")
+        if self.accept("AS"):
+            self.expect("SELECT")
+            stmt.select = self.select_body()
+            if self.accept("WITH"):
+                stmt.with_data = not self.accept("NO")
+                self.expect("DATA")
+        return stmt
+
+    def _column_defs(self, stmt: "_Create"):
+        self.expect_op("(")
+        while True:
+            if self.accept("PRIMARY", "KEY") or self.accept("UNIQUE"):
+                stmt.unique_keys.append(tuple(self.ident_list()))
+            elif self.accept("CONSTRAINT"):
+                self.ident()
+                continue
+            elif self.at("FOREIGN") or self.at("CHECK"):
+                while not (self.at_op(",") or self.at_op(")")):
+                    if self.at_op("("):
+                        self.skip_parens()
+                    else:
+                        self.next()
+            else:
+                self._column_def(stmt)
+            if not self.accept_op(","):
+                break
+        self.expect_op(")")
+
+    def _column_def(self, stmt: "_Create"):
+        column = self.ident()
+        stmt.columns.append(column)
+        # Type: everything up to the first column constraint
+        while not (self.at_op(",") or self.at_op(")")):
+            kind, value = self.peek()
+            word = value.upper() if kind == "name" else None
+            if word in ("SERIAL", "BIGSERIAL", "SMALLSERIAL"):
+                stmt.serial = column
+            if word in (
+                "DEFAULT", "PRIMARY", "UNIQUE", "NOT", "NULL", "REFERENCES",
+                "CHECK", "GENERATED", "CONSTRAINT",
+            ):
+                break
+            if self.at_op("("):
+                self.skip_parens()
+            else:
+                self.next()
+        # Constraints
+        while not (self.at_op(",") or self.at_op(")")):
+            if self.accept("DEFAULT"):
+                stmt.defaults[column] = self.expr()
+            elif self.accept("PRIMARY", "KEY") or self.accept("UNIQUE"):
+                stmt.unique_keys.append((column,))
+            elif self.accept("GENERATED"):
+                stmt.serial = column
+                while not (self.at_op(",") or self.at_op(")")):
+                    self.next()
+            elif self.accept("REFERENCES"):
+                self.ident()
+                if self.at_op("("):
+                    self.skip_parens()
+            elif self.accept("CHECK"):
+                self.skip_parens()
+            else:
+                self.next()  # NOT NULL / NULL / ON DELETE ... / CONSTRAINT name
+
+    def truncate_body(self) -> "_Truncate":
+        self.accept("TABLE")
+        tables = [self.ident()]
+        while self.accept_op(","):
+            tables.append(self.ident())
+        self.accept("RESTART", "IDENTITY")
+        self.accept("CASCADE")
+        return _Truncate(tables)
+
+    def drop_body(self) -> "_Drop":
+        self.expect("TABLE")
+        if_exists = self.accept("IF", "EXISTS")
+        tables = [self.ident()]
+        while self.accept_op(","):
+            tables.append(self.ident())
+        self.accept("CASCADE")
+        return _Drop(tables, if_exists)
+
+
+def _epoch(value):
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    return float(value)
+
+
+@lru_cache(maxsize=512)
+def _compile(sql: str) -> tuple:
+    """Parse once per distinct query text (the bot reuses the same strings)."""
+    return tuple(_Parser(tokens).statement() for tokens in _split_statements(_tokenize(sql)))
+
+
+# --------------------
+#  Statements
+# --------------------
+def _project(items, env: _Env) -> tuple[list, list]:
+    names, values = [], []
+    for expr, name, qualifier in items:
+        if expr is not None:
+            names.append(name)
+            values.append(expr.fn(env))
+            continue
+        for source in env.sources:
+            if qualifier is not None and qualifier not in (source.alias, source.table):
+                continue
+            names.extend(source.row)
+            values.extend(source.row.values())
+    return names, values
+
+
+def _records(items, envs) -> list[MemoryRecord]:
+    records = []
+    for env in envs:
+        names, values = _project(items, env)
+        records.append(MemoryRecord(zip(names, values)))
+    return records
+
+
+def _truthy(expr, env) -> bool:
+    return expr is None or expr.fn(env) is True
+
+
+class _Statement:
+    verb = "?"
+    table = None
+    max_param = 0
+
+    @property
+    def label(self) -> str:
+        return f"{self.verb} {self.table}" if self.table else self.verb
+
+    def _rows_of(self, pool, item, env: _Env) -> list[_Source]:
+        """Bind every row of a FROM / USING item."""
+        if item["unnest"] is not None:
+            arrays = [a.fn(env) or [] for a in item["unnest"]]
+            names = item["columns"] or (
+                ["unnest"] if len(arrays) == 1 else [f"unnest_{i + 1}" for i in range(len(arrays))]
+            )
+            alias = item["alias"] or "unnest"
+            columns = set(names)
+            return [
+                _Source(alias, None, dict(zip(names, values)), columns)
+                for values in zip_longest(*arrays)
+            ]
+        table = item["table"]
+        columns = pool._declared.get(table)
+        alias = item["alias"] or table
+        return [_Source(alias, table, row, columns) for row in pool._table(table)]
+
+    def _matches(self, pool, env: _Env) -> list[_Env]:
+        """Target rows passing WHERE, each bound to its first joined row."""
+        declared = pool._declared.get(self.table)
+        joined = self._rows_of(pool, self.joined, env) if self.joined else None
+
+        # Hash the joined rows on WHERE's target.col = joined.col pairs
+        pairs, buckets = [], None
+        if joined and self.where is not None:
+            joined_alias = joined[0].alias
+            for a, b in self.where.equalities:
+                for target, other in ((a, b), (b, a)):
+                    if target[0] in (self.alias, self.table) and other[0] == joined_alias:
+                        pairs.append((target[1], other[1]))
+                        break
+            if pairs:
+                buckets = {}
+                for source in joined:
+                    key = tuple(source.row.get(column) for _, column in pairs)
+                    buckets.setdefault(key, []).append(source)
+
+        matches = []
+        for row in pool._table(self.table):
+            target = _Source(self.alias, self.table, row, declared)
+            if joined is None:
+                candidates = [(target,)]
+            else:
+                others = joined
+                if buckets is not None:
+                    key = tuple(row.get(column) for column, _ in pairs)
+                    others = buckets.get(key, ())
+                candidates = [(target, other) for other in others]
+            for sources in candidates:
+                row_env = env.with_sources(sources)
+                if _truthy(self.where, row_env):
+                    matches.append(row_env)
+                    break  # Postgres touches each target row at most once
+        return matches
+
+
+class _Select(_Statement):
+    verb = "SELECT"
+
+    def __init__(self, items, source, where, order, limit, offset):
+        self.items = items
+        self.source = source
+        self.where = where
+        self.order = order
+        self.limit = limit
+        self.offset = offset
+        self.table = source["table"] if source else None
+        self.aggregate = any(expr is not None and expr.aggregate for expr, _, _ in items)
+
+    def output_names(self, pool) -> list[str]:
+        names = []
+        for expr, name, qualifier in self.items:
+            if expr is not None:
+                names.append(name)
+            elif self.source and self.source["table"]:
+                names.extend(pool._columns.get(self.source["table"], []))
+        return names
+
+    def rows(self, pool, env: _Env) -> tuple[list, list]:
+        """[(names, values)] in output order."""
+        if self.source is None:
+            bound = [[]]
+        else:
+            bound = [[s] for s in self._rows_of(pool, self.source, env)]
+        envs = [env.with_sources(b) for b in bound]
+        if self.where is not None:
+            envs = [e for e in envs if self.where.fn(e) is True]
+
+        if self.aggregate:
+            group = [e.sources for e in envs]
+            envs = [_Env(env.params, group[0] if group else (), group, env.now)]
+        out = [_project(self.items, e) for e in envs]
+
+        if self.order:
+            # Evaluate every sort key once; output aliases resolve last
+            decorated = []
+            for (names, values), row_env in zip(out, envs):
+                output = _Source("", None, dict(zip(names, values)), set(names))
+                order_env = row_env.with_sources((*row_env.sources, output))
+                keys = [expr.fn(order_env) for expr, _, _ in self.order]
+                decorated.append((keys, (names, values)))
+            for i, (_, descending, nulls_first) in reversed(list(enumerate(self.order))):
+                # NULLs sort last ascending / first descending, like Postgres
+                flip = nulls_first != descending
+                decorated.sort(
+                    key=lambda d: _SortKey((d[0][i] is None) != flip, d[0][i]),
+                    reverse=descending,
+                )
+            out = [d[1] for d in decorated]
+
+        start = self.offset.fn(env) if self.offset else 0
+        if self.limit is not None:
+            out = out[start : start + self.limit.fn(env)]
+        elif start:
+            out = out[start:]
+        return out
+
+    def run(self, pool, env: _Env):
+        records = [MemoryRecord(zip(n, v)) for n, v in self.rows(pool, env)]
+        return records, f"SELECT {len(records)}"
+
+
+class _SortKey:
+    """(null_flag, value) that orders aware and naive datetimes together."""
+
+    __slots__ = ("null", "value")
+
+    def __init__(self, null: bool, value):
+        self.null = null
+        self.value = value
+
+    def __lt__(self, other):
+        if self.null != other.null:
+            return self.null < other.null
+        if self.value is None or other.value is None:
+            return False
+        a, b = _align(self.value, other.value)
+        return a < b
+
+
+class _Insert(_Statement):
+    verb = "INSERT"
+
+    def __init__(self, table, alias, columns, values, select, conflict, returning):
+        self.table = table
+        self.alias = alias or table
+        self.columns = columns
+        self.values = values
+        self.select = select
+        self.conflict = conflict
+        self.returning = returning
+
+    def run(self, pool, env: _Env):
+        table = self.table
+        declared = pool._declared.get(table)
+        columns = self.columns or pool._columns.get(table, [])
+        if declared is not None:
+            for column in columns:
+                if column not in declared:
+                    raise asyncpg.exceptions.UndefinedColumnError(
+                        f'column "{column}" of relation "{table}" does not exist'
+                    )
+
+        if self.values is not None:
+            incoming = [[e.fn(env) for e in row] for row in self.values]
+        else:
+            incoming = [values for _, values in self.select.rows(pool, env)]
+
+        conflict = self.conflict
+        target = None
+        if conflict:
+            target = tuple(conflict["target"] or ()) or None
+            if target:
+                pool._unique_keys.setdefault(table, set()).add(target)
+        keys = [target] if target else list(pool._unique_keys.get(table, ()))
+        touched = set()
+        written = []
+
+        for values in incoming:
+            if len(values) > len(columns):
+                raise MemoryPoolError(
+                    f"INSERT into {table} has more expressions than target columns"
+                )
+            row = pool._new_row(table, dict(zip(columns, values)), env)
+
+            existing, hit_key = None, None
+            for key in keys:
+                key_value = tuple(row.get(c) for c in key)
+                if None in key_value:
+                    continue
+                existing = pool._index(table, key).get(key_value)
+                if existing is not None:
+                    hit_key = (key, key_value)
+                    break
+
+            if existing is None:
+                row = pool._insert_row(table, row)
+                if target:
+                    touched.add((target, tuple(row.get(c) for c in target)))
+                written.append(row)
+                continue
+
+            if not conflict:
+                raise asyncpg.exceptions.UniqueViolationError(
+                    f'duplicate key value violates unique constraint on "{table}" {hit_key[0]}'
+                )
+            if conflict["set"] is None:
+                continue  # DO NOTHING
+            if hit_key in touched:
+                raise asyncpg.exceptions.CardinalityViolationError(
+                    "ON CONFLICT DO UPDATE command cannot affect row a second time"
+                )
+            touched.add(hit_key)
+            sources = (
+                _Source(self.alias, table, existing, declared),
+                _Source("excluded", None, row),
+            )
+            row_env = env.with_sources(sources)
+            if not _truthy(conflict["where"], row_env):
+                continue
+            changes = {column: expr.fn(row_env) for column, expr in conflict["set"]}
+            pool._update_row(table, existing, changes)
+            written.append(existing)
+
+        records = []
+        if self.returning:
+            records = _records(
+                self.returning,
+                (env.with_sources((_Source(self.alias, table, row, declared),)) for row in written),
+            )
+        return records, f"INSERT 0 {len(written)}"
+
+
+class _Update(_Statement):
+    verb = "UPDATE"
+
+    def __init__(self, table, alias, pairs, joined, where, returning):
+        self.table = table
+        self.alias = alias or table
+        self.pairs = pairs
+        self.joined = joined
+        self.where = where
+        self.returning = returning
+
+    def run(self, pool, env: _Env):
+        matches = self._matches(pool, env)
+
+        # Evaluate every SET against the pre-update rows, then apply
+        changes = [
+            (e.sources[0].row, {column: expr.fn(e) for column, expr in self.pairs})
+            for e in matches
+        ]
+        for row, values in changes:
+            pool._update_row(self.table, row, values)
+
+        records = _records(self.returning, matches) if self.returning else []
+        return records, f"UPDATE {len(matches)}"
+
+
+class _Delete(_Statement):
+    verb = "DELETE"
+
+    def __init__(self, table, alias, joined, where, returning):
+        self.table = table
+        self.alias = alias or table
+        self.joined = joined
+        self.where = where
+        self.returning = returning
+
+    def run(self, pool, env: _Env):
+        doomed = self._matches(pool, env)
+        pool._delete_rows(self.table, {id(e.sources[0].row) for e in doomed})
+        records = _records(self.returning, doomed) if self.returning else []
+        return records, f"DELETE {len(doomed)}"
+
+
+class _Create(_Statement):
+    verb = "CREATE"
+
+    def __init__(self, table, temp, if_not_exists):
+        self.table = table
+        self.temp = temp
+        self.if_not_exists = if_not_exists
+        self.columns: list[str] = []
+        self.defaults: dict[str, _Expr] = {}
+        self.unique_keys: list[tuple] = []
+        self.serial = None
+        self.on_commit_drop = False
+        self.select = None
+        self.with_data = True
+
+    def run(self, pool, env: _Env):
+        # Tables only auto-created by a read (never declared, no rows) may be replaced
+        if self.table in pool._declared or pool._tables.get(self.table):
+            if self.if_not_exists:
+                return [], "CREATE TABLE"
+            raise asyncpg.exceptions.DuplicateTableError(
+                f'relation "{self.table}" already exists'
+            )
+
+        columns = list(self.columns)
+        rows = []
+        if self.select is not None:
+            columns = self.select.output_names(pool)
+            if self.with_data:
+                rows = [dict(zip(n, v)) for n, v in self.select.rows(pool, env)]
+
+        pool._tables[self.table] = []
+        pool._columns[self.table] = columns
+        pool._declared[self.table] = set(columns)
+        pool._defaults[self.table] = dict(self.defaults)
+        if self.unique_keys:
+            pool._unique_keys[self.table] = set(self.unique_keys)
+        if self.serial:
+            pool.serial_columns[self.table] = self.serial
+        if self.on_commit_drop:
+            pool._on_commit_drop.add(self.table)
+        for row in rows:
+            pool._insert_row(self.table, row)
+        return [], "CREATE TABLE"
+
+
+class _Truncate(_Statement):
+    verb = "TRUNCATE"
+
+    def __init__(self, tables):
+        self.tables = tables
+        self.table = tables[0]
+
+    def run(self, pool, env: _Env):
+        for table in self.tables:
+            pool._tables[table] = []
+            pool._invalidate(table)
+        return [], "TRUNCATE TABLE"
+
+
+class _Drop(_Statement):
+    verb = "DROP"
+
+    def __init__(self, tables, if_exists):
+        self.tables = tables
+        self.if_exists = if_exists
+        self.table = tables[0]
+
+    def run(self, pool, env: _Env):
+        for table in self.tables:
+            if table not in pool._tables and not self.if_exists:
+                raise asyncpg.exceptions.UndefinedTableError(
+                    f'table "{table}" does not exist'
+                )
+            pool._drop(table)
+        return [], "DROP TABLE"
+
+
+# --------------------
+#  Query accounting
+# --------------------
+class QueryStats:
+    """Round-trips, statements and simulated latency seen by a MemoryPool."""
+
+    def __init__(self, keep_queries: bool = False):
+        self.keep_queries = keep_queries
+        self.reset()
+
+    def reset(self):
+        self.round_trips = 0
+        self.methods: Counter[str] = Counter()  # fetch / execute / executemany ...
+        self.statements: Counter[str] = Counter()  # "SELECT market_value"
+        self.rows = 0  # rows returned or affected
+        self.simulated_seconds = 0.0
+        self.unsupported: Counter[str] = Counter()
+        self.queries: list[str] = []
+
+    def record(self, method: str, labels, rows: int, cost: float, query: str):
+        self.round_trips += 1
+        self.methods[method] += 1
+        self.statements.update(labels)
+        self.rows += rows
+        self.simulated_seconds += cost
+        if self.keep_queries:
+            self.queries.append(query)
+
+    def snapshot(self) -> dict:
+        return {
+            "round_trips": self.round_trips,
+            "methods": dict(self.methods),
+            "statements": dict(self.statements),
+            "rows": self.rows,
+            "simulated_ms": round(self.simulated_seconds * 1000, 3),
+            "unsupported": dict(self.unsupported),
+        }
+
+
+# --------------------
+#  Pool / connection
+# --------------------
+class MemoryPool:
+    """
+    In-memory bot.pg_pool. Tables are lists of dicts, created on first
+    use (or from CREATE TABLE / seed()). Each call is one round-trip:
+    it costs `latency` + `row_latency` per row returned or affected,
+    added to stats.simulated_seconds (and actually slept if sleep=True).
+    strict=False logs and skips SQL the backend can't run instead of raising.
+    """
+
+    def __init__(
+        self,
+        tables: dict[str, list[dict]] = None,
+        *,
+        latency: float = 0.0,
+        row_latency: float = 0.0,
+        sleep: bool = False,
+        strict: bool = True,
+        serial_columns: dict[str, str] = None,
+        keep_queries: bool = False,
+    ):
+        self.latency = latency
+        self.row_latency = row_latency
+        self.sleep = sleep
+        self.strict = strict
+        self.serial_columns = dict(SERIAL_COLUMNS if serial_columns is None else serial_columns)
+        self.stats = QueryStats(keep_queries)
+
+        self._tables: dict[str, list[dict]] = {}
+        self._columns: dict[str, list[str]] = {}
+        self._declared: dict[str, set] = {}  # tables created with a column list
+        self._defaults: dict[str, dict[str, _Expr]] = {}
+        self._unique_keys: dict[str, set[tuple]] = {}
+        self._indexes: dict[str, dict[tuple, dict]] = {}
+        self._serial_last: dict[str, int] = {}  # like sequences, never rolled back
+        self._on_commit_drop: set[str] = set()
+        self._closed = False
+
+        for name, rows in (tables or {}).items():
+            self.seed(name, rows)
+
+    # 🍬 setup / inspection (no round-trips)
+    def seed(self, table: str, rows: list[dict]):
+        """Append rows directly (not counted in stats)."""
+        self._table(table)
+        env = _Env((), now=datetime.now(timezone.utc))
+        for row in rows:
+            self._insert_row(table, self._new_row(table, dict(row), env))
+
+    def load_schema(self, sql: str):
+        """Run CREATE TABLE scripts (e.g. the SQL SCRIPT blocks in utils/db)."""
+        env = _Env((), now=datetime.now(timezone.utc))
+        for stmt in _compile(sql):
+            stmt.run(self, env)
+
+    def rows(self, table: str) -> list[dict]:
+        """Copy of a table's rows, for assertions."""
+        return [dict(row) for row in self._tables.get(table, [])]
+
+    def acquire(self):
+        if self._closed:
+            raise RuntimeError("MemoryPool is closed.")
+        return _MemoryAcquire(MemoryConnection(self))
+
+    async def close(self):
+        self._closed = True
+
+    # 🍬 SafePool / asyncpg.Pool shortcuts (one connection per call)
+    async def fetch(self, query, *args, **kwargs):
+        return await MemoryConnection(self).fetch(query, *args, **kwargs)
+
+    async def fetchrow(self, query, *args, **kwargs):
+        return await MemoryConnection(self).fetchrow(query, *args, **kwargs)
+
+    async def fetchval(self, query, *args, **kwargs):
+        return await MemoryConnection(self).fetchval(query, *args, **kwargs)
+
+    async def execute(self, query, *args, **kwargs):
+        return await MemoryConnection(self).execute(query, *args, **kwargs)
+
+    async def executemany(self, query, args, **kwargs):
+        return await MemoryConnection(self).executemany(query, args, **kwargs)
+
+    # 🍬 storage
+    def _table(self, table: str) -> list[dict]:
+        if table not in self._tables:
+            self._tables[table] = []
+            self._columns[table] = []
+        return self._tables[table]
+
+    def _new_row(self, table: str, row: dict, env: _Env) -> dict:
+        for column, default in self._defaults.get(table, {}).items():
+            if column not in row:
+                row[column] = default.fn(env)
+        serial = self.serial_columns.get(table)
+        if serial:
+            last = self._serial_last.get(table)
+            if last is None:
+                last = max((r.get(serial) or 0 for r in self._table(table)), default=0)
+            if row.get(serial) is None:
+                last += 1
+                row[serial] = last
+            else:
+                last = max(last, row[serial])
+            self._serial_last[table] = last
+        return row
+
+    def _insert_row(self, table: str, row: dict):
+        rows = self._table(table)
+        columns = self._columns[table]
+        for column in row:
+            if column not in columns:
+                self._add_column(table, column)
+        # Keep every row in column order with NULLs filled, like SELECT *
+        if len(row) != len(columns) or list(row) != columns:
+            row = {column: row.get(column) for column in columns}
+        rows.append(row)
+        for key, index in self._indexes.get(table, {}).items():
+            index[tuple(row.get(c) for c in key)] = row
+        return row
+
+    def _update_row(self, table: str, row: dict, changes: dict):
+        declared = self._declared.get(table)
+        columns = self._columns[table]
+        for column in changes:
+            if declared is not None and column not in declared:
+                raise asyncpg.exceptions.UndefinedColumnError(
+                    f'column "{column}" of relation "{table}" does not exist'
+                )
+            if column not in columns:
+                self._add_column(table, column)
+        row.update(changes)
+        if any(c in key for key in self._indexes.get(table, {}) for c in changes):
+            self._invalidate(table)
+
+    def _add_column(self, table: str, column: str):
+        self._columns[table].append(column)
+        for row in self._tables[table]:
+            row.setdefault(column, None)
+
+    def _delete_rows(self, table: str, row_ids: set):
+        if row_ids:
+            self._tables[table] = [r for r in self._table(table) if id(r) not in row_ids]
+            self._invalidate(table)
+
+    def _drop(self, table: str):
+        for store in (self._tables, self._columns, self._declared, self._defaults, self._unique_keys):
+            store.pop(table, None)
+        self._invalidate(table)
+        self._on_commit_drop.discard(table)
+
+    def _index(self, table: str, key: tuple) -> dict:
+        indexes = self._indexes.setdefault(table, {})
+        index = indexes.get(key)
+        if index is None:
+            index = indexes[key] = {
+                tuple(row.get(c) for c in key): row for row in self._table(table)
+            }
+        return index
+
+    def _invalidate(self, table: str):
+        self._indexes.pop(table, None)
+
+    def _snapshot(self):
+        return (
+            {t: [dict(r) for r in rows] for t, rows in self._tables.items()},
+            {t: list(c) for t, c in self._columns.items()},
+            {t: set(c) for t, c in self._declared.items()},
+            dict(self._defaults),
+            {t: set(k) for t, k in self._unique_keys.items()},
+            set(self._on_commit_drop),
+        )
+
+    def _restore(self, snapshot):
+        (
+            self._tables,
+            self._columns,
+            self._declared,
+            self._defaults,
+            self._unique_keys,
+            self._on_commit_drop,
+        ) = snapshot
+        self._indexes.clear()
+
+    def _commit(self):
+        for table in list(self._on_commit_drop):
+            self._drop(table)
+
+    # 🍬 round-trips
+    def _statements(self, query: str, arg_count: int):
+        try:
+            statements = _compile(query)
+        except MemoryPoolError as e:
+            self.stats.unsupported[" ".join(query.split())[:80]] += 1
+            if self.strict:
+                raise
+            pretty_log(tag="warn", message=f"[MemoryPool] Skipped query: {e}")
+            return ()
+        if len(statements) > 1 and arg_count:
+            raise MemoryPoolError(
+                "cannot insert multiple commands into a prepared statement"
+            )
+        return statements
+
+    async def _round_trip(self, conn, method: str, query: str, arg_sets) -> tuple:
+        arg_sets = list(arg_sets)
+        statements = self._statements(query, max((len(a) for a in arg_sets), default=0))
+        records, status, affected = [], "", 0
+        now = datetime.now(timezone.utc)
+
+        for args in arg_sets:
+            for stmt in statements:
+                if stmt.max_param != len(args):
+                    raise MemoryPoolError(
+                        f"the server expects {stmt.max_param} argument(s) for this query, "
+                        f"{len(args)} were passed"
+                    )
+                records, status = stmt.run(self, _Env(tuple(args), now=now))
+                count = status.rsplit(" ", 1)[-1]
+                affected += len(records) if stmt.verb == "SELECT" else int(count) if count.isdigit() else 0
+        if not conn._depth:
+            self._commit()
+
+        cost = self.latency + self.row_latency * affected
+        self.stats.record(method, [s.label for s in statements], affected, cost, query)
+        if self.sleep and cost:
+            await asyncio.sleep(cost)
+        return records, status
+
+
+class MemoryConnection:
+    """asyncpg.Connection look-alike bound to a MemoryPool."""
+
+    def __init__(self, pool: MemoryPool):
+        self._pool = pool
+        self._depth = 0  # open transaction() blocks
+
+    async def fetch(self, query, *args, timeout=None, record_class=None):
+        records, _ = await self._pool._round_trip(self, "fetch", query, [args])
+        return records
+
+    async def fetchrow(self, query, *args, timeout=None, record_class=None):
+        records, _ = await self._pool._round_trip(self, "fetchrow", query, [args])
+        return records[0] if records else None
+
+    async def fetchval(self, query, *args, column=0, timeout=None):
+        records, _ = await self._pool._round_trip(self, "fetchval", query, [args])
+        return records[0][column] if records else None
+
+    async def execute(self, query, *args, timeout=None) -> str:
+        _, status = await self._pool._round_trip(self, "execute", query, [args])
+        return status
+
+    async def executemany(self, command, args, *, timeout=None):
+        await self._pool._round_trip(self, "executemany", command, args)
+
+    async def copy_records_to_table(
+        self, table_name, *, records, columns=None, schema_name=None, timeout=None, where=None
+    ) -> str:
+        pool = self._pool
+        columns = list(columns or pool._columns.get(table_name, []))
+        env = _Env((), now=datetime.now(timezone.utc))
+        count = 0
+        for record in records:
+            pool._insert_row(table_name, pool._new_row(table_name, dict(zip(columns, record)), env))
+            count += 1
+        cost = pool.latency + pool.row_latency * count
+        pool.stats.record("copy_records_to_table", [f"COPY {table_name}"], count, cost, f"COPY {table_name}")
+        if pool.sleep and cost:
+            await asyncio.sleep(cost)
+        return f"COPY {count}"
+
+    def transaction(self, **kwargs):
+        return MemoryTransaction(self)
+
+    def is_closed(self) -> bool:
+        return self._pool._closed
+
+    async def close(self):
+        pass
+
+
+class MemoryTransaction:
+    """Snapshot on entry, restore on exception (nested blocks act as savepoints)."""
+
+    def __init__(self, conn: MemoryConnection):
+        self._conn = conn
+        self._snapshot = None
+
+    async def __aenter__(self):
+        self._snapshot = self._conn._pool._snapshot()
+        self._conn._depth += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._conn._depth -= 1
+        pool = self._conn._pool
+        if exc_type is not None:
+            pool._restore(self._snapshot)
+        elif not self._conn._depth:
+            pool._commit()
+        return False
+
+
+class _MemoryAcquire:
+    def __init__(self, conn: MemoryConnection):
+        self.conn = conn
+
+    async def __aenter__(self):
+        return self.conn
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
@@ -0,0 +1,314 @@
+# 🌸──────────────────────────────────────────────
+#        🐾 Listener Replay Corpus 🐾
+#   Serialized PokéMeow traffic for the replay bench
+#   (utils.bench.listener_replay). Embeds use Discord's
+#   API dict shape (discord.Embed.from_dict).
+#     event   → "create" (on_message) or "edit" (on_message_edit)
+#     author  → "pokemeow", "trainer" or "webhook"
+#     channel → "spawns" or "market_feed"
+#     reply   → PokéMeow replied to the trainer's command
+#     before  → edit only: the message before the edit
+#   The trainer is TRAINER_NAME in the fake guild.
+# 🌸──────────────────────────────────────────────
+
+TRAINER_NAME = "mewlover"
+MARKET_WEBHOOK_ID = 1422430564102836370  # "Regular" market feed webhook
+
+FISHING_COLOR = 0x87CEFA
+
+RECORDED_MESSAGES: list[dict] = [
+    # ❀ Spawns
+    {
+        "name": "spawn",
+        "event": "create",
+        "author": "pokemeow",
+        "channel": "spawns",
+        "reply": True,
+        "content": "**mewlover** found a wild <:pokeball:1> **Eevee**!",
+        "embeds": [
+            {
+                "description": (
+                    "**mewlover** found a wild <:eevee:1004> **Eevee**!\n"
+                    "<:pokeball:1> 12 · <:greatball:2> 4 · <:ultraball:3> 1"
+                ),
+                "footer": {"text": "Rarity: Common | 1,245 caught"},
+                "color": 0x0855FB,
+            }
+        ],
+    },
+    {
+        "name": "spawn_held_item",
+        "event": "create",
+        "author": "pokemeow",
+        "channel": "spawns",
+        "reply": True,
+        "content": "**mewlover** found a wild <:held_item:1003> **Snorlax**!",
+        "embeds": [
+            {
+                "description": (
+                    "<:npc:1001> **mewlover** found a wild <:team_logo:1002> "
+                    "<:held_item:1003> <:snorlax:1004> <:dexCaught:1005> **Snorlax**!"
+                ),
+                "footer": {"text": "Rarity: Rare | Holding: Leftovers"},
+                "color": 0xFF9900,
+            }
+        ],
+    },
+    # ❀ Fishing
+    {
+        "name": "fish_cast",
+        "event": "create",
+        "author": "pokemeow",
+        "channel": "spawns",
+        "reply": True,
+        "embeds": [
+            {
+                "description": "**mewlover** cast a <:goodrod:1> Good Rod into the water...",
+                "color": FISHING_COLOR,
+            }
+        ],
+    },
+    {
+        "name": "fish_spawn",
+        "event": "edit",
+        "author": "pokemeow",
+        "channel": "spawns",
+        "reply": True,
+        "before": {
+            "embeds": [
+                {
+                    "description": "**mewlover** cast a <:goodrod:1> Good Rod into the water...",
+                    "color": FISHING_COLOR,
+                }
+            ]
+        },
+        "embeds": [
+            {
+                "description": (
+                    "**mewlover** fished a wild <:shiny:1> <:gyarados:2> "
+                    "**Shiny Gyarados**!"
+                ),
+                "footer": {"text": "Rarity: Shiny"},
+                "color": FISHING_COLOR,
+            }
+        ],
+    },
+    {
+        "name": "fish_faction_hunt",
+        "event": "edit",
+        "author": "pokemeow",
+        "channel": "spawns",
+        "reply": True,
+        "embeds": [
+            {
+                "description": (
+                    "**mewlover** fished a wild <:team_logo:1002> <:magikarp:2> "
+                    "**Magikarp**!"
+                ),
+                "color": FISHING_COLOR,
+            }
+        ],
+    },
+    {
+        "name": "catch_result",
+        "event": "edit",
+        "author": "pokemeow",
+        "channel": "spawns",
+        "reply": True,
+        "embeds": [
+            {
+                "description": (
+                    "<:Ultraball:1200000000000000001> Ultraball\n"
+                    "**mewlover** You caught a Legendary <:mewtwo:1> **Mewtwo**!"
+                ),
+                "footer": {"text": "Rarity: Legendary | Dex #150"},
+                "color": 0xA007F8,
+            }
+        ],
+    },
+    # ❀ Market feed (webhook)
+    {
+        "name": "market_feed",
+        "event": "create",
+        "author": "webhook",
+        "channel": "market_feed",
+        "webhook_id": MARKET_WEBHOOK_ID,
+        "embeds": [
+            {
+                "author": {"name": "Shiny Charizard #6"},
+                "fields": [
+                    {"name": "ID", "value": "8812345", "inline": True},
+                    {
+                        "name": "Listed Price",
+                        "value": "<:PokeCoin:1> 1,250,000",
+                        "inline": True,
+                    },
+                    {
+                        "name": "Lowest Market",
+                        "value": "<:PokeCoin:1> 1,100,000",
+                        "inline": True,
+                    },
+                ],
+                "color": 0xFFD700,
+            }
+        ],
+    },
+    # ❀ Trades
+    {
+        "name": "trade_single",
+        "event": "create",
+        "author": "pokemeow",
+        "channel": "spawns",
+        "reply": True,
+        "content": ":handshake: mewlover received a Pikachu from pikafan!",
+    },
+    {
+        "name": "trade_multi",
+        "event": "create",
+        "author": "pokemeow",
+        "channel": "spawns",
+        "reply": True,
+        "content": "<:checkedbox:752302633141665812> Trade complete! :handshake:",
+        "embeds": [
+            {
+                "fields": [
+                    {
+                        "name": "<:team_logo:1> mewlover's Pokemon",
+                        "value": "<:pikachu:2> Pikachu x2\n<:eevee:3> Eevee",
+                    },
+                    {"name": "<:team_logo:1> pikafan's Pokemon", "value": "None"},
+                ]
+            }
+        ],
+    },
+    # ❀ Quests
+    {
+        "name": "quest_embed",
+        "event": "create",
+        "author": "pokemeow",
+        "channel": "spawns",
+        "reply": True,
+        "embeds": [
+            {
+                "title": "Complete your quests for rewards!",
+                "description": (
+                    "**Quest #1**: Catch 10 Pokemon\n"
+                    "**Quest #2**: Fish 5 Pokemon\n"
+                    "Your next quest is available <t:1761100000:R>"
+                ),
+                "footer": {"text": "Next quest in: 2H 15M 30S"},
+            }
+        ],
+    },
+    {
+        "name": "quest_complete",
+        "event": "create",
+        "author": "pokemeow",
+        "channel": "spawns",
+        "reply": True,
+        "content": ":notepad_spiral: **mewlover** completed the quest **Catch 10 Pokemon**!",
+    },
+    # ❀ Catchbot
+    {
+        "name": "catchbot_run",
+        "event": "create",
+        "author": "pokemeow",
+        "channel": "spawns",
+        "reply": True,
+        "content": (
+            "You spent <:PokeCoin:1> **25,000 PokeCoins** to run your catch bot.\n"
+            "It will return in **12h**"
+        ),
+    },
+    {
+        "name": "catchbot_return",
+        "event": "create",
+        "author": "pokemeow",
+        "channel": "spawns",
+        "reply": True,
+        "content": ":robot: I have returned with some Pokemon for you!",
+    },
+    {
+        "name": "catchbot_command",
+        "event": "create",
+        "author": "pokemeow",
+        "channel": "spawns",
+        "reply": True,
+        "embeds": [
+            {
+                "description": "It will be back on :clock: <t:1761120000:f>",
+                "fields": [
+                    {
+                        "name": ":battery: Your CatchBot is currently catching Pokemon for you!",
+                        "value": "42 Pokemon caught so far",
+                    }
+                ],
+            }
+        ],
+    },
+    {
+        "name": "checklist",
+        "event": "create",
+        "author": "pokemeow",
+        "channel": "spawns",
+        "reply": True,
+        "embeds": [
+            {
+                "description": (
+                    ":robot: Your catch bot will be back on <t:1761120000:f>\n"
+                    "Your next quest is available <t:1761100000:R>"
+                ),
+                "footer": {"text": "View your event checklist with ;e cl"},
+            }
+        ],
+    },
+    # ❀ Dex
+    {
+        "name": "dex",
+        "event": "create",
+        "author": "pokemeow",
+        "channel": "spawns",
+        "reply": True,
+        "embeds": [
+            {
+                "author": {"name": "Mewtwo #150"},
+                "description": ":dna: **Evolution line**\nMewtwo",
+                "fields": [
+                    {"name": "Owned", "value": "<:pokeball:1> 3"},
+                ],
+                "image": {"url": "https://example.invalid/mewtwo.png"},
+            }
+        ],
+    },
+    {
+        "name": "dex_edit",
+        "event": "edit",
+        "author": "pokemeow",
+        "channel": "spawns",
+        "reply": True,
+        "embeds": [
+            {
+                "author": {"name": "Mewtwo #150"},
+                "description": ":dna: **Evolution line**\nMewtwo",
+                "fields": [
+                    {"name": "Owned", "value": "<:pokeball:1> 4"},
+                ],
+            }
+        ],
+    },
+    # ❀ Background chatter (matches nothing, exercises the fast path)
+    {
+        "name": "chatter",
+        "event": "create",
+        "author": "trainer",
+        "channel": "spawns",
+        "content": "anyone seen a shiny eevee today? need one for my dex :3",
+    },
+    {
+        "name": "chatter_command",
+        "event": "create",
+        "author": "trainer",
+        "channel": "spawns",
+        "content": ";p",
+    },
+]
@@ -14,20 +14,24 @@ async def load_auction_reminder_cache(bot):
     """
     Loads auction reminders from the database into the global cache.
     """
-    auction_reminder_cache.clear()
     try:
         reminders = await fetch_all_auction_reminders(bot)
+
+        # Build aside, then swap in one synchronous step
+        new_cache = {}
         for reminder in reminders:
             ends_on = reminder["ends_on"]
             user_id = reminder["user_id"]
             user_name = reminder["user_name"]
             alarm_set = reminder["alarm_set"]
-            auction_reminder_cache[(ends_on, user_id)] = {
+            new_cache[(ends_on, user_id)] = {
                 "ends_on": ends_on,
                 "user_id": user_id,
                 "user_name": user_name,
                 "alarm_set": alarm_set,
             }
+        auction_reminder_cache.clear()
+        auction_reminder_cache.update(new_cache)
         pretty_log(
             tag="cache",
             message=f"Loaded {len(auction_reminder_cache)} auction reminders into cache.",
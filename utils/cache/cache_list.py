@@ -27,12 +27,33 @@ _market_alert_index: dict[tuple[str, int], dict] = (
 #         "channel_id": 987654321,
 #         "role_id": 192837465
 #     },
+# Secondary indexes (mirror _market_alert_index, kept in sync by market_alert_cache.py)
+_market_alert_by_pokemon: dict[str, dict[tuple[str, int, int], dict]] = (
+    {}
+)  # pokemon.lower() -> {index key: alert}
+_market_alert_by_dex: dict[int, dict[tuple[str, int, int], dict]] = (
+    {}
+)  # dex_number -> {index key: alert}
 
 # 🌸──────────────────────────────────────────────
 #      💜 Missing Pokémon Cache (Global) 💜
 # ───────────────────────────────────────────────
 missing_pokemon_cache: list[dict] = []
 _missing_pokemon_index: dict[tuple[int, int], dict] = {}  # key = (user_id, dex)
+# Secondary indexes (mirror _missing_pokemon_index, kept in sync by missing_pokemon_cache.py)
+_missing_pokemon_by_name: dict[str, dict[tuple[int, int], dict]] = (
+    {}
+)  # pokemon_name.lower() -> {(user_id, dex): entry}
+_missing_pokemon_by_dex: dict[int, dict[tuple[int, int], dict]] = (
+    {}
+)  # dex -> {(user_id, dex): entry}
+# Per-user views (same entry objects): O(1) "does this user miss X?" checks
+_missing_pokemon_by_user_name: dict[int, dict[str, dict[int, dict]]] = (
+    {}
+)  # user_id -> {pokemon_name.lower(): {dex: entry}}
+_missing_pokemon_by_user_dex: dict[int, dict[int, dict]] = (
+    {}
+)  # user_id -> {dex: entry}
 
 # 🌸──────────────────────────────────────────────
 # 💎 Market Value Cache - Global cache for market data
@@ -53,6 +74,7 @@ timer_cache = (
 utility_cache: dict[int, dict] = (
     {}
 )  # user_id -> {"user_name": str, "fish_rarity": str, "faction_ball_alert":str,}
+_utility_name_index: dict[str, set[int]] = {}  # user_name.strip() -> {user_id}
 
 # 🌸──────────────────────────────────────────────
 #      🩰 User Info Cache (Global) 🩰
@@ -60,6 +82,7 @@ utility_cache: dict[int, dict] = (
 user_info_cache: dict[int, dict] = (
     {}
 )  # user_id -> {"user_name": str, "faction": str, "patreon_tier": str, "max_quests": int, "current_quest_num": int}
+_user_info_name_index: dict[str, set[int]] = {}  # user_name.strip() -> {user_id}
 
 
 # 🌸──────────────────────────────────────────────
@@ -95,6 +118,9 @@ schedule_cache: dict[int, list[dict]] = {}  # user_id -> [schedules]
 #     ]
 # }
 #
+# Indexes kept in sync by utils/cache/schedule_cache.py
+_schedule_by_id: dict[int, dict] = {}  # reminder_id -> entry in schedule_cache
+_schedule_due_heap: list[tuple] = []  # (scheduled_on, seq, entry); stale entries skipped
 
 # 🌸──────────────────────────────────────────────
 # Daily Faction Ball Cache (Global)
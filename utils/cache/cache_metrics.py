@@ -0,0 +1,154 @@
+# 💜────────────────────────────────────────────
+#       🟣 Cache Metrics (cheap, sampled) 💜
+#   Entry counts come straight from len() (O(1));
+#   bytes are estimated from a small sample of
+#   entries, never a full deep walk.
+# 💜────────────────────────────────────────────
+import itertools
+import sys
+import tracemalloc
+
+from utils.cache.cache_list import (
+    auction_reminder_cache,
+    battle_tower_cache,
+    daily_faction_ball_cache,
+    market_alert_cache,
+    market_value_cache,
+    missing_pokemon_cache,
+    schedule_cache,
+    timer_cache,
+    user_info_cache,
+    utility_cache,
+)
+
+# 🗂 Every global cache reported in the summary log / admin command
+CACHE_REGISTRY: dict[str, object] = {
+    "Market Alerts": market_alert_cache,
+    "Missing Pokémon": missing_pokemon_cache,
+    "Timer Settings": timer_cache,
+    "Schedule Settings": schedule_cache,
+    "Utility Settings": utility_cache,
+    "User Info": user_info_cache,
+    "Daily Faction Balls": daily_faction_ball_cache,
+    "Battle Tower Users": battle_tower_cache,
+    "Auction Reminders": auction_reminder_cache,
+    "Market Values": market_value_cache,
+}
+
+# How many entries are deep-sized per cache when estimating
+SAMPLE_SIZE = 32
+
+
+# 💜────────────────────────────────────────────
+#       🟣 Deep Size (sample entries only) 💜
+# 💜────────────────────────────────────────────
+def get_deep_size(obj, seen=None):
+    """
+    Recursively calculate approximate memory size of an object in bytes.
+    Only meant for single cache entries — use estimate_cache_bytes for caches.
+    """
+    if seen is None:
+        seen = set()
+
+    obj_id = id(obj)
+    if obj_id in seen:
+        return 0
+    seen.add(obj_id)
+
+    size = sys.getsizeof(obj)
+
+    if isinstance(obj, dict):
+        size += sum(
+            get_deep_size(k, seen) + get_deep_size(v, seen) for k, v in obj.items()
+        )
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(get_deep_size(i, seen) for i in obj)
+
+    return size
+
+
+# 💜────────────────────────────────────────────
+#       🟣 Sampled Size Estimate 💜
+# 💜────────────────────────────────────────────
+def estimate_cache_bytes(cache, sample_size: int = SAMPLE_SIZE) -> int:
+    """
+    Estimate a cache's memory: container size + average deep size of an evenly
+    strided sample of entries × entry count. Exact when the cache is small.
+    """
+    count = len(cache)
+    total = sys.getsizeof(cache)
+    if not count:
+        return total
+
+    entries = cache.items() if isinstance(cache, dict) else cache
+    step = max(1, count // sample_size)
+    sample = list(itertools.islice(entries, 0, None, step))[:sample_size]
+
+    sampled = sum(get_deep_size(entry) for entry in sample)
+    return total + int(sampled / len(sample) * count)
+
+
+# 💜────────────────────────────────────────────
+#       🟣 Summary (counts + estimated KB) 💜
+# 💜────────────────────────────────────────────
+def cache_metrics_summary() -> list[dict]:
+    """Return [{"name", "entries", "approx_bytes"}] for every registered cache."""
+    return [
+        {
+            "name": name,
+            "entries": len(cache),
+            "approx_bytes": estimate_cache_bytes(cache),
+        }
+        for name, cache in CACHE_REGISTRY.items()
+    ]
+
+
+def format_cache_metrics_summary() -> str:
+    """One-line summary used by the central cache log."""
+    summary = cache_metrics_summary()
+    parts = [
+        f"{m['name']}: {m['entries']} ~{m['approx_bytes'] // 1024} KB" for m in summary
+    ]
+    total_kb = sum(m["approx_bytes"] for m in summary) // 1024
+    return f"({' + '.join(parts)} = Total Approx: ~{total_kb} KB)"
+
+
+# 💜────────────────────────────────────────────
+#       🟣 Exact Snapshots (tracemalloc, on demand) 💜
+# 💜────────────────────────────────────────────
+def start_memory_trace(frames: int = 1) -> bool:
+    """Start tracemalloc. Returns False if it was already tracing."""
+    if tracemalloc.is_tracing():
+        return False
+    tracemalloc.start(frames)
+    return True
+
+
+def stop_memory_trace() -> bool:
+    """Stop tracemalloc. Returns False if it was not tracing."""
+    if not tracemalloc.is_tracing():
+        return False
+    tracemalloc.stop()
+    return True
+
+
+def memory_snapshot_report(limit: int = 10) -> list[str]:
+    """
+    Exact allocation report from a tracemalloc snapshot, grouped by file.
+    Only allocations made since start_memory_trace() are visible.
+    """
+    if not tracemalloc.is_tracing():
+        return ["tracemalloc is not running — start a trace first."]
+
+    current, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        )
+    )
+    lines = [f"Traced now: {current / 1024:.1f} KB | Peak: {peak / 1024:.1f} KB"]
+    for stat in snapshot.statistics("filename")[:limit]:
+        frame = stat.traceback[0]
+        lines.append(f"{stat.size / 1024:.1f} KB in {stat.count} blocks — {frame.filename}")
+    return lines
@@ -3,20 +3,13 @@
 #       🎀 Calls all individual caches 🎀
 # 💜────────────────────────────────────────────
 
+import asyncio
+import time
+
 from utils.cache.auction_reminder_cache import load_auction_reminder_cache
 from utils.cache.battle_tower_cache import load_battle_tower_cache
-from utils.cache.cache_list import (
-    auction_reminder_cache,
-    battle_tower_cache,
-    daily_faction_ball_cache,
-    market_alert_cache,
-    market_value_cache,
-    missing_pokemon_cache,
-    schedule_cache,
-    timer_cache,
-    user_info_cache,
-    utility_cache,
-)
+from utils.cache.cache_list import market_value_cache
+from utils.cache.cache_metrics import format_cache_metrics_summary
 from utils.cache.daily_fa_ball_cache import load_daily_faction_ball_cache
 from utils.cache.market_alert_cache import load_market_alert_cache
 from utils.cache.missing_pokemon_cache import load_missing_pokemon_cache
@@ -24,7 +17,10 @@ from utils.cache.schedule_cache import load_schedule_cache
 from utils.cache.timers_cache import load_timer_cache
 from utils.cache.user_info_cache import load_user_info_cache
 from utils.cache.utility_cache import load_utility_cache
-from utils.db.market_value_db_func import load_market_cache_from_db
+from utils.db.market_value_db_func import (
+    load_market_cache_delta,
+    load_market_cache_from_db,
+)
 from utils.logs.pretty_log import pretty_log
 
 
@@ -34,58 +30,45 @@ from utils.logs.pretty_log import pretty_log
 async def load_all_caches(bot):
     """
     Centralized function to load all caches.
-    Calls each cache loader and logs memory summary.
+    Runs every cache loader concurrently and logs memory summary.
     """
     try:
-        # 🌸 Load Market Alerts
-        await load_market_alert_cache(bot)
-
-        # 🌸 Load Missing Pokémon
-        await load_missing_pokemon_cache(bot)
-
-        # 🌸 Load Timer Settings
-        await load_timer_cache(bot)
-
-        # 🌸 Load Schedule Settings
-        await load_schedule_cache(bot)
-
-        # 🌸 Load Utility Settings
-        await load_utility_cache(bot)
-
-        # 🌸 Load User Info
-        await load_user_info_cache(bot)
-
-        # 🌸 Load Market Value Cache
-        await load_market_cache_from_db(bot)
-
-        # 🌸 Load Daily Faction Ball Cache
-        await load_daily_faction_ball_cache(bot)
-
-        # 🌸 Load Battle Tower Cache
-        await load_battle_tower_cache(bot)
-
-        # 🌸 Load Auction Reminder Cache
-        await load_auction_reminder_cache(bot)
-
-        # 🎀 Unified summary log
+        # 🌸 Run every loader concurrently against the pool; each one fetches
+        # first and swaps its cache in a single synchronous step
+        loaders = {
+            "Market Alerts": load_market_alert_cache,
+            "Missing Pokémon": load_missing_pokemon_cache,
+            "Timer Settings": load_timer_cache,
+            "Schedule Settings": load_schedule_cache,
+            "Utility Settings": load_utility_cache,
+            "User Info": load_user_info_cache,
+            "Market Values": load_market_cache_from_db,
+            "Daily Faction Balls": load_daily_faction_ball_cache,
+            "Battle Tower": load_battle_tower_cache,
+            "Auction Reminders": load_auction_reminder_cache,
+        }
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(loader(bot) for loader in loaders.values()), return_exceptions=True
+        )
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        for name, result in zip(loaders, results):
+            if isinstance(result, BaseException):
+                pretty_log(
+                    tag="error",
+                    label="🦋 CENTRAL CACHE",
+                    message=f"Failed to load {name} cache: {result}",
+                )
+
+        # 🎀 Unified summary log (sampled size estimates, no deep walk)
         pretty_log(
             tag="",
             label="🦋 CENTRAL CACHE",
             message=(
-                f"All caches refreshed and loaded "
-                f"(Market Alerts: {len(market_alert_cache)} ~{get_deep_size(market_alert_cache)//1024} KB + "
-                f"Missing Pokémon: {len(missing_pokemon_cache)} ~{get_deep_size(missing_pokemon_cache)//1024} KB +"
-                f"Timer Settings: {len(timer_cache)} ~{get_deep_size(timer_cache)//1024} KB) +"
-                f"Schedule Settings: {len(schedule_cache)} ~{get_deep_size(schedule_cache)//1024} KB +"
-                f"Utility Settings: {len(utility_cache)} ~{get_deep_size(utility_cache)//1024} KB + "
-                f"User Info: {len(user_info_cache)} ~{get_deep_size(user_info_cache)//1024} KB + "
-                f"Daily Faction Balls: {len(daily_faction_ball_cache)} ~{get_deep_size(daily_faction_ball_cache)//1024} KB + "
-                f"Battle Tower Users: {len(battle_tower_cache)} ~{get_deep_size(battle_tower_cache)//1024} KB + "
-                f"Auction Reminders: {len(auction_reminder_cache)} ~{get_deep_size(auction_reminder_cache)//1024} KB + "
-                f"Market Values: {len(market_value_cache)} ~{get_deep_size(market_value_cache)//1024} KB = "
-                f"Total Approx: ~{(get_deep_size(market_alert_cache) + get_deep_size(missing_pokemon_cache) + get_deep_size(timer_cache) + get_deep_size(schedule_cache) + get_deep_size(utility_cache) + get_deep_size(user_info_cache) + get_deep_size(daily_faction_ball_cache) + get_deep_size(market_value_cache))//1024} KB"
+                f"All caches refreshed and loaded in {elapsed_ms:.0f} ms "
+                f"{format_cache_metrics_summary()}"
             ),
-        ),
+        )
     except Exception as e:
         pretty_log(
             tag="error",
@@ -95,30 +78,27 @@ async def load_all_caches(bot):
 
 
 # 💜────────────────────────────────────────────
-#       🟣 Memory Size Helper 💜
+#     🟣 Delta Refresh (no full reload)
 # 💜────────────────────────────────────────────
-import sys
-
-
-def get_deep_size(obj, seen=None):
+async def refresh_caches_delta(bot):
     """
-    Recursively calculate approximate memory size of an object in bytes.
+    Light hourly refresh used between full reloads.
+    - Market values: only rows whose last_updated moved past the high-water mark.
+    - Settings/alerts/missing caches: left untouched, they are write-through
+      (every DB write helper updates its cache too), so only the periodic
+      full reload is needed to catch out-of-band edits.
+    Nothing is cleared, so listeners never see a half-empty cache.
     """
-    if seen is None:
-        seen = set()
-
-    obj_id = id(obj)
-    if obj_id in seen:
-        return 0
-    seen.add(obj_id)
-
-    size = sys.getsizeof(obj)
-
-    if isinstance(obj, dict):
-        size += sum(
-            get_deep_size(k, seen) + get_deep_size(v, seen) for k, v in obj.items()
+    try:
+        applied = await load_market_cache_delta(bot)
+        pretty_log(
+            tag="",
+            label="🦋 CENTRAL CACHE",
+            message=f"Delta refresh applied {applied} changed market value(s) (Market Values: {len(market_value_cache)})",
+        )
+    except Exception as e:
+        pretty_log(
+            tag="error",
+            label="🦋 CENTRAL CACHE",
+            message=f"Failed delta cache refresh: {e}",
         )
-    elif isinstance(obj, (list, tuple, set, frozenset)):
-        size += sum(get_deep_size(i, seen) for i in obj)
-
-    return size
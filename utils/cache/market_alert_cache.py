@@ -8,14 +8,24 @@ from utils.group_func.market_alert.market_alert_db_func import (
     fetch_active_market_alerts,
 )
 from utils.logs.pretty_log import pretty_log
-from utils.cache.cache_list import market_alert_cache, _market_alert_index
+from utils.cache.cache_metrics import estimate_cache_bytes
+from utils.cache.cache_list import (
+    _market_alert_by_dex,
+    _market_alert_by_pokemon,
+    _market_alert_index,
+    market_alert_cache,
+)
 
 # -------------------- Load Cache --------------------
 async def load_market_alert_cache(bot):
+    # Fetch first, then rebuild in one synchronous step (no await in between)
+    # so listeners never see an empty cache mid-refresh
+    active_alerts = await fetch_active_market_alerts(bot)
+
     market_alert_cache.clear()
     _market_alert_index.clear()
-
-    active_alerts = await fetch_active_market_alerts(bot)
+    _market_alert_by_pokemon.clear()
+    _market_alert_by_dex.clear()
 
     for alert in active_alerts:
         alert_entry = {
@@ -34,16 +44,58 @@ async def load_market_alert_cache(bot):
             alert_entry["channel_id"],
             alert_entry["user_id"],
         )
-        _market_alert_index[key] = alert_entry
+        _index_put(key, alert_entry)
 
     pretty_log(
         tag="market_alert",
-        message=f"Market alert cache loaded: {len(market_alert_cache)} entries, size: {get_cache_size(market_alert_cache)} bytes",
+        message=f"Market alert cache loaded: {len(market_alert_cache)} entries, size: ~{estimate_cache_bytes(market_alert_cache)} bytes",
 
     )
 
     return market_alert_cache
 
+# -------------------- Secondary Index Helpers --------------------
+def _index_put(key: tuple[str, int, int], alert: dict):
+    """Store alert under key in the main index and the pokemon/dex indexes."""
+    _index_pop(key)
+    _market_alert_index[key] = alert
+    _market_alert_by_pokemon.setdefault(key[0], {})[key] = alert
+    dex = alert.get("dex_number")
+    if dex is not None:
+        _market_alert_by_dex.setdefault(dex, {})[key] = alert
+
+
+def _index_pop(key: tuple[str, int, int]) -> dict | None:
+    """Drop key from the main index and the pokemon/dex indexes."""
+    alert = _market_alert_index.pop(key, None)
+    if alert is None:
+        return None
+    bucket = _market_alert_by_pokemon.get(key[0])
+    if bucket is not None:
+        bucket.pop(key, None)
+        if not bucket:
+            del _market_alert_by_pokemon[key[0]]
+    dex = alert.get("dex_number")
+    bucket = _market_alert_by_dex.get(dex)
+    if bucket is not None:
+        bucket.pop(key, None)
+        if not bucket:
+            del _market_alert_by_dex[dex]
+    return alert
+
+
+def fetch_alerts_for_pokemon(pokemon_name: str) -> list[dict]:
+    """All cached alerts for a Pokémon name (case-insensitive)."""
+    bucket = _market_alert_by_pokemon.get(pokemon_name.lower())
+    return list(bucket.values()) if bucket else []
+
+
+def fetch_alerts_for_dex(dex_number: int) -> list[dict]:
+    """All cached alerts for a dex number."""
+    bucket = _market_alert_by_dex.get(dex_number)
+    return list(bucket.values()) if bucket else []
+
+
 # -------------------- User Alert Count --------------------
 def get_user_alert_count(user_id: int) -> int:
     """
@@ -70,7 +122,10 @@ def insert_alert(alert: dict):
 
     if existing:
         # Update existing alert (sync both index + list)
+        # Unindex under the old dex_number before it's overwritten
+        _index_pop(key)
         existing.update(alert)
+        _index_put(key, existing)
         # Ensure list entry is updated too
         for i, entry in enumerate(market_alert_cache):
             if (
@@ -86,7 +141,7 @@ def insert_alert(alert: dict):
     else:
         # Insert new alert
         market_alert_cache.append(alert)
-        _market_alert_index[key] = alert
+        _index_put(key, alert)
         _log_cache_size(
             f"Inserted alert for {alert['pokemon']} in channel {alert['channel_id']} (user {alert['user_id']})"
         )
@@ -117,13 +172,10 @@ def remove_alert(pokemon_name: str, channel_id: int, user_id: int):
     market_alert_cache[:] = new_list
 
     # ---- Then remove from index (clean up any stale keys) ----
-    keys_to_remove = [
-        k
-        for k in list(_market_alert_index.keys())
-        if k[0] == p_lower and k[1] == channel_id and k[2] == user_id
-    ]
+    key = (p_lower, channel_id, user_id)
+    keys_to_remove = [key] if key in _market_alert_index else []
     for k in keys_to_remove:
-        _market_alert_index.pop(k, None)
+        _index_pop(k)
 
     if removed_any or keys_to_remove:
         _log_cache_size(
@@ -144,7 +196,7 @@ def remove_all_alerts_from_user(user_id: int):
     # Remove from index
     keys_to_remove = [k for k in _market_alert_index if k[2] == user_id]
     for key in keys_to_remove:
-        _market_alert_index.pop(key, None)
+        _index_pop(key)
 
     _log_cache_size(f"Removed all alerts for user {user_id}")
 
@@ -203,10 +255,10 @@ def update_user_alerts_in_cache(
             ):
                 keys_to_remove.append(key)
         for key in keys_to_remove:
-            _market_alert_index.pop(key, None)
+            _index_pop(key)
 
         new_key = (alert["pokemon"].lower(), alert["channel_id"], alert["user_id"])
-        _market_alert_index[new_key] = alert
+        _index_put(new_key, alert)
 
         updated += 1
 
@@ -218,7 +270,7 @@ def update_user_alerts_in_cache(
 
 # -------------------- Internal Logging --------------------
 def _log_cache_size(action: str):
-    size_bytes = get_cache_size(market_alert_cache)
+    size_bytes = estimate_cache_bytes(market_alert_cache)
     size_kb = size_bytes / 1024
     pretty_log(
         tag="",
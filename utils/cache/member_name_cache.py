@@ -0,0 +1,111 @@
+# 🟣────────────────────────────────────────────
+#        💜 Guild Member Name Index 💜
+#   casefolded username / display name → member ids,
+#   kept current by the member_index_listener cog
+# ─────────────────────────────────────────────
+
+import discord
+
+from utils.logs.pretty_log import pretty_log
+
+# guild_id → {casefolded name: {member_id: None}} (dict keeps join order)
+_member_names: dict[int, dict[str, dict[int, None]]] = {}
+# (guild_id, member_id) → keys indexed for that member (for clean removal)
+_member_keys: dict[tuple[int, int], tuple[str, ...]] = {}
+
+
+def _keys_for(member: discord.Member) -> tuple[str, ...]:
+    keys = {member.name.casefold()}
+    if member.display_name:
+        keys.add(member.display_name.casefold())
+    return tuple(keys)
+
+
+# ❀─────────────────────────────────────────❀
+#      💖 Index Maintenance
+# ❀─────────────────────────────────────────❀
+def index_member(member: discord.Member):
+    """Add or refresh one member's name keys."""
+    unindex_member(member.guild.id, member.id)
+    names = _member_names.setdefault(member.guild.id, {})
+    keys = _keys_for(member)
+    for key in keys:
+        names.setdefault(key, {})[member.id] = None
+    _member_keys[(member.guild.id, member.id)] = keys
+
+
+def unindex_member(guild_id: int, member_id: int):
+    """Drop a member's name keys (leave/kick/ban or before a rename)."""
+    keys = _member_keys.pop((guild_id, member_id), None)
+    if not keys:
+        return
+    names = _member_names.get(guild_id, {})
+    for key in keys:
+        bucket = names.get(key)
+        if bucket is not None:
+            bucket.pop(member_id, None)
+            if not bucket:
+                del names[key]
+
+
+def index_guild(guild: discord.Guild):
+    """(Re)build the index for every cached member of a guild."""
+    drop_guild(guild.id)
+    _member_names[guild.id] = {}
+    for member in guild.members:
+        index_member(member)
+
+
+def drop_guild(guild_id: int):
+    for key in [k for k in _member_keys if k[0] == guild_id]:
+        del _member_keys[key]
+    _member_names.pop(guild_id, None)
+
+
+def index_all_guilds(bot):
+    for guild in bot.guilds:
+        index_guild(guild)
+    pretty_log(
+        tag="cache",
+        message=f"Indexed member names for {len(bot.guilds)} guild(s) ({len(_member_keys)} members)",
+    )
+
+
+# ❀─────────────────────────────────────────❀
+#      💖 Resolve Member by Name
+# ❀─────────────────────────────────────────❀
+def find_member_by_name(
+    guild: discord.Guild,
+    name: str,
+    *,
+    case_sensitive: bool = False,
+    match_name: bool = True,
+    match_display_name: bool = True,
+) -> discord.Member | None:
+    """
+    Resolve a PokéMeow-style username to a guild member in O(1).
+    Matches username and/or display name, case-insensitive by default.
+    """
+    if guild is None or not name:
+        return None
+    if guild.id not in _member_names:
+        index_guild(guild)
+
+    bucket = _member_names[guild.id].get(name.casefold())
+    if not bucket:
+        return None
+
+    target = name if case_sensitive else name.lower()
+    for member_id in bucket:
+        member = guild.get_member(member_id)
+        if member is None:
+            continue
+        candidates = []
+        if match_name:
+            candidates.append(member.name)
+        if match_display_name and member.display_name:
+            candidates.append(member.display_name)
+        for candidate in candidates:
+            if (candidate if case_sensitive else candidate.lower()) == target:
+                return member
+    return None
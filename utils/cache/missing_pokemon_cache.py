@@ -4,7 +4,14 @@
 
 import sys
 
-from utils.cache.cache_list import _missing_pokemon_index, missing_pokemon_cache
+from utils.cache.cache_list import (
+    _missing_pokemon_by_dex,
+    _missing_pokemon_by_name,
+    _missing_pokemon_by_user_dex,
+    _missing_pokemon_by_user_name,
+    _missing_pokemon_index,
+    missing_pokemon_cache,
+)
 from utils.db.missing_pokemon_db_func import fetch_all_missing
 from utils.logs.pretty_log import pretty_log
 
@@ -14,10 +21,15 @@ from utils.logs.pretty_log import pretty_log
 # ❀─────────────────────────────────────────❀
 async def load_missing_pokemon_cache(bot):
     """Load all missing Pokémon from DB into cache."""
+    # Fetch first, then rebuild in one synchronous step (no await in between)
+    all_missing = await fetch_all_missing(bot)
+
     missing_pokemon_cache.clear()
     _missing_pokemon_index.clear()
-
-    all_missing = await fetch_all_missing(bot)
+    _missing_pokemon_by_name.clear()
+    _missing_pokemon_by_dex.clear()
+    _missing_pokemon_by_user_name.clear()
+    _missing_pokemon_by_user_dex.clear()
 
     for row in all_missing:
         entry = {
@@ -30,7 +42,7 @@ async def load_missing_pokemon_cache(bot):
         }
         missing_pokemon_cache.append(entry)
         key = (entry["user_id"], entry["dex"])
-        _missing_pokemon_index[key] = entry
+        _index_put(key, entry)
 
     pretty_log(
         tag="missing",
@@ -39,6 +51,82 @@ async def load_missing_pokemon_cache(bot):
     return missing_pokemon_cache
 
 
+# ❀─────────────────────────────────────────❀
+#      💖 Secondary Index Helpers
+# ❀─────────────────────────────────────────❀
+def _normalize_name(pokemon_name: str | None) -> str:
+    return (pokemon_name or "").strip().lower()
+
+
+def _index_put(key: tuple[int, int], entry: dict):
+    """Store entry under key in the main, name/dex and per-user indexes."""
+    _index_pop(key)
+    user_id, dex = key
+    name = _normalize_name(entry.get("pokemon_name"))
+    _missing_pokemon_index[key] = entry
+    _missing_pokemon_by_name.setdefault(name, {})[key] = entry
+    _missing_pokemon_by_dex.setdefault(dex, {})[key] = entry
+    _missing_pokemon_by_user_dex.setdefault(user_id, {})[dex] = entry
+    _missing_pokemon_by_user_name.setdefault(user_id, {}).setdefault(name, {})[
+        dex
+    ] = entry
+
+
+def _drop(index: dict, outer, inner):
+    bucket = index.get(outer)
+    if bucket is not None:
+        bucket.pop(inner, None)
+        if not bucket:
+            del index[outer]
+
+
+def _index_pop(key: tuple[int, int]) -> dict | None:
+    """Drop key from the main, name/dex and per-user indexes."""
+    entry = _missing_pokemon_index.pop(key, None)
+    if entry is None:
+        return None
+    user_id, dex = key
+    name = _normalize_name(entry.get("pokemon_name"))
+    _drop(_missing_pokemon_by_name, name, key)
+    _drop(_missing_pokemon_by_dex, dex, key)
+    _drop(_missing_pokemon_by_user_dex, user_id, dex)
+    user_names = _missing_pokemon_by_user_name.get(user_id)
+    if user_names is not None:
+        _drop(user_names, name, dex)
+        if not user_names:
+            del _missing_pokemon_by_user_name[user_id]
+    return entry
+
+
+# ❀─────────────────────────────────────────❀
+#      💖 Fetch Missing Entries by Pokémon (All Users)
+# ❀─────────────────────────────────────────❀
+def fetch_missing_for_pokemon(pokemon_name: str) -> list[dict]:
+    """All users' missing entries for a Pokémon name (case-insensitive)."""
+    bucket = _missing_pokemon_by_name.get(pokemon_name.strip().lower())
+    return list(bucket.values()) if bucket else []
+
+
+def fetch_missing_for_dex(dex: int) -> list[dict]:
+    """All users' missing entries for a dex number."""
+    bucket = _missing_pokemon_by_dex.get(dex)
+    return list(bucket.values()) if bucket else []
+
+
+def users_missing_pokemon(pokemon_name: str) -> set[int]:
+    """Reverse index: user_ids that have this Pokémon in their missing list."""
+    bucket = _missing_pokemon_by_name.get(_normalize_name(pokemon_name))
+    return {user_id for user_id, _ in bucket} if bucket else set()
+
+
+def _user_name_bucket(user_id: int, pokemon_name: str) -> dict[int, dict] | None:
+    """{dex: entry} for one user's missing Pokémon with this name."""
+    user_names = _missing_pokemon_by_user_name.get(user_id)
+    if not user_names:
+        return None
+    return user_names.get(_normalize_name(pokemon_name))
+
+
 # ❀─────────────────────────────────────────❀
 #      💖 Check if Pokémon Exists for User (Cache)
 # ❀─────────────────────────────────────────❀
@@ -49,19 +137,13 @@ def is_pokemon_in_user_cache(user_id: int, pokemon_name: str) -> bool:
     Returns:
         bool: True if Pokémon found for user, False otherwise.
     """
-    target = pokemon_name.strip().lower()
-
-    for entry in missing_pokemon_cache:
-        if (
-            entry.get("user_id") == user_id
-            and entry.get("pokemon_name", "").lower() == target
-        ):
-            pretty_log(
-                tag="missing",
-                label="POKÉMON CHECKER",
-                message=f"Found '{pokemon_name}' in cache for user_id={user_id} 💖",
-            )
-            return True
+    if _user_name_bucket(user_id, pokemon_name):
+        pretty_log(
+            tag="missing",
+            label="POKÉMON CHECKER",
+            message=f"Found '{pokemon_name}' in cache for user_id={user_id} 💖",
+        )
+        return True
 
     pretty_log(
         tag="missing",
@@ -79,12 +161,8 @@ def find_pokemon_in_user_cache(user_id: int, pokemon_name: str) -> list[dict]:
     Fetch all cache entries matching a Pokémon name (case-insensitive) for a specific user.
     Returns a list of matching dict entries.
     """
-    target = pokemon_name.strip().lower()
-    matches = [
-        e
-        for e in missing_pokemon_cache
-        if e.get("user_id") == user_id and e.get("pokemon_name", "").lower() == target
-    ]
+    bucket = _user_name_bucket(user_id, pokemon_name)
+    matches = list(bucket.values()) if bucket else []
 
     pretty_log(
         tag="missing",
@@ -101,19 +179,15 @@ def find_pokemon_in_user_cache_single(user_id: int, pokemon_name: str) -> dict |
     Fetch a single Pokémon entry (case-insensitive) for a specific user.
     Returns the matching dict if found, otherwise None.
     """
-    target = pokemon_name.strip().lower()
-
-    for entry in missing_pokemon_cache:
-        if (
-            entry.get("user_id") == user_id
-            and entry.get("pokemon_name", "").lower() == target
-        ):
-            pretty_log(
-                tag="missing",
-                label="POKÉMON CHECKER",
-                message=f"Found '{pokemon_name}' in cache for user_id={user_id} 🌸",
-            )
-            return entry
+    bucket = _user_name_bucket(user_id, pokemon_name)
+    if bucket:
+        entry = next(iter(bucket.values()))
+        pretty_log(
+            tag="missing",
+            label="POKÉMON CHECKER",
+            message=f"Found '{pokemon_name}' in cache for user_id={user_id} 🌸",
+        )
+        return entry
 
     pretty_log(
         tag="missing",
@@ -140,15 +214,13 @@ def bulk_upsert_missing_pokemon_cache(entries: list[dict]):
         existing = _missing_pokemon_index.get(key)
 
         if existing:
-            # Update existing cache entry
+            # Update existing cache entry in place (name may have changed → reindex)
+            _index_pop(key)
             existing.update(entry)
-            for i, e in enumerate(missing_pokemon_cache):
-                if e["user_id"] == entry["user_id"] and e["dex"] == entry["dex"]:
-                    missing_pokemon_cache[i] = existing
-                    break
+            _index_put(key, existing)
         else:
             missing_pokemon_cache.append(entry)
-            _missing_pokemon_index[key] = entry
+            _index_put(key, entry)
 
 
 # ❀─────────────────────────────────────────❀
@@ -160,18 +232,16 @@ def insert_missing(entry: dict):
     existing = _missing_pokemon_index.get(key)
 
     if existing:
+        _index_pop(key)
         existing.update(entry)
-        for i, e in enumerate(missing_pokemon_cache):
-            if e["user_id"] == entry["user_id"] and e["dex"] == entry["dex"]:
-                missing_pokemon_cache[i] = existing
-                break
+        _index_put(key, existing)
         pretty_log(
             tag="missing",
             message=f"Updated missing Pokémon for {entry['user_name']} (Dex {entry['dex']})",
         )
     else:
         missing_pokemon_cache.append(entry)
-        _missing_pokemon_index[key] = entry
+        _index_put(key, entry)
         pretty_log(
             tag="missing",
             message=f"Inserted missing Pokémon for {entry['user_name']} (Dex {entry['dex']})",
@@ -183,13 +253,13 @@ def insert_missing(entry: dict):
 # ❀─────────────────────────────────────────❀
 def remove_all_missing_for_user_cache(user_id: int):
     """Remove all missing Pokémon entries for a user from the cache."""
-    missing_pokemon_cache[:] = [
-        e for e in missing_pokemon_cache if e["user_id"] != user_id
-    ]
-
-    keys_to_remove = [k for k in _missing_pokemon_index if k[0] == user_id]
-    for key in keys_to_remove:
-        _missing_pokemon_index.pop(key, None)
+    user_dexes = list(_missing_pokemon_by_user_dex.get(user_id, ()))
+    if user_dexes:
+        missing_pokemon_cache[:] = [
+            e for e in missing_pokemon_cache if e["user_id"] != user_id
+        ]
+    for dex in user_dexes:
+        _index_pop((user_id, dex))
 
     pretty_log(
         tag="missing",
@@ -205,14 +275,13 @@ def remove_missing(user_id: int, dex: int):
     key = (user_id, dex)
     removed_any = False
 
-    missing_pokemon_cache[:] = [
-        e
-        for e in missing_pokemon_cache
-        if not (e["user_id"] == user_id and e["dex"] == dex)
-    ]
-
-    if key in _missing_pokemon_index:
-        _missing_pokemon_index.pop(key)
+    entry = _index_pop(key)
+    if entry is not None:
+        # Entries are unique per (user_id, dex); drop that exact object
+        for i, e in enumerate(missing_pokemon_cache):
+            if e is entry:
+                del missing_pokemon_cache[i]
+                break
         removed_any = True
 
     msg = (
@@ -236,7 +305,7 @@ def get_missing(user_id: int, dex: int) -> dict | None:
 # ❀─────────────────────────────────────────❀
 def fetch_user_missing_from_cache(user_id: int) -> list[dict]:
     """Fetch all missing Pokémon for a specific user."""
-    return [e for e in missing_pokemon_cache if e["user_id"] == user_id]
+    return list(_missing_pokemon_by_user_dex.get(user_id, {}).values())
 
 
 # ❀─────────────────────────────────────────❀
@@ -0,0 +1,51 @@
+# 🟣────────────────────────────────────────────
+#        💜 user_name → user_id Reverse Index 💜
+#   Shared by utility_cache and user_info_cache.
+#   Index shape: normalized name → {user_id, ...}
+# ─────────────────────────────────────────────
+
+from utils.logs.pretty_log import pretty_log
+
+
+def normalize_user_name(user_name: str | None) -> str:
+    return (user_name or "").strip()
+
+
+def index_add(index: dict[str, set[int]], user_name: str | None, user_id: int):
+    name = normalize_user_name(user_name)
+    if name:
+        index.setdefault(name, set()).add(user_id)
+
+
+def index_remove(index: dict[str, set[int]], user_name: str | None, user_id: int):
+    name = normalize_user_name(user_name)
+    ids = index.get(name)
+    if ids is not None:
+        ids.discard(user_id)
+        if not ids:
+            del index[name]
+
+
+def index_rebuild(index: dict[str, set[int]], cache: dict[int, dict]):
+    index.clear()
+    for user_id, data in cache.items():
+        index_add(index, data.get("user_name"), user_id)
+
+
+def index_lookup(index: dict[str, set[int]], user_name: str, label: str) -> int | None:
+    """
+    Resolve a name to exactly one user_id.
+    Ambiguous names (shared by several users) return None and are logged,
+    instead of silently picking whichever user happened to come first.
+    """
+    ids = index.get(normalize_user_name(user_name))
+    if not ids:
+        return None
+    if len(ids) > 1:
+        pretty_log(
+            tag="warn",
+            message=f"Ambiguous user_name '{user_name}' matches {len(ids)} users: {sorted(ids)}",
+            label=label,
+        )
+        return None
+    return next(iter(ids))
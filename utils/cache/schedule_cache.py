@@ -1,6 +1,66 @@
+import heapq
+import itertools
+
 from utils.logs.pretty_log import pretty_log
 from utils.db.schedule_db_func import fetch_all_schedules, fetch_user_schedules
-from utils.cache.cache_list import schedule_cache
+from utils.cache.cache_list import (
+    schedule_cache,
+    _schedule_by_id,
+    _schedule_due_heap,
+)
+
+# Tie-breaker so heap tuples never compare entry dicts
+_heap_seq = itertools.count()
+# Rebuild the heap once stale entries outnumber live ones by this much
+HEAP_COMPACT_SLACK = 256
+
+
+def _make_entry(row: dict) -> dict:
+    return {
+        "reminder_id": row.get("reminder_id"),
+        "user_id": row.get("user_id"),
+        "user_name": row.get("user_name"),
+        "type": row.get("type"),
+        "scheduled_on": row.get("scheduled_on"),
+        "channel_id": row.get("channel_id"),
+    }
+
+
+# 🌸────────────────────────────────────────────
+#        Index Helpers
+#   Entries are never mutated in place; an update swaps
+#   in a new dict, so a heap tuple is live only while its
+#   entry is still the one indexed under its reminder_id.
+# ─────────────────────────────────────────────
+def _index_entry(entry: dict):
+    reminder_id = entry["reminder_id"]
+    if reminder_id is None or entry["scheduled_on"] is None:
+        return
+    _schedule_by_id[reminder_id] = entry
+    heapq.heappush(
+        _schedule_due_heap, (entry["scheduled_on"], next(_heap_seq), entry)
+    )
+
+
+def _unindex_entry(entry: dict):
+    if _schedule_by_id.get(entry["reminder_id"]) is entry:
+        del _schedule_by_id[entry["reminder_id"]]
+    if len(_schedule_due_heap) > 2 * len(_schedule_by_id) + HEAP_COMPACT_SLACK:
+        _schedule_due_heap[:] = [t for t in _schedule_due_heap if _is_live(t)]
+        heapq.heapify(_schedule_due_heap)
+
+
+def _is_live(item: tuple) -> bool:
+    entry = item[2]
+    return _schedule_by_id.get(entry["reminder_id"]) is entry
+
+
+def _rebuild_indexes():
+    _schedule_by_id.clear()
+    _schedule_due_heap.clear()
+    for reminders in schedule_cache.values():
+        for entry in reminders:
+            _index_entry(entry)
 
 
 # 🌸────────────────────────────────────────────
@@ -11,26 +71,22 @@ async def load_schedule_cache(bot):
     Load all user schedule settings into memory cache.
     Uses the fetch_all_schedules DB function.
     """
-    schedule_cache.clear()
-
     rows = await fetch_all_schedules(bot)
+
+    # Build aside, then swap in one synchronous step
+    new_cache = {}
     for row in rows:
         user_id = row["user_id"]
 
         # Initialize user's schedule list if not exists
-        if user_id not in schedule_cache:
-            schedule_cache[user_id] = []
+        if user_id not in new_cache:
+            new_cache[user_id] = []
 
         # Add reminder to user's schedule list
-        schedule_cache[user_id].append(
-            {
-                "reminder_id": row.get("reminder_id"),
-                "user_id": row.get("user_id"),
-                "user_name": row.get("user_name"),
-                "type": row.get("type"),
-                "scheduled_on": row.get("scheduled_on"),
-            }
-        )
+        new_cache[user_id].append(_make_entry(row))
+    schedule_cache.clear()
+    schedule_cache.update(new_cache)
+    _rebuild_indexes()
 
     # 🌸 Debug log
     total_reminders = sum(len(reminders) for reminders in schedule_cache.values())
@@ -53,6 +109,7 @@ def set_schedule_cached(
     user_name: str,
     type_: str,
     scheduled_on: int,
+    channel_id: int = None,
 ):
     """
     Add or update a reminder in the cache.
@@ -75,14 +132,17 @@ def set_schedule_cached(
             "user_name": user_name,
             "type": type_,
             "scheduled_on": scheduled_on,
+            "channel_id": channel_id,
         }
 
         if existing_index is not None:
             # Update existing reminder
+            _unindex_entry(schedule_cache[user_id][existing_index])
             schedule_cache[user_id][existing_index] = new_reminder
         else:
             # Add new reminder
             schedule_cache[user_id].append(new_reminder)
+        _index_entry(new_reminder)
 
         pretty_log(
             tag="cache",
@@ -114,15 +174,9 @@ async def fetch_user_schedules_cached(bot, user_id: int) -> list[dict]:
             # Add to cache for future use
             schedule_cache[user_id] = []
             for reminder in db_results:
-                schedule_cache[user_id].append(
-                    {
-                        "reminder_id": reminder.get("reminder_id"),
-                        "user_id": reminder.get("user_id"),
-                        "user_name": reminder.get("user_name"),
-                        "type": reminder.get("type"),
-                        "scheduled_on": reminder.get("scheduled_on"),
-                    }
-                )
+                entry = _make_entry(reminder)
+                schedule_cache[user_id].append(entry)
+                _index_entry(entry)
             return schedule_cache[user_id].copy()
 
         return []
@@ -148,11 +202,13 @@ def remove_schedule_cached(user_id: int, type_: str):
             return
 
         # Filter out the specific type
-        schedule_cache[user_id] = [
-            reminder
-            for reminder in schedule_cache[user_id]
-            if reminder["type"] != type_
-        ]
+        kept = []
+        for reminder in schedule_cache[user_id]:
+            if reminder["type"] == type_:
+                _unindex_entry(reminder)
+            else:
+                kept.append(reminder)
+        schedule_cache[user_id] = kept
 
         # Remove user entirely if no reminders left
         if not schedule_cache[user_id]:
@@ -176,20 +232,30 @@ def remove_schedule_cached(user_id: int, type_: str):
 def get_due_reminders_cached(current_timestamp: int) -> list[dict]:
     """
     Get all reminders that are due from cache (scheduled_on <= current_timestamp).
-    Returns a flat list of reminder dictionaries.
+    Returns a flat list of reminder dictionaries, earliest first.
+    Only walks the due part of the heap; entries stay cached until removed.
     """
     try:
-        due_reminders = []
-
-        for user_id, reminders in schedule_cache.items():
-            for reminder in reminders:
-                if reminder["scheduled_on"] <= current_timestamp:
-                    due_reminders.append(reminder.copy())
-
-        # Sort by scheduled_on (earliest first)
-        due_reminders.sort(key=lambda x: x["scheduled_on"])
-
-        return due_reminders
+        # Drop stale tops so the walk below starts on a live entry
+        while _schedule_due_heap and not _is_live(_schedule_due_heap[0]):
+            heapq.heappop(_schedule_due_heap)
+
+        due_items = []
+        stack = [0] if _schedule_due_heap else []
+        heap_size = len(_schedule_due_heap)
+        while stack:
+            i = stack.pop()
+            item = _schedule_due_heap[i]
+            if item[0] > current_timestamp:
+                continue  # nothing below this node is due either
+            if _is_live(item):
+                due_items.append(item)
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < heap_size:
+                    stack.append(child)
+
+        due_items.sort(key=lambda item: item[:2])
+        return [item[2].copy() for item in due_items]
 
     except Exception as e:
         pretty_log(
@@ -207,23 +273,27 @@ def remove_reminder_by_id_cached(reminder_id: int):
     Remove a specific reminder by its ID from cache.
     """
     try:
-        for user_id, reminders in schedule_cache.items():
-            for i, reminder in enumerate(reminders):
-                if reminder["reminder_id"] == reminder_id:
-                    # Remove the reminder
-                    del schedule_cache[user_id][i]
-
-                    # Remove user entirely if no reminders left
-                    if not schedule_cache[user_id]:
-                        del schedule_cache[user_id]
-
-                    pretty_log(
-                        tag="cache",
-                        message=f"Removed reminder {reminder_id} from cache",
-                    )
-                    return True
+        entry = _schedule_by_id.get(reminder_id)
+        if entry is None:
+            return False
+
+        user_id = entry["user_id"]
+        reminders = schedule_cache.get(user_id, [])
+        for i, reminder in enumerate(reminders):
+            if reminder is entry:
+                del reminders[i]
+                break
+        _unindex_entry(entry)
 
-        return False
+        # Remove user entirely if no reminders left
+        if user_id in schedule_cache and not schedule_cache[user_id]:
+            del schedule_cache[user_id]
+
+        pretty_log(
+            tag="cache",
+            message=f"Removed reminder {reminder_id} from cache",
+        )
+        return True
 
     except Exception as e:
         pretty_log(
@@ -11,11 +11,12 @@ async def load_timer_cache(bot):
     Load all user timer settings into memory cache.
     Uses the fetch_all_timers DB function.
     """
-    timer_cache.clear()
-
     rows = await fetch_all_timers(bot)
+
+    # Build aside, then swap in one synchronous step
+    new_cache = {}
     for row in rows:
-        timer_cache[row["user_id"]] = {
+        new_cache[row["user_id"]] = {
             "user_name": row.get("user_name"),
             "pokemon_setting": row.get("pokemon_setting"),
             "fish_setting": row.get("fish_setting"),
@@ -23,6 +24,8 @@ async def load_timer_cache(bot):
             "catchbot_setting": row.get("catchbot_setting"),
             "quest_setting": row.get("quest_setting"),
         }
+    timer_cache.clear()
+    timer_cache.update(new_cache)
 
     # 🐭 Debug log
     pretty_log(
@@ -1,6 +1,15 @@
 import discord
 
-from utils.cache.cache_list import user_info_cache  # 💜 import your cache
+from utils.cache.cache_list import (  # 💜 import your cache
+    _user_info_name_index,
+    user_info_cache,
+)
+from utils.cache.name_index import (
+    index_add,
+    index_lookup,
+    index_rebuild,
+    index_remove,
+)
 from utils.db.user_info_db_func import fetch_all_user_info
 from utils.logs.pretty_log import pretty_log
 
@@ -13,17 +22,21 @@ async def load_user_info_cache(bot):
     Load all user info data into memory cache.
     Uses the fetch_all_user_info DB function.
     """
-    user_info_cache.clear()  # Clear existing cache
-
     rows = await fetch_all_user_info(bot)
+
+    # Build aside, then swap in one synchronous step
+    new_cache = {}
     for row in rows:
-        user_info_cache[row["user_id"]] = {
+        new_cache[row["user_id"]] = {
             "user_name": row.get("user_name"),
             "faction": row.get("faction"),
             "patreon_tier": row.get("patreon_tier"),
             "max_quests": row.get("max_quests"),
             "current_quest_num": row.get("current_quest_num"),
         }
+    user_info_cache.clear()
+    user_info_cache.update(new_cache)
+    index_rebuild(_user_info_name_index, user_info_cache)
 
     # 🐭 Debug log
     pretty_log(
@@ -64,7 +77,11 @@ def set_user_info_cached(
             }
 
         if user_name is not None:
+            index_remove(
+                _user_info_name_index, user_info_cache[user_id]["user_name"], user_id
+            )
             user_info_cache[user_id]["user_name"] = user_name
+            index_add(_user_info_name_index, user_name, user_id)
         if faction is not None:
             user_info_cache[user_id]["faction"] = faction
         if patreon_tier is not None:
@@ -151,7 +168,11 @@ def update_user_name_in_cache(user: discord.Member, user_name: str):
     """
     try:
         if user.id in user_info_cache:
+            index_remove(
+                _user_info_name_index, user_info_cache[user.id]["user_name"], user.id
+            )
             user_info_cache[user.id]["user_name"] = user_name
+            index_add(_user_info_name_index, user_name, user.id)
             pretty_log(
                 tag="cache",
                 message=f"Updated user_name in cache for {user.display_name} to {user_name}",
@@ -179,7 +200,8 @@ def delete_user_info_from_cache(user: discord.Member):
     """
     try:
         if user.id in user_info_cache:
-            del user_info_cache[user.id]
+            removed = user_info_cache.pop(user.id)
+            index_remove(_user_info_name_index, removed.get("user_name"), user.id)
             pretty_log(
                 tag="cache",
                 message=f"Deleted user info from cache for {user.display_name}",
@@ -257,9 +279,6 @@ def update_current_quest_num_in_cache(user: discord.Member, current_quest_num: i
 def get_user_id_by_name(user_name: str) -> int | None:
     """
     Returns the user_id for a given user_name from the user_info_cache.
-    If not found, returns None.
+    If not found, or the name is shared by several users, returns None.
     """
-    for user_id, info in user_info_cache.items():
-        if info.get("user_name") == user_name:
-            return user_id
-    return None
+    return index_lookup(_user_info_name_index, user_name, label="🩰 USER INFO CACHE")
@@ -1,5 +1,11 @@
 import discord
-from utils.cache.cache_list import utility_cache
+from utils.cache.cache_list import _utility_name_index, utility_cache
+from utils.cache.name_index import (
+    index_add,
+    index_lookup,
+    index_rebuild,
+    index_remove,
+)
 from utils.logs.pretty_log import pretty_log
 from utils.db.utilities_db_func import fetch_all_utilities
 
@@ -12,15 +18,19 @@ async def load_utility_cache(bot):
     Load all user utility settings into memory cache.
     Uses the fetch_all_utilities DB function.
     """
-    utility_cache.clear()
-
     rows = await fetch_all_utilities(bot)
+
+    # Build aside, then swap in one synchronous step
+    new_cache = {}
     for row in rows:
-        utility_cache[row["user_id"]] = {
+        new_cache[row["user_id"]] = {
             "user_name": row.get("user_name"),
             "fish_rarity": row.get("fish_rarity"),
             "faction_ball_alert": row.get("faction_ball_alert"),
         }
+    utility_cache.clear()
+    utility_cache.update(new_cache)
+    index_rebuild(_utility_name_index, utility_cache)
 
     # 🐭 Debug log
     pretty_log(
@@ -56,7 +66,11 @@ def set_user_utility_cached(
             }
 
         if user_name is not None:
+            index_remove(
+                _utility_name_index, utility_cache[user_id]["user_name"], user_id
+            )
             utility_cache[user_id]["user_name"] = user_name
+            index_add(_utility_name_index, user_name, user_id)
         if fish_rarity is not None:
             utility_cache[user_id]["fish_rarity"] = fish_rarity
         if faction_ball_alert is not None:
@@ -139,7 +153,8 @@ def delete_user_utility_from_cache(user:discord.Member):
     user_name = user.display_name
     try:
         if user_id in utility_cache:
-            del utility_cache[user_id]
+            removed = utility_cache.pop(user_id)
+            index_remove(_utility_name_index, removed.get("user_name"), user_id)
             pretty_log(
                 tag="cache",
                 message=f"Deleted utility settings for {user_name} from cache",
@@ -159,9 +174,8 @@ def delete_user_utility_from_cache(user:discord.Member):
 #  Get user_id by user_name
 #--------------------
 def get_user_id_by_name(user_name: str) -> int | None:
-    """Find user_id in utility_cache by user_name, stripping whitespace."""
-    user_name = user_name.strip()
-    for uid, data in utility_cache.items():
-        if data.get("user_name", "").strip() == user_name:
-            return uid
-    return None
+    """
+    Find user_id in utility_cache by user_name, stripping whitespace.
+    Returns None if the name is unknown or shared by several users.
+    """
+    return index_lookup(_utility_name_index, user_name, label="👚 UTILITY CACHE")
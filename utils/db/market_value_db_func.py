@@ -2,7 +2,9 @@
 #        Market Value DB Functions for Mew (bot.pg_pool)
 # 🟣────────────────────────────────────────────
 
-from datetime import datetime
+import asyncio
+import time
+from datetime import datetime, timedelta
 
 import discord
 
@@ -196,6 +198,132 @@ async def set_market_value(
         )
 
 
+# --------------------
+#  Write-behind buffer for market value upserts
+# --------------------
+MARKET_VALUE_FLUSH_SECONDS = 30  # flush interval (main.flush_market_values loop)
+MARKET_VALUE_FLUSH_ROWS = 200  # flush early once this many Pokémon are pending
+
+_UPSERT_MARKET_VALUE_SQL = """
+    INSERT INTO market_value (
+        pokemon_name, dex_number, is_exclusive, lowest_market,
+        current_listing, true_lowest, listing_seen, image_link, last_updated
+    )
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+    ON CONFLICT (pokemon_name) DO UPDATE SET
+        dex_number = $2,
+        is_exclusive = $3,
+        lowest_market = $4,
+        current_listing = $5,
+        true_lowest = LEAST($6, market_value.true_lowest),
+        listing_seen = COALESCE($7, market_value.listing_seen),
+        image_link = COALESCE($8, market_value.image_link),
+        last_updated = $9
+"""
+
+# pokemon_name.lower() -> latest pending row (same order as the upsert params)
+_pending_market_values: dict[str, tuple] = {}
+_flush_lock = asyncio.Lock()
+_flush_task: asyncio.Task | None = None
+
+
+def _merge_pending(name: str, row: tuple):
+    """Keep only the latest row per Pokémon, mirroring the upsert's merge rules."""
+    prev = _pending_market_values.get(name)
+    if prev is not None:
+        row = (
+            *row[:5],
+            min(row[5], prev[5]),  # LEAST(true_lowest)
+            row[6] if row[6] is not None else prev[6],  # COALESCE(listing_seen)
+            row[7] if row[7] is not None else prev[7],  # COALESCE(image_link)
+            row[8],
+        )
+    _pending_market_values[name] = row
+
+
+def queue_market_value(
+    bot,
+    pokemon_name: str,
+    dex_number: int,
+    is_exclusive: bool = False,
+    lowest_market: int = 0,
+    current_listing: int = 0,
+    true_lowest: int = 0,
+    listing_seen: str | None = None,
+    image_link: str = None,
+):
+    """
+    Queue a market value upsert instead of writing it right away.
+    Repeated updates for the same Pokémon coalesce into one row; the buffer is
+    written with a single executemany every MARKET_VALUE_FLUSH_SECONDS or as
+    soon as MARKET_VALUE_FLUSH_ROWS Pokémon are pending.
+    """
+    global _flush_task
+
+    name = pokemon_name.lower()
+    _merge_pending(
+        name,
+        (
+            name,
+            dex_number,
+            is_exclusive,
+            lowest_market,
+            current_listing,
+            true_lowest,
+            listing_seen,
+            image_link,
+            datetime.utcnow(),
+        ),
+    )
+
+    if len(_pending_market_values) >= MARKET_VALUE_FLUSH_ROWS and (
+        _flush_task is None or _flush_task.done()
+    ):
+        _flush_task = asyncio.create_task(flush_market_value_buffer(bot))
+
+
+def pending_market_value_count() -> int:
+    return len(_pending_market_values)
+
+
+async def flush_market_value_buffer(bot) -> int:
+    """
+    Write every pending market value row in one executemany round-trip.
+    Rows that fail to write are put back (unless a newer update arrived).
+    Returns the number of rows written.
+    """
+    async with _flush_lock:
+        if not _pending_market_values:
+            return 0
+
+        batch = dict(_pending_market_values)
+        _pending_market_values.clear()
+
+        try:
+            async with bot.pg_pool.acquire() as conn:
+                await conn.executemany(_UPSERT_MARKET_VALUE_SQL, list(batch.values()))
+        except Exception as e:
+            for name, row in batch.items():
+                if name in _pending_market_values:
+                    # A newer update is already queued; fold the old one under it
+                    newer = _pending_market_values.pop(name)
+                    _pending_market_values[name] = row
+                    _merge_pending(name, newer)
+                else:
+                    _pending_market_values[name] = row
+            pretty_log(
+                tag="error",
+                message=f"Failed to flush {len(batch)} market value rows (kept for retry): {e}",
+            )
+            return 0
+
+    pretty_log(
+        tag="db",
+        message=f"Flushed {len(batch)} buffered market value rows",
+    )
+    return len(batch)
+
+
 def fetch_image_link_cache(pokemon_name: str):
     """
     Get image link for a Pokémon from cache.
@@ -731,41 +859,66 @@ async def cleanup_old_market_data(bot, days_old: int = 30) -> bool:
 async def sync_market_cache_to_db(bot, market_cache: dict):
     """
     Sync entire market value cache to database.
+    Sends every row in one UNNEST array upsert (one round-trip), keeping the
+    LEAST(true_lowest) / COALESCE(listing_seen) merge rules.
     """
     try:
-        update_count = 0
+        started = time.perf_counter()
+
+        # Dedupe on the lowercased key so one statement never hits a row twice
+        rows: dict[str, tuple] = {}
+        for pokemon_name, data in market_cache.items():
+            name = pokemon_name.lower()
+            true_lowest = data.get("true_lowest", 0)
+            if name in rows:
+                # NULL means "unknown", same as LEAST() treats it
+                true_lowest = min(
+                    (v for v in (true_lowest, rows[name][5]) if v is not None),
+                    default=None,
+                )
+            rows[name] = (
+                name,
+                data.get("dex_number", 0),
+                data.get("is_exclusive", False),
+                data.get("lowest_market", 0),
+                data.get("current_listing", 0),
+                true_lowest,
+                data.get("listing_seen", "Unknown"),
+            )
+
+        if not rows:
+            return True
+
+        columns = list(zip(*rows.values()))
         async with bot.pg_pool.acquire() as conn:
-            for pokemon_name, data in market_cache.items():
-                await conn.execute(
-                    """
-                    INSERT INTO market_value (
-                        pokemon_name, dex_number, is_exclusive, lowest_market,
-                        current_listing, true_lowest, listing_seen, last_updated
-                    )
-                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-                    ON CONFLICT (pokemon_name) DO UPDATE SET
-                        dex_number = $2,
-                        is_exclusive = $3,
-                        lowest_market = $4,
-                        current_listing = $5,
-                        true_lowest = LEAST($6, market_value.true_lowest),
-                        listing_seen = COALESCE($7, market_value.listing_seen),
-                        last_updated = $8
-                    """,
-                    pokemon_name.lower(),
-                    data.get("dex_number", 0),
-                    data.get("is_exclusive", False),
-                    data.get("lowest_market", 0),
-                    data.get("current_listing", 0),
-                    data.get("true_lowest", 0),
-                    data.get("listing_seen", "Unknown"),
-                    datetime.utcnow(),
+            await conn.execute(
+                """
+                INSERT INTO market_value (
+                    pokemon_name, dex_number, is_exclusive, lowest_market,
+                    current_listing, true_lowest, listing_seen, last_updated
                 )
-                update_count += 1
+                SELECT u.*, $8::timestamp
+                FROM UNNEST(
+                    $1::text[], $2::int[], $3::bool[], $4::bigint[],
+                    $5::bigint[], $6::bigint[], $7::text[]
+                ) AS u
+                ON CONFLICT (pokemon_name) DO UPDATE SET
+                    dex_number = EXCLUDED.dex_number,
+                    is_exclusive = EXCLUDED.is_exclusive,
+                    lowest_market = EXCLUDED.lowest_market,
+                    current_listing = EXCLUDED.current_listing,
+                    true_lowest = LEAST(EXCLUDED.true_lowest, market_value.true_lowest),
+                    listing_seen = COALESCE(EXCLUDED.listing_seen, market_value.listing_seen),
+                    last_updated = EXCLUDED.last_updated
+                """,
+                *[list(col) for col in columns],
+                datetime.utcnow(),
+            )
 
+        elapsed_ms = (time.perf_counter() - started) * 1000
         pretty_log(
             tag="db",
-            message=f"Synced {update_count} market value entries to database",
+            message=f"Synced {len(rows)} market value entries to database in {elapsed_ms:.0f} ms (bulk UNNEST upsert)",
         )
         return True
 
@@ -794,6 +947,35 @@ async def check_and_load_market_cache(bot) -> dict:
 # --------------------
 #  Load database into cache
 # --------------------
+# Newest last_updated seen in market_value (delta refresh high-water mark)
+_market_value_high_water: datetime | None = None
+# Re-read a little behind the mark so late commits (e.g. buffered flushes) are not missed
+MARKET_VALUE_DELTA_OVERLAP = timedelta(minutes=2)
+
+
+def _market_row_to_cache(row) -> dict:
+    return {
+        "pokemon": row["pokemon_name"],
+        "dex_number": row["dex_number"],
+        "is_exclusive": row.get("is_exclusive", False),
+        "lowest_market": row["lowest_market"],
+        "current_listing": row["current_listing"],
+        "true_lowest": row["true_lowest"],
+        "listing_seen": row["listing_seen"],
+        "image_link": row.get("image_link", None),
+    }
+
+
+def _advance_high_water(rows):
+    global _market_value_high_water
+    for row in rows:
+        ts = row.get("last_updated")
+        if ts is not None and (
+            _market_value_high_water is None or ts > _market_value_high_water
+        ):
+            _market_value_high_water = ts
+
+
 async def load_market_cache_from_db(bot) -> dict:
     """
     Load all market value data from database into cache format.
@@ -804,16 +986,7 @@ async def load_market_cache_from_db(bot) -> dict:
             rows = await conn.fetch("SELECT * FROM market_value")
 
             for row in rows:
-                cache[row["pokemon_name"]] = {
-                    "pokemon": row["pokemon_name"],
-                    "dex_number": row["dex_number"],
-                    "is_exclusive": row.get("is_exclusive", False),
-                    "lowest_market": row["lowest_market"],
-                    "current_listing": row["current_listing"],
-                    "true_lowest": row["true_lowest"],
-                    "listing_seen": row["listing_seen"],
-                    "image_link": row.get("image_link", None),
-                }
+                cache[row["pokemon_name"]] = _market_row_to_cache(row)
 
         """pretty_log(
             tag="",
@@ -821,6 +994,7 @@ async def load_market_cache_from_db(bot) -> dict:
             label="💎 Market Value Cache",
 
         )"""
+        _advance_high_water(rows)
         return market_value_cache.update(cache)  # Update the global cache
 
     except Exception as e:
@@ -829,3 +1003,42 @@ async def load_market_cache_from_db(bot) -> dict:
             message=f"Failed to load market cache from database: {e}",
         )
         return {}
+
+
+async def load_market_cache_delta(bot) -> int:
+    """
+    Pull only market_value rows changed since the last sync (last_updated
+    high-water mark) and apply them to the cache in place.
+    Rows still waiting in the write-behind buffer are skipped, since the
+    cache already holds a newer value for them.
+    Falls back to a full load when no mark exists yet.
+    Returns the number of cache entries applied.
+    """
+    if _market_value_high_water is None:
+        await load_market_cache_from_db(bot)
+        return len(market_value_cache)
+
+    try:
+        async with bot.pg_pool.acquire() as conn:
+            rows = await conn.fetch(
+                "SELECT * FROM market_value WHERE last_updated > $1",
+                _market_value_high_water - MARKET_VALUE_DELTA_OVERLAP,
+            )
+
+        applied = 0
+        for row in rows:
+            name = row["pokemon_name"]
+            if name in _pending_market_values:
+                continue
+            market_value_cache[name] = _market_row_to_cache(row)
+            applied += 1
+
+        _advance_high_water(rows)
+        return applied
+
+    except Exception as e:
+        pretty_log(
+            tag="error",
+            message=f"Failed to load market cache delta from database: {e}",
+        )
+        return 0
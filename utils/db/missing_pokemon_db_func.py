@@ -115,63 +115,90 @@ async def upsert_missing_pokemon(
 # ❀─────────────────────────────────────────❀
 #      💖  Bulk Upsert Missing Pokémon
 # ❀─────────────────────────────────────────❀
-async def bulk_upsert_missing_pokemon(bot, entries: list[dict]):
+# Column order used for COPY records and the merge statement
+MISSING_IMPORT_COLUMNS = (
+    "user_id",
+    "user_name",
+    "dex",
+    "pokemon_name",
+    "role_id",
+    "channel_id",
+)
+# Rows merged per COPY → INSERT ... ON CONFLICT round
+MISSING_IMPORT_CHUNK_SIZE = 5000
+
+
+async def bulk_upsert_missing_pokemon(bot, entries: list[dict]) -> list[dict]:
     """
     Bulk insert or update missing Pokémon.
     Each entry should be a dict with keys:
     user_id, user_name, dex, pokemon_name, role_id (optional), channel_id (optional)
-    """
-    if not entries:
-        return
-
-    values_str_list = []
-    params = []
 
-    for i, entry in enumerate(entries):
-        idx = i * 6  # ✅ now 6 parameters per entry
-        values_str_list.append(
-            f"(${idx+1}, ${idx+2}, ${idx+3}, ${idx+4}, ${idx+5}, ${idx+6})"
-        )
-        params.extend(
-            [
-                entry.get("user_id"),
-                entry.get("user_name"),
-                entry.get("dex"),
-                entry.get("pokemon_name"),
-                entry.get("role_id"),
-                entry.get("channel_id"),
-            ]
-        )
-
-    values_str = ", ".join(values_str_list)
-
-    query = f"""
-    INSERT INTO missing_pokemon (user_id, user_name, dex, pokemon_name, role_id, channel_id)
-    VALUES {values_str}
-    ON CONFLICT (user_id, dex)
-    DO UPDATE SET
-        user_name = EXCLUDED.user_name,
-        pokemon_name = EXCLUDED.pokemon_name,
-        role_id = EXCLUDED.role_id,
-        channel_id = EXCLUDED.channel_id;
+    Rows are streamed with COPY into a temp table and merged with
+    ON CONFLICT (user_id, dex), MISSING_IMPORT_CHUNK_SIZE rows at a time,
+    all in one transaction. Bind-parameter count doesn't grow with the
+    import, so any size works. The cache is updated from the merged rows,
+    which are also returned.
     """
-
+    if not entries:
+        return []
+
+    # One row per (user_id, dex) — a single ON CONFLICT statement can't hit a row twice
+    latest = {}
+    for entry in entries:
+        latest[(entry.get("user_id"), entry.get("dex"))] = entry
+    records = [
+        tuple(entry.get(column) for column in MISSING_IMPORT_COLUMNS)
+        for entry in latest.values()
+    ]
+    columns = ", ".join(MISSING_IMPORT_COLUMNS)
+
+    merged = []
     async with bot.pg_pool.acquire() as conn:
-        await conn.execute(query, *params)
+        async with conn.transaction():
+            await conn.execute(
+                f"""
+                CREATE TEMP TABLE missing_pokemon_import ON COMMIT DROP AS
+                SELECT {columns} FROM missing_pokemon WITH NO DATA;
+                """
+            )
+            for start in range(0, len(records), MISSING_IMPORT_CHUNK_SIZE):
+                chunk = records[start : start + MISSING_IMPORT_CHUNK_SIZE]
+                await conn.copy_records_to_table(
+                    "missing_pokemon_import",
+                    records=chunk,
+                    columns=MISSING_IMPORT_COLUMNS,
+                )
+                rows = await conn.fetch(
+                    f"""
+                    INSERT INTO missing_pokemon ({columns})
+                    SELECT {columns} FROM missing_pokemon_import
+                    ON CONFLICT (user_id, dex)
+                    DO UPDATE SET
+                        user_name = EXCLUDED.user_name,
+                        pokemon_name = EXCLUDED.pokemon_name,
+                        role_id = EXCLUDED.role_id,
+                        channel_id = EXCLUDED.channel_id
+                    RETURNING {columns};
+                    """
+                )
+                merged.extend(dict(row) for row in rows)
+                await conn.execute("TRUNCATE missing_pokemon_import;")
 
-        pretty_log(
-            tag="💜 DB",
-            message=f"Bulk inserted/updated {len(entries)} missing Pokémon entries (includes role_id & channel_id).",
-        )
+    pretty_log(
+        tag="💜 DB",
+        message=f"Bulk inserted/updated {len(merged)} missing Pokémon entries via COPY (includes role_id & channel_id).",
+    )
 
-        from utils.cache.missing_pokemon_cache import bulk_upsert_missing_pokemon_cache
+    from utils.cache.missing_pokemon_cache import bulk_upsert_missing_pokemon_cache
 
-        bulk_upsert_missing_pokemon_cache(entries)
+    bulk_upsert_missing_pokemon_cache(merged)
 
-        pretty_log(
-            tag="💜 CACHE",
-            message=f"Bulk upserted {len(entries)} missing Pokémon entries into cache (includes role_id & channel_id).",
-        )
+    pretty_log(
+        tag="💜 CACHE",
+        message=f"Bulk upserted {len(merged)} missing Pokémon entries into cache (includes role_id & channel_id).",
+    )
+    return merged
 
 
 # ❀─────────────────────────────────────────❀
@@ -138,11 +138,13 @@ async def upsert_user_schedule(
 ):
     """
     Insert or update a user's reminder schedule.
-    Now includes channel_id.
+    Now includes channel_id. The schedule cache is updated after the write.
     """
+    from utils.cache.schedule_cache import set_schedule_cached
+
     try:
         async with bot.pg_pool.acquire() as conn:
-            await conn.execute(
+            reminder_id = await conn.fetchval(
                 """
                 INSERT INTO pokemeow_reminders_schedule (user_id, user_name, type, scheduled_on, channel_id)
                 VALUES ($1, $2, $3, $4, $5)
@@ -151,6 +153,7 @@ async def upsert_user_schedule(
                     scheduled_on = EXCLUDED.scheduled_on,
                     channel_id = EXCLUDED.channel_id,
                     updated_at = CURRENT_TIMESTAMP
+                RETURNING reminder_id
                 """,
                 user_id,
                 user_name,
@@ -158,6 +161,9 @@ async def upsert_user_schedule(
                 scheduled_on,
                 channel_id,
             )
+        set_schedule_cached(
+            user_id, reminder_id, user_name, type_, scheduled_on, channel_id
+        )
         pretty_log(
             tag="db",
             message=f"Upserted schedule for user {user_name}, type {type_}, channel {channel_id}",
@@ -176,8 +182,10 @@ async def upsert_user_schedule(
 # ────────────────────────────────────────────
 async def delete_user_schedule(bot, user_id: int, type_: str):
     """
-    Delete a user's schedule row by type.
+    Delete a user's schedule row by type (and its cache entry).
     """
+    from utils.cache.schedule_cache import remove_schedule_cached
+
     try:
         async with bot.pg_pool.acquire() as conn:
             result = await conn.execute(
@@ -185,6 +193,7 @@ async def delete_user_schedule(bot, user_id: int, type_: str):
                 user_id,
                 type_,
             )
+        remove_schedule_cached(user_id, type_)
         pretty_log(
             tag="db",
             message=f"Deleted schedule for user {user_id}, type {type_}",
@@ -203,14 +212,17 @@ async def delete_user_schedule(bot, user_id: int, type_: str):
 # 🗑️ Delete reminder by ID
 async def delete_reminder(bot, reminder_id: int):
     """
-    Delete a specific reminder by its ID.
+    Delete a specific reminder by its ID (and its cache entry).
     """
+    from utils.cache.schedule_cache import remove_reminder_by_id_cached
+
     try:
         async with bot.pg_pool.acquire() as conn:
             result = await conn.execute(
                 "DELETE FROM pokemeow_reminders_schedule WHERE reminder_id = $1",
                 reminder_id,
             )
+        remove_reminder_by_id_cached(reminder_id)
         pretty_log(tag="db", message=f"Deleted reminder {reminder_id}", bot=bot)
         return result.endswith("DELETE 1")
     except Exception as e:
@@ -257,20 +269,33 @@ async def update_scheduled_on(
 ):
     """
     Update the scheduled_on timestamp for a user's reminder schedule by user_id and type.
+    The schedule cache is updated after the write.
     """
+    from utils.cache.schedule_cache import set_schedule_cached
+
     try:
         async with bot.pg_pool.acquire() as conn:
-            await conn.execute(
+            row = await conn.fetchrow(
                 """
                 UPDATE pokemeow_reminders_schedule
                 SET scheduled_on = $1,
                     updated_at = CURRENT_TIMESTAMP
                 WHERE user_id = $2 AND type = $3
+                RETURNING reminder_id, user_name, channel_id
                 """,
                 new_scheduled_on,
                 user_id,
                 type_,
             )
+        if row:
+            set_schedule_cached(
+                user_id,
+                row["reminder_id"],
+                row["user_name"],
+                type_,
+                new_scheduled_on,
+                row["channel_id"],
+            )
         pretty_log(
             tag="db",
             message=f"Updated scheduled_on for user {user_id}, type {type_} to {new_scheduled_on}",
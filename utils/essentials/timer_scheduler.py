@@ -0,0 +1,125 @@
+# 💜────────────────────────────────────────────
+#       🟣 Shared Timer Scheduler 🟣
+#   One driver task + a min-heap of due times
+#   for every per-user "command ready" timer
+# 💜────────────────────────────────────────────
+import asyncio
+import heapq
+import itertools
+import time
+
+from utils.logs.pretty_log import pretty_log
+
+# Rebuild the heap once cancelled/replaced entries outnumber live ones by this much
+COMPACT_SLACK = 256
+
+
+class TimerScheduler:
+    """
+    Keyed one-shot timers: at most one pending timer per (kind, user_id).
+      - schedule() replaces any pending timer for the same key
+      - cancel() is O(1); stale heap entries are skipped lazily
+      - fired and cancelled entries are dropped automatically
+    Callbacks are coroutine functions, started as short-lived tasks when due.
+    """
+
+    def __init__(self, name: str = "timers"):
+        self.name = name
+        self._heap: list[list] = []  # [due, seq, key, callback]
+        self._entries: dict[tuple[str, int], list] = {}
+        self._pending: dict[str, int] = {}
+        self._seq = itertools.count()
+        self._wakeup: asyncio.Event | None = None
+        self._driver: asyncio.Task | None = None
+        # The loop only holds weak refs to tasks; keep firing callbacks alive
+        self._inflight: set[asyncio.Task] = set()
+
+    # ── Public API ──
+    def schedule(self, kind: str, user_id: int, delay: float, callback) -> bool:
+        """
+        Run callback() after delay seconds. Returns True if it replaced
+        an already-pending timer for the same user and kind.
+        """
+        replaced = self.cancel(kind, user_id)
+        key = (kind, user_id)
+        entry = [time.monotonic() + delay, next(self._seq), key, callback]
+        self._entries[key] = entry
+        self._pending[kind] = self._pending.get(kind, 0) + 1
+        heapq.heappush(self._heap, entry)
+
+        self._ensure_driver()
+        if self._heap[0] is entry:
+            self._wakeup.set()
+        return replaced
+
+    def cancel(self, kind: str, user_id: int) -> bool:
+        entry = self._entries.pop((kind, user_id), None)
+        if entry is None:
+            return False
+        entry[3] = None  # tombstone; skipped when it reaches the heap top
+        self._pending[kind] -= 1
+        self._maybe_compact()
+        return True
+
+    def is_pending(self, kind: str, user_id: int) -> bool:
+        return (kind, user_id) in self._entries
+
+    def pending_counts(self) -> dict[str, int]:
+        """Live pending timers per kind."""
+        return {kind: count for kind, count in self._pending.items() if count}
+
+    def pending_total(self) -> int:
+        return len(self._entries)
+
+    # ── Internals ──
+    def _maybe_compact(self):
+        if len(self._heap) > 2 * len(self._entries) + COMPACT_SLACK:
+            self._heap = [e for e in self._heap if e[3] is not None]
+            heapq.heapify(self._heap)
+
+    def _ensure_driver(self):
+        if self._driver is None or self._driver.done():
+            self._wakeup = asyncio.Event()
+            self._driver = asyncio.get_running_loop().create_task(self._run())
+
+    def _pop_due(self, now: float) -> list:
+        due = []
+        heap = self._heap
+        while heap and (heap[0][3] is None or heap[0][0] <= now):
+            due_at, _, key, callback = heapq.heappop(heap)
+            if callback is None:
+                continue
+            del self._entries[key]
+            self._pending[key[0]] -= 1
+            due.append((key, callback))
+        return due
+
+    async def _run(self):
+        while True:
+            for key, callback in self._pop_due(time.monotonic()):
+                task = asyncio.create_task(self._fire(key, callback))
+                self._inflight.add(task)
+                task.add_done_callback(self._inflight.discard)
+
+            timeout = None
+            if self._heap:
+                timeout = max(0.0, self._heap[0][0] - time.monotonic())
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _fire(self, key, callback):
+        try:
+            await callback()
+        except Exception as e:
+            pretty_log(
+                tag="error",
+                message=f"Timer callback {key} failed: {e}",
+                label=f"⏰ {self.name.upper()}",
+            )
+
+
+# 🌐 Shared instance for pokemon / fish / battle ready timers
+command_timers = TimerScheduler("command timers")
@@ -0,0 +1,289 @@
+# 💜────────────────────────────────────────────
+#       🟣 Message Trigger Dispatcher 🟣
+#   Classifies a message in one pass and runs
+#   only the handlers whose triggers matched
+# 💜────────────────────────────────────────────
+import asyncio
+import re
+import time
+from collections import deque
+
+import discord
+
+from utils.logs.pretty_log import pretty_log
+
+# 🗂 Message parts a trigger can look at
+MESSAGE_FIELDS = ("content", "author", "title", "description", "footer", "fields")
+
+# ⏱ Default per-handler time budget (seconds)
+DEFAULT_HANDLER_TIMEOUT = 30.0
+
+
+# 💜────────────────────────────────────────────
+#       🎯 Needle Helpers
+# 💜────────────────────────────────────────────
+def has(field: str, text: str) -> tuple[str, bool, str]:
+    """Case-sensitive substring needle on a message field."""
+    if field not in MESSAGE_FIELDS:
+        raise ValueError(f"Unknown message field: {field}")
+    return (field, False, text)
+
+
+def has_lower(field: str, text: str) -> tuple[str, bool, str]:
+    """Case-insensitive substring needle on a message field."""
+    if field not in MESSAGE_FIELDS:
+        raise ValueError(f"Unknown message field: {field}")
+    return (field, True, text.lower())
+
+
+# 💜────────────────────────────────────────────
+#       📨 Precomputed Message Fields
+# 💜────────────────────────────────────────────
+class MessageFields:
+    """Raw + lowercased text of a message, read from the first embed once."""
+
+    __slots__ = ("message", "embed", "raw", "_lower")
+
+    def __init__(self, message: discord.Message):
+        self.message = message
+        embed = message.embeds[0] if message.embeds else None
+        self.embed = embed
+
+        raw = {"content": message.content or ""}
+        if embed:
+            raw["author"] = (embed.author.name if embed.author else None) or ""
+            raw["title"] = embed.title or ""
+            raw["description"] = embed.description or ""
+            raw["footer"] = (embed.footer.text if embed.footer else None) or ""
+            raw["fields"] = "\n".join(
+                f"{field.name or ''}\n{field.value or ''}" for field in embed.fields
+            )
+        else:
+            raw["author"] = raw["title"] = raw["description"] = ""
+            raw["footer"] = raw["fields"] = ""
+        self.raw = raw
+        self._lower = {}
+
+    def get(self, field: str, lower: bool = False) -> str:
+        if not lower:
+            return self.raw[field]
+        text = self._lower.get(field)
+        if text is None:
+            text = self.raw[field].lower()
+            self._lower[field] = text
+        return text
+
+
+# 💜────────────────────────────────────────────
+#       🧩 Trigger Definition
+# 💜────────────────────────────────────────────
+class Trigger:
+    """
+    One handler plus the needles that select it.
+      - all_of  → every needle must be present
+      - any_of  → at least one needle must be present (if given)
+      - none_of → no needle may be present
+      - predicate(fields) → extra check, only run once the needles pass
+      - requires_embed → skip messages without embeds
+      - announce → pretty_log label when the trigger matches
+      - timeout → seconds the handler may run before it is cancelled
+    """
+
+    __slots__ = (
+        "name",
+        "handler",
+        "all_of",
+        "any_of",
+        "none_of",
+        "predicate",
+        "requires_embed",
+        "announce",
+        "timeout",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        handler,
+        *,
+        all_of=(),
+        any_of=(),
+        none_of=(),
+        predicate=None,
+        requires_embed: bool = False,
+        announce: str | None = None,
+        timeout: float = DEFAULT_HANDLER_TIMEOUT,
+    ):
+        self.name = name
+        self.handler = handler
+        self.all_of = frozenset(all_of)
+        self.any_of = frozenset(any_of)
+        self.none_of = frozenset(none_of)
+        self.predicate = predicate
+        self.requires_embed = requires_embed
+        self.announce = announce
+        self.timeout = timeout
+
+    def matches(self, fields: MessageFields, hits: set) -> bool:
+        if self.requires_embed and fields.embed is None:
+            return False
+        if self.all_of and not self.all_of <= hits:
+            return False
+        if self.any_of and self.any_of.isdisjoint(hits):
+            return False
+        if self.none_of and not self.none_of.isdisjoint(hits):
+            return False
+        if self.predicate and not self.predicate(fields):
+            return False
+        return True
+
+
+# 💜────────────────────────────────────────────
+#       📊 Per-Handler Latency Stats
+# 💜────────────────────────────────────────────
+class HandlerStats:
+    """Running latency/outcome counters for one trigger handler."""
+
+    __slots__ = ("calls", "errors", "timeouts", "total", "max", "recent")
+
+    def __init__(self, window: int = 256):
+        self.calls = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.recent: deque[float] = deque(maxlen=window)
+
+    def record(self, elapsed: float):
+        self.calls += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+        self.recent.append(elapsed)
+
+    def percentile(self, pct: float) -> float:
+        if not self.recent:
+            return 0.0
+        ordered = sorted(self.recent)
+        index = min(len(ordered) - 1, int(len(ordered) * pct / 100))
+        return ordered[index]
+
+    def summary(self) -> dict:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "avg_ms": (self.total / self.calls * 1000) if self.calls else 0.0,
+            "p50_ms": self.percentile(50) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "max_ms": self.max * 1000,
+        }
+
+
+# 💜────────────────────────────────────────────
+#       ⚙️ Compiled Dispatcher
+# 💜────────────────────────────────────────────
+class TriggerDispatcher:
+    """
+    Compiles every trigger needle into one lookahead regex per (field, case)
+    so a message is scanned once per field, no matter how many triggers exist.
+    """
+
+    def __init__(self, triggers: list[Trigger]):
+        self.triggers = list(triggers)
+        self.stats: dict[str, HandlerStats] = {
+            t.name: HandlerStats() for t in self.triggers
+        }
+        self._automata: list[tuple[str, bool, re.Pattern, dict]] = []
+
+        grouped: dict[tuple[str, bool], set[str]] = {}
+        for trigger in self.triggers:
+            for field, lower, text in trigger.all_of | trigger.any_of | trigger.none_of:
+                grouped.setdefault((field, lower), set()).add(text)
+
+        for (field, lower), needles in grouped.items():
+            # Longest first so a needle never hides a longer one at the same spot
+            ordered = sorted(needles, key=len, reverse=True)
+            pattern = re.compile(
+                "(?=(" + "|".join(re.escape(n) for n in ordered) + "))"
+            )
+            # A found needle implies every shorter needle inside it was found too
+            implied = {
+                n: frozenset(
+                    (field, lower, other) for other in needles if other in n
+                )
+                for n in needles
+            }
+            self._automata.append((field, lower, pattern, implied))
+
+    def scan(self, fields: MessageFields) -> set:
+        """Return every (field, lower, needle) found in the message."""
+        hits = set()
+        for field, lower, pattern, implied in self._automata:
+            text = fields.get(field, lower)
+            if not text:
+                continue
+            for needle in set(pattern.findall(text)):
+                hits |= implied[needle]
+        return hits
+
+    def classify(self, message: discord.Message) -> tuple[MessageFields, list[Trigger]]:
+        """Return the precomputed fields and the triggers matching this message."""
+        fields = MessageFields(message)
+        hits = self.scan(fields)
+        matched = [t for t in self.triggers if t.matches(fields, hits)]
+        return fields, matched
+
+    async def dispatch(self, message: discord.Message) -> list[Trigger]:
+        """
+        Classify the message and run every matching handler concurrently.
+        Each handler gets its own timeout and exception boundary, so a slow
+        or failing handler never delays or cancels the others.
+        """
+        _, matched = self.classify(message)
+        if not matched:
+            return matched
+        if len(matched) == 1:
+            await self._run_isolated(matched[0], message)
+            return matched
+
+        async with asyncio.TaskGroup() as group:
+            for trigger in matched:
+                group.create_task(self._run_isolated(trigger, message))
+        return matched
+
+    async def _run_isolated(self, trigger: Trigger, message: discord.Message):
+        stats = self.stats[trigger.name]
+        if trigger.announce:
+            pretty_log(
+                "info",
+                f"Matched {trigger.announce} trigger | Message ID: {message.id} | Channel: {getattr(message.channel, 'name', None)}",
+            )
+
+        started = time.perf_counter()
+        try:
+            async with asyncio.timeout(trigger.timeout):
+                await trigger.handler(message)
+        except TimeoutError:
+            stats.timeouts += 1
+            pretty_log(
+                "warn",
+                f"Handler '{trigger.name}' timed out after {trigger.timeout}s | Message ID: {message.id}",
+                label="🎯 DISPATCH",
+            )
+        except Exception as e:
+            stats.errors += 1
+            pretty_log(
+                "critical",
+                f"Handler '{trigger.name}' failed on message {message.id}: {e}",
+                label="🎯 DISPATCH",
+                include_trace=True,
+            )
+        finally:
+            stats.record(time.perf_counter() - started)
+
+    def stats_summary(self) -> dict[str, dict]:
+        """Latency summary for every handler that has run at least once."""
+        return {
+            name: stats.summary() for name, stats in self.stats.items() if stats.calls
+        }
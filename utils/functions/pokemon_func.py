@@ -1,4 +1,3 @@
-from config.paldea_galar_dict import dex
 from config.pokemons import *
 # from config.constants.straymons_constants import STRAYMONS__EMOJIS
 from utils.db.market_value_db_func import (
@@ -8,6 +7,7 @@ from utils.db.market_value_db_func import (
 )
 from utils.logs.debug_logs import debug_enabled, debug_log, enable_debug
 from utils.logs.pretty_log import pretty_log
+from utils.pokemeow import dex_resolver
 
 
 def get_dex_number_by_name(name: str) -> int | None:
@@ -18,9 +18,9 @@ def get_dex_number_by_name(name: str) -> int | None:
     """
 
     # uncomment  when mew has rarity emojis
-    for num, poke_name in dex.items():
-        if poke_name == name:
-            return num
+    num = dex_resolver.paldea_dex_for_name(name)
+    if num is not None:
+        return num
 
     # Fallback: try formatted name
     formatted_name = format_names_for_market_value_lookup(name)
@@ -51,6 +51,9 @@ IN_GAME_MONS_LIST = (
 
 exclusive_mons_list = list(exclusive_mons.keys())
 
+# Hash-set view for O(1) membership checks
+IN_GAME_MONS_SET = frozenset(IN_GAME_MONS_LIST)
+
 
 def strip_prefixes(pokemon_name: str):
     """
@@ -111,7 +114,7 @@ def is_mon_exclusive(pokemon: str) -> bool:
     """
     debug_log(f"Checking exclusivity for: {pokemon}")
     name = pokemon.lower()
-    if any(name == mon.lower() for mon in exclusive_mons_list):
+    if dex_resolver.is_exclusive_name(name):
         debug_log(f"{pokemon} is exclusive based on the exclusive_mons list.")
         return True
     # Check cache for exclusivity, if it's exclusive then it's not auctionable
@@ -141,19 +144,8 @@ def get_rarity(pokemon: str):
     elif "mega" in name and not "yanmega" in name and not "meganium" in name:
         return "mega"
 
-    # Fallback to the list (case-insensitive)
-    elif name in (mon.lower() for mon in legendary_mons):
-        return "legendary"
-    elif name in (mon.lower() for mon in superrare_mons):
-        return "super rare"
-    elif name in (mon.lower() for mon in rare_mons):
-        return "rare"
-    elif name in (mon.lower() for mon in uncommon_mons):
-        return "uncommon"
-    elif name in (mon.lower() for mon in common_mons):
-        return "common"
-    else:
-        return None
+    # Fallback to the lists (case-insensitive, precomputed index)
+    return dex_resolver.rarity_for_name(name)
 
 
 def format_names_for_market_value_lookup(pokemon_name: str):
@@ -194,7 +186,7 @@ def format_names_for_market_value_lookup(pokemon_name: str):
 def is_mon_in_game(pokemon_name: str) -> bool:
     """Check if a Pokémon is in the game."""
     name_lower = pokemon_name.lower()
-    if name_lower in IN_GAME_MONS_LIST:
+    if name_lower in IN_GAME_MONS_SET:
         return True
     # Fallback to check if the formatted name is in the market value cache
     pokemon_name_formatted = format_names_for_market_value_lookup(pokemon_name)
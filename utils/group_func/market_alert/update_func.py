@@ -32,7 +32,11 @@ async def update_market_alert_func(
     Update an existing market alert. Sends the embed directly to the interaction.
     Only updates columns for which a new value is provided.
     """
-    from utils.cache.market_alert_cache import insert_alert, remove_alert
+    from utils.cache.market_alert_cache import (
+        fetch_alerts_for_pokemon,
+        insert_alert,
+        remove_alert,
+    )
 
     user = interaction.user
     user_id = user.id
@@ -107,9 +111,8 @@ async def update_market_alert_func(
         old_channel = next(
             (
                 a["channel_id"]
-                for a in market_alert_cache
-                if a["pokemon"].lower() == pokemon_name.lower()
-                and a.get("user_id") == user_id
+                for a in fetch_alerts_for_pokemon(pokemon_name)
+                if a.get("user_id") == user_id
             ),
             None,
         )
@@ -4,7 +4,6 @@ from discord.ext import commands
 
 from config.aesthetic import Emojis
 from config.settings import CHECKLIST_SETTINGS_MAP, Channels
-from config.weakness_chart import weakness_chart
 from utils.db.missing_pokemon_db_func import upsert_missing_pokemon
 from utils.logs.pretty_log import pretty_log
 from utils.pokemeow.new_parsers import resolve_pokemon_input
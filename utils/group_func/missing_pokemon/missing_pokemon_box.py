@@ -1,4 +1,3 @@
-import re
 from typing import Literal
 
 import discord
@@ -6,10 +5,20 @@ from discord import app_commands
 from discord.ext import commands
 
 from config.settings import CHECKLIST_SETTINGS_MAP, POKEMEOW_APPLICATION_ID
-from config.weakness_chart import weakness_chart
+from utils.pokemeow import pokedex
 from utils.db.missing_pokemon_db_func import bulk_upsert_missing_pokemon
 from utils.logs.pretty_log import pretty_log
-from utils.parsers.message_link_parser import fetch_message_from_link
+from utils.parsers.pokemeow_patterns import (
+    BOX_DEX_LINE_PATTERN,
+    STATIC_EMOJI_TAG_PATTERN,
+    VARIANT_PREFIX_PATTERN,
+)
+from utils.parsers.message_link_parser import (
+    fetch_message_from_link,
+    fetch_message_range,
+    fetch_messages_from_links,
+    find_message_links,
+)
 from utils.visuals.pretty_defer import pretty_defer, pretty_error
 from utils.visuals.name_helpers import format_display_pokemon_name
 
@@ -22,6 +31,12 @@ GOLDEN_TAG = "<:dexcaughtgold:680263035952037897>"
 
 NOT_FORM_MONS = ["tapu-fini", "tapu-koko", "tapu-lele", "tapu-bulu"]
 
+# Batch import limits (pages per command, messages scanned in range mode)
+MAX_BOX_PAGES = 60
+MAX_RANGE_MESSAGES = 200
+# Embed field values cap at 1024 characters
+FIELD_CHAR_LIMIT = 1024
+
 
 # 🌸──────────────────────────────────────────────
 # Helper to parse embed description
@@ -53,12 +68,9 @@ def convert_variant_dex(dex: int, prefix: str, name: str) -> int:
         if first_digit == "7":
 
             # Example: fetch actual dex from chart if needed
-            if name in weakness_chart:
-                new_dex_from_chart = weakness_chart[name]["dex"]
-                if new_dex_from_chart:
-                    new_dex = int(new_dex_from_chart)
-                else:
-                    new_dex = dex
+            new_dex_from_chart = pokedex.get_dex(name)
+            if new_dex_from_chart is not None:
+                new_dex = new_dex_from_chart
             else:
                 new_dex = dex
         else:
@@ -90,16 +102,14 @@ def parse_missing_pokemon_with_dex(description: str):
             continue
 
         # --- Extract Dex number and name ---
-        match = re.search(
-            r"`\s*(\d+)\s*`\s*(?:<:.+?:\d+>\s*)*(.+?)(?=\s*<:.+?:\d+>|$)", line
-        )
+        match = BOX_DEX_LINE_PATTERN.search(line)
         if not match:
             print(f"Line {idx}: Skipped → regex didn't match")
             continue
 
         dex_number = int(match.group(1).strip())
         pokemon_name = match.group(2).strip()
-        pokemon_name = re.sub(r"<:.+?:\d+>", "", pokemon_name).strip()
+        pokemon_name = STATIC_EMOJI_TAG_PATTERN.sub("", pokemon_name).strip()
         name_lower = pokemon_name.lower()
 
         # Tags
@@ -115,9 +125,7 @@ def parse_missing_pokemon_with_dex(description: str):
         has_dash = "-" in pokemon_name and not is_not_form_mon
 
         # Strip prefixes for base name
-        base_name = re.sub(
-            r"^(shiny|golden)\s+", "", pokemon_name, flags=re.IGNORECASE
-        ).title()
+        base_name = VARIANT_PREFIX_PATTERN.sub("", pokemon_name).title()
 
         # --- Handle Shiny prefix lines ---
         if is_shiny_prefix:
@@ -162,6 +170,138 @@ def parse_missing_pokemon_with_dex(description: str):
     return final_missing
 
 
+# 🌸──────────────────────────────────────────────
+# Merge several parsed pages into one result
+# 🌸──────────────────────────────────────────────
+def merge_missing_pages(pages: list[dict]) -> dict:
+    """Union of parse_missing_pokemon_with_dex results, deduplicated and sorted by Dex."""
+    merged = {"Regular": set(), "Shiny": set(), "Golden": set()}
+    for page in pages:
+        for category, pokemons in page.items():
+            merged[category].update(pokemons)
+    return {k: sorted(v, key=lambda x: x[0]) for k, v in merged.items() if v}
+
+
+def is_box_page(message: discord.Message) -> bool:
+    return (
+        message.author.id == POKEMEOW_APPLICATION_ID
+        and bool(message.embeds)
+        and bool(message.embeds[0].description)
+    )
+
+
+def is_own_box_page(message: discord.Message, user: discord.abc.User) -> bool:
+    """
+    True if a PokéMeow page was requested by `user`: it replies to their
+    ;list command (or answers their slash command), or the embed author
+    names them.
+    """
+    replied_to = message.reference.resolved if message.reference else None
+    if isinstance(replied_to, discord.Message):
+        return replied_to.author.id == user.id
+
+    metadata = getattr(message, "interaction_metadata", None)
+    if metadata is not None and metadata.user is not None:
+        return metadata.user.id == user.id
+
+    author_name = (message.embeds[0].author.name or "").lower()
+    for name in {user.name.lower(), user.display_name.lower()}:
+        rest = author_name[len(name) :] if author_name.startswith(name) else None
+        # "Name's box" / "Name" — but not "Namexyz's box"
+        if rest is not None and (not rest or not rest[0].isalnum()):
+            return True
+    return False
+
+
+def format_missing_field(pokemons: list[tuple[int, str]], name_fn=None) -> str:
+    """Dex • Name lines, trimmed to fit one embed field."""
+    lines = []
+    used = 0
+    for i, (dex, name) in enumerate(pokemons):
+        line = f"{dex:03d} • {name_fn(name) if name_fn else name}"
+        remaining = len(pokemons) - i
+        # Keep room for the "...and N more" footer
+        if used + len(line) + 1 > FIELD_CHAR_LIMIT - 24 and remaining > 1:
+            lines.append(f"...and {remaining} more")
+            break
+        lines.append(line)
+        used += len(line) + 1
+    return "\n".join(lines)
+
+
+def format_skipped(skipped: dict[str, int | bool]) -> str:
+    """'3 non-box message(s), 2 page(s) over the 60-page limit' (True → reason only)"""
+    return ", ".join(
+        reason if count is True else f"{count} {reason}"
+        for reason, count in skipped.items()
+        if count
+    )
+
+
+# 🌸──────────────────────────────────────────────
+# Collect box pages (one link, many links, or a range)
+# Returns: (pages: list[discord.Message], skipped: dict[str, int | bool], error_msg: str | None)
+#   skipped maps a reason ("non-box message(s)", ...) to how many were left out,
+#   or True when the count is unknown (range cut off at MAX_RANGE_MESSAGES)
+# 🌸──────────────────────────────────────────────
+async def collect_box_pages(
+    bot,
+    message_link: str,
+    last_message_link: str = None,
+    user: discord.abc.User = None,
+):
+    links = find_message_links(message_link)
+    over_limit = f"page(s) over the {MAX_BOX_PAGES}-page limit"
+
+    # 🔹 Range mode: the user's own PokéMeow pages between two links
+    if last_message_link:
+        success, messages, error_msg = await fetch_message_range(
+            bot,
+            links[0] if links else message_link,
+            last_message_link,
+            limit=MAX_RANGE_MESSAGES + 1,  # one extra tells us the range was cut
+        )
+        if not success:
+            return [], {}, error_msg
+        truncated = len(messages) > MAX_RANGE_MESSAGES
+        messages = messages[:MAX_RANGE_MESSAGES]
+        box_pages = [m for m in messages if is_box_page(m)]
+        own_pages = [m for m in box_pages if user is None or is_own_box_page(m, user)]
+        skipped = {
+            "non-box message(s)": len(messages) - len(box_pages),
+            "other trainers' page(s)": len(box_pages) - len(own_pages),
+            over_limit: max(0, len(own_pages) - MAX_BOX_PAGES),
+            f"range truncated at {MAX_RANGE_MESSAGES} messages": truncated,
+        }
+        return own_pages[:MAX_BOX_PAGES], skipped, None
+
+    # 🔹 Batch mode: several pasted links, fetched concurrently
+    if len(links) > 1:
+        results = await fetch_messages_from_links(bot, links[:MAX_BOX_PAGES])
+        pages = [m for success, m, _ in results if success and is_box_page(m)]
+        skipped = {
+            "non-box message(s)": len(results) - len(pages),
+            over_limit: max(0, len(links) - MAX_BOX_PAGES),
+        }
+        return pages, skipped, None
+
+    # 🔹 Single page
+    success, message, error_msg = await fetch_message_from_link(bot, message_link)
+    if not success:
+        return [], {}, error_msg
+
+    if message.author.id != POKEMEOW_APPLICATION_ID:
+        return [], {}, "This message isn't from PokéMeow. 🐾"
+
+    if not message.embeds:
+        return [], {}, "This message doesn't have an embed. 🐾"
+
+    if not message.embeds[0].description:
+        return [], {}, "This embed has no description. 🐾"
+
+    return [message], {}, None
+
+
 # 🌸──────────────────────────────────────────────
 #  Add Missing Pokémon Function
 # 🌸──────────────────────────────────────────────
@@ -170,6 +310,7 @@ async def missing_pokemon_box_func(
     interaction: discord.Interaction,
     message_link: str,
     exemption: str = None,
+    last_message_link: str = None,
 ):
     handler = await pretty_defer(
         interaction=interaction,
@@ -184,25 +325,32 @@ async def missing_pokemon_box_func(
         )
         return
 
-    success, message, error_msg = await fetch_message_from_link(bot, message_link)
-    if not success:
+    pages, skipped, error_msg = await collect_box_pages(
+        bot, message_link, last_message_link, user=interaction.user
+    )
+    if error_msg:
         return await handler.error(error_msg)
+    if not pages:
+        if any(skipped.values()):
+            return await handler.error(
+                f"No box pages of yours found in those links (skipped {format_skipped(skipped)}). 🐾"
+            )
+        return await handler.error("No PokéMeow box pages found in those links. 🐾")
 
-    if message.author.id != POKEMEOW_APPLICATION_ID:
-        return await handler.error("This message isn't from PokéMeow. 🐾")
-
-    if not message.embeds:
-        return await handler.error("This message doesn't have an embed. 🐾")
-
-    embed = message.embeds[0]
-    if not embed.description:
-        return await handler.error("This embed has no description. 🐾")
-
-    # Parse missing Pokémon with Dex numbers
-    missing = parse_missing_pokemon_with_dex(embed.description)
+    # Parse missing Pokémon with Dex numbers, merged across pages
+    missing = merge_missing_pages(
+        [parse_missing_pokemon_with_dex(page.embeds[0].description) for page in pages]
+    )
 
     if not missing:
-        return await handler.success("🎉 You have all Pokémon for this page!")
+        content = (
+            "🎉 You have all Pokémon for this page!"
+            if len(pages) == 1
+            else f"🎉 You have all Pokémon across {len(pages)} pages!"
+        )
+        if any(skipped.values()):
+            content += f" (skipped {format_skipped(skipped)})"
+        return await handler.success(content)
 
     # Determine which categories to skip
     skip_map = {
@@ -216,9 +364,14 @@ async def missing_pokemon_box_func(
     skipped_categories = skip_map.get(exemption, [])
 
     # Build pastel pink embed
+    description = "Here’s what you’re missing! 💖"
+    if len(pages) > 1 or any(skipped.values()):
+        description += f"\nScanned **{len(pages)}** page(s)"
+        if any(skipped.values()):
+            description += f" (skipped {format_skipped(skipped)})"
     result_embed = discord.Embed(
         title="📜 Missing Pokémon",
-        description="Here’s what you’re missing! 💖",
+        description=description,
         color=0xFFB6C1,  # Pastel pink
     )
 
@@ -231,9 +384,10 @@ async def missing_pokemon_box_func(
             )
         else:
             # Format tuples (dex, name) as "Dex • Name"
-            formatted = [f"{dex:03d} • {name}" for dex, name in pokemons]
             result_embed.add_field(
-                name=f"💖 {category}", value="\n".join(formatted), inline=False
+                name=f"💖 {category} ({len(pokemons)})",
+                value=format_missing_field(pokemons),
+                inline=False,
             )
 
     # After building the embed
@@ -292,9 +446,12 @@ class RemoveDexModal(discord.ui.Modal):
             )
             for category, pokemons in self.missing_data.items():
                 if pokemons:
-                    formatted = [f"{dex:03d} • {format_display_pokemon_name(name)}" for dex, name in pokemons]
                     embed.add_field(
-                        name=f"💖 {category}", value="\n".join(formatted), inline=False
+                        name=f"💖 {category}",
+                        value=format_missing_field(
+                            pokemons, format_display_pokemon_name
+                        ),
+                        inline=False,
                     )
             await interaction.response.edit_message(embed=embed)
         else:
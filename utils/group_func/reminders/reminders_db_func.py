@@ -4,6 +4,7 @@ import discord
 # 🟣 Reminder ID Autocomplete
 from discord import app_commands
 
+from utils.background_task.user_reminder_scheduler import user_reminder_scheduler
 from utils.logs.pretty_log import pretty_log
 
 # 🔮────────────────────────────────────────────
@@ -75,12 +76,13 @@ async def upsert_user_reminder(
         user_reminder_id = row["next_id"]
 
 
-        await conn.execute(
+        inserted = await conn.fetchrow(
             """
             INSERT INTO user_reminders
             (user_id, user_reminder_id, user_name, message, ping_role_1, ping_role_2,
              remind_on, repeat_interval, title, color, image_url, thumbnail_url, footer_text)
-            VALUES ($1,$2,$3,$4,$5,$6,$7,$8,$9,$10,$11,$12,$13);
+            VALUES ($1,$2,$3,$4,$5,$6,$7,$8,$9,$10,$11,$12,$13)
+            RETURNING *;
             """,
             user_id,
             user_reminder_id,
@@ -96,6 +98,7 @@ async def upsert_user_reminder(
             thumbnail_url,
             footer_text,
         )
+    user_reminder_scheduler.upsert(inserted)
 
 # 🟣 Update Reminder by User Reminder ID
 async def update_user_reminder(
@@ -137,7 +140,8 @@ async def update_user_reminder(
             query = f"""
             UPDATE user_reminders
             SET {', '.join(set_clauses)}
-            WHERE user_id = ${len(values)-1} AND user_reminder_id = ${len(values)};
+            WHERE user_id = ${len(values)-1} AND user_reminder_id = ${len(values)}
+            RETURNING *;
             """
 
             pretty_log(
@@ -145,17 +149,18 @@ async def update_user_reminder(
                 message=f"[Reminder Update] Attempting update for user_id={user_id}, reminder_id={user_reminder_id}, fields={fields}",
             )
 
-            result = await conn.execute(query, *values)
+            updated = await conn.fetchrow(query, *values)
 
-            if result == "UPDATE 0":
+            if updated is None:
                 pretty_log(
                     tag="warn",
                     message=f"[Reminder Update] No rows matched for user_id={user_id}, reminder_id={user_reminder_id}",
                 )
             else:
+                user_reminder_scheduler.upsert(updated)
                 pretty_log(
                     tag="success",
-                    message=f"[Reminder Update] Success: {result} for user_id={user_id}, reminder_id={user_reminder_id}",
+                    message=f"[Reminder Update] Success for user_id={user_id}, reminder_id={user_reminder_id}",
                 )
 
         except Exception as e:
@@ -167,12 +172,69 @@ async def update_user_reminder(
             raise
 
 
+# 🟣 Bulk Reschedule / Delete after Delivery
+async def apply_reminder_transitions(
+    bot,
+    reschedules: list[tuple[int, int, int]],
+    deletions: list[tuple[int, int]],
+):
+    """
+    Commit a delivered batch in one transaction:
+      - reschedules: (user_id, user_reminder_id, new_remind_on) for repeating reminders
+      - deletions: (user_id, user_reminder_id) for one-off reminders
+    Uses array parameters, so it's two statements regardless of batch size.
+    """
+    if not reschedules and not deletions:
+        return
+
+    async with bot.pg_pool.acquire() as conn:
+        async with conn.transaction():
+            updated = []
+            if reschedules:
+                user_ids, reminder_ids, remind_ons = map(list, zip(*reschedules))
+                updated = await conn.fetch(
+                    """
+                    UPDATE user_reminders AS r
+                    SET remind_on = v.remind_on
+                    FROM unnest($1::bigint[], $2::bigint[], $3::bigint[])
+                         AS v(user_id, user_reminder_id, remind_on)
+                    WHERE r.user_id = v.user_id
+                      AND r.user_reminder_id = v.user_reminder_id
+                    RETURNING r.*;
+                    """,
+                    user_ids,
+                    reminder_ids,
+                    remind_ons,
+                )
+            if deletions:
+                user_ids, reminder_ids = map(list, zip(*deletions))
+                await conn.execute(
+                    """
+                    DELETE FROM user_reminders AS r
+                    USING unnest($1::bigint[], $2::bigint[])
+                          AS v(user_id, user_reminder_id)
+                    WHERE r.user_id = v.user_id
+                      AND r.user_reminder_id = v.user_reminder_id;
+                    """,
+                    user_ids,
+                    reminder_ids,
+                )
+
+    # Sync the scheduler only once the transaction has committed
+    for row in updated:
+        user_reminder_scheduler.upsert(row)
+    for user_id, user_reminder_id in deletions:
+        user_reminder_scheduler.discard(user_id, user_reminder_id)
+
+
 # 🟣 Update by Field
 async def update_reminder_field(bot, reminder_id: int, field: str, value):
     """Update a single field for a given reminder_id."""
     async with bot.pg_pool.acquire() as conn:
-        query = f"UPDATE user_reminders SET {field} = $1 WHERE reminder_id = $2;"
-        await conn.execute(query, value, reminder_id)
+        query = f"UPDATE user_reminders SET {field} = $1 WHERE reminder_id = $2 RETURNING *;"
+        updated = await conn.fetchrow(query, value, reminder_id)
+    if updated is not None:
+        user_reminder_scheduler.upsert(updated)
 
 
 # 🟣 Update multiple fields for a reminder
@@ -200,18 +262,23 @@ async def update_reminder_fields(bot, reminder_id: int, fields: dict):
 
         # Append the reminder_id as the last parameter
         values.append(reminder_id)
-        query = f"UPDATE user_reminders SET {', '.join(set_clauses)} WHERE reminder_id = ${len(values)};"
+        query = f"UPDATE user_reminders SET {', '.join(set_clauses)} WHERE reminder_id = ${len(values)} RETURNING *;"
 
-        await conn.execute(query, *values)
+        updated = await conn.fetchrow(query, *values)
+    if updated is not None:
+        user_reminder_scheduler.upsert(updated)
 
 
 # 🟣 Remove One
 async def remove_reminder(bot, reminder_id: int):
     """Remove a reminder by reminder_id."""
     async with bot.pg_pool.acquire() as conn:
-        await conn.execute(
-            "DELETE FROM user_reminders WHERE reminder_id = $1;", reminder_id
+        deleted = await conn.fetchrow(
+            "DELETE FROM user_reminders WHERE reminder_id = $1 RETURNING user_id, user_reminder_id;",
+            reminder_id,
         )
+    if deleted is not None:
+        user_reminder_scheduler.discard(deleted["user_id"], deleted["user_reminder_id"])
 
 
 # 🟣 Fetch One
@@ -246,6 +313,7 @@ async def remove_all_user_reminders(bot, user_id: int):
     """Delete all reminders for a given user."""
     async with bot.pg_pool.acquire() as conn:
         await conn.execute("DELETE FROM user_reminders WHERE user_id = $1;", user_id)
+    user_reminder_scheduler.discard_user(user_id)
 
 
 # 🟣 Remove One Reminder by User-Scoped ID
@@ -263,8 +331,9 @@ async def remove_user_reminder(bot, user_id: int, user_reminder_id: int):
             user_id,
             user_reminder_id,
         )
-        # asyncpg execute returns a string like "DELETE 1" if a row was deleted
-        return result.split()[-1] != "0"
+    user_reminder_scheduler.discard(user_id, user_reminder_id)
+    # asyncpg execute returns a string like "DELETE 1" if a row was deleted
+    return result.split()[-1] != "0"
 
 
 # 🟣 Fetch All
@@ -1,4 +1,3 @@
-import re
 from typing import List
 
 import discord
@@ -12,6 +11,7 @@ from utils.db.auction_reminder_db import (
     upsert_auction_reminder,
 )
 from utils.logs.pretty_log import pretty_log
+from utils.parsers.pokemeow_patterns import AUCTION_ENDS_PATTERN
 from utils.pokemeow.get_pokemeow_reply import get_pokemeow_reply_member
 
 # Track processed (ends_on, message_id) pairs in memory
@@ -165,9 +165,9 @@ def extract_unique_auction_end_timestamps(embed_description: str) -> List[int]:
     Only timestamps after 'Ends <t:...:R>' are returned. Ignores 'Bid placed <t:...:R>'.
     Returns a list of unique integer timestamps.
     """
-    # Regex to match 'Ends <t:TIMESTAMP:R>'
-    ends_pattern = re.compile(r"Ends <t:(\d+):R>")
-    timestamps = set(int(match) for match in ends_pattern.findall(embed_description))
+    timestamps = set(
+        int(match) for match in AUCTION_ENDS_PATTERN.findall(embed_description)
+    )
     return list(timestamps)
 
 
@@ -1,5 +1,3 @@
-import re
-
 import discord
 
 from config.aesthetic import *
@@ -9,6 +7,7 @@ from config.fairy_tale_constants import (
     MEW_COLOR,
 )
 from utils.logs.pretty_log import pretty_log
+from utils.parsers.pokemeow_patterns import NPC_SET_LINE_PATTERN
 from utils.pokemeow.get_pokemeow_reply import get_pokemeow_reply_member
 
 
@@ -23,9 +22,8 @@ def get_npc_info(message: str) -> tuple[str, str] | None:
     Returns:
         tuple[str, str] | None: (emoji_url, npc_name) if found, otherwise None.
     """
-    # Regex: look for "- Set <emoji> **Name**"
-    pattern = r"- Set\s+<:([a-zA-Z0-9_]+):(\d+)>\s+\*\*(.*?)\*\*"
-    match = re.search(pattern, message)
+    # Look for "- Set <emoji> **Name**"
+    match = NPC_SET_LINE_PATTERN.search(message)
     if match:
         raw_name, emoji_id, npc_name = match.groups()
         emoji_url = f"https://cdn.discordapp.com/emojis/{emoji_id}.png"
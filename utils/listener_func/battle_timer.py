@@ -1,5 +1,4 @@
 import asyncio
-import re
 from datetime import datetime
 
 import discord
@@ -8,13 +7,17 @@ from discord.ext import commands
 from config.aesthetic import Emojis
 from config.settings import POKEMEOW_APPLICATION_ID, BATTLE_TIMER
 from utils.cache.cache_list import timer_cache
+from utils.cache.member_name_cache import find_member_by_name
+from utils.essentials.timer_scheduler import command_timers
 from utils.logs.debug_logs import debug_log, enable_debug
 from utils.logs.pretty_log import pretty_log
+from utils.parsers.pokemeow_patterns import (
+    BATTLE_CHALLENGE_PATTERN,
+    BATTLE_ENEMY_ID_PATTERN,
+)
 
 # enable_debug(f"{__name__}.detect_pokemeow_battle")
 # enable_debug(f"{__name__}.grab_enemy_id")
-# 🗂 Track scheduled "command ready" tasks to avoid duplicates
-battle_ready_tasks = {}
 
 
 # 💜────────────────────────────────────────────
@@ -41,10 +44,7 @@ async def battle_timer_handler(bot: commands.Bot, message: discord.Message):
         debug_log(f"Embed description: {description}")
 
         # Format: "**Alice** challenged **Bob** to a battle!"
-        match = re.search(
-            r"(?:<:\w+?:\d+>\s*)?\*\*(.+?)\*\* challenged (?:<:\w+?:\d+>\s*)?\*\*(.+?)\*\*",
-            description,
-        )
+        match = BATTLE_CHALLENGE_PATTERN.search(description)
         if not match:
             debug_log("Regex failed: no challenger/opponent match")
             return
@@ -57,11 +57,7 @@ async def battle_timer_handler(bot: commands.Bot, message: discord.Message):
 
         # ✅ Match challenger in guild
         guild = message.guild
-        challenger = discord.utils.find(
-            lambda m: m.name.lower() == challenger_name.lower()
-            or m.display_name.lower() == challenger_name.lower(),
-            guild.members,
-        )
+        challenger = find_member_by_name(guild, challenger_name)
         if not challenger:
             debug_log("Challenger not found in guild members")
             return
@@ -77,14 +73,6 @@ async def battle_timer_handler(bot: commands.Bot, message: discord.Message):
         if setting == "off":
             return
 
-        # ✅ Cancel existing task if user already has one
-        if (
-            challenger.id in battle_ready_tasks
-            and not battle_ready_tasks[challenger.id].done()
-        ):
-            debug_log("Cancelling existing timer task")
-            battle_ready_tasks[challenger.id].cancel()
-
         # ✅ Storage for enemy_id (filled later)
         enemy_id_holder = {"id": None}
 
@@ -121,7 +109,7 @@ async def battle_timer_handler(bot: commands.Bot, message: discord.Message):
                 footer_text = emb.footer.text if emb.footer else ""
                 debug_log(f"Follow-up footer text: {footer_text}")
 
-                enemy_match = re.search(r"Enemy ID:\s*(\d+)", footer_text)
+                enemy_match = BATTLE_ENEMY_ID_PATTERN.search(footer_text)
                 if enemy_match:
                     enemy_id_holder["id"] = enemy_match.group(1)
                     debug_log(
@@ -139,8 +127,6 @@ async def battle_timer_handler(bot: commands.Bot, message: discord.Message):
         # 💜 Step 4: schedule 60s notification immediately
         async def notify_battle_ready():
             try:
-                debug_log("Timer started (60s)")
-                await asyncio.sleep(BATTLE_TIMER)
                 enemy_id = enemy_id_holder["id"]
 
                 debug_log(f"Timer finished. Enemy ID={enemy_id}")
@@ -164,13 +150,15 @@ async def battle_timer_handler(bot: commands.Bot, message: discord.Message):
                         # embed=battle_embed,
                     )
 
-            except asyncio.CancelledError:
-                debug_log("Timer task cancelled")
             except Exception as e:
                 debug_log(f"Timer task error: {e}")
 
-        battle_ready_tasks[challenger.id] = bot.loop.create_task(notify_battle_ready())
-        debug_log("Scheduled notify_battle_ready() task", highlight=True)
+        # ✅ Replaces (cancels) any pending battle timer for this challenger
+        if command_timers.schedule(
+            "battle", challenger.id, BATTLE_TIMER, notify_battle_ready
+        ):
+            debug_log("Cancelled existing timer task")
+        debug_log("Scheduled notify_battle_ready() timer", highlight=True)
 
     except Exception as e:
         pretty_log("critical", f"Unhandled exception in detect_pokemeow_battle: {e}")
@@ -1,11 +1,10 @@
-import re
-
 import discord
 
 from config.aesthetic import Emojis
 from utils.cache.cache_list import battle_tower_cache
 from utils.db.battletower_db import register_battletower_user
 from utils.logs.pretty_log import pretty_log
+from utils.parsers.pokemeow_patterns import EMOJI_NAME_PATTERN
 from utils.pokemeow.get_pokemeow_reply import (
     get_command_user,
     get_pokemeow_reply_member,
@@ -37,7 +36,7 @@ def extract_battletower_npc_from_embed(embed: discord.Embed) -> str | None:
     if challenged_idx == -1:
         return None
     after_challenged = embed.description[challenged_idx:]
-    match = re.search(r"<:([a-zA-Z0-9_]+):[0-9]+>", after_challenged)
+    match = EMOJI_NAME_PATTERN.search(after_challenged)
     if match:
         return match.group(1)
     return None
@@ -1,4 +1,3 @@
-import re
 from datetime import datetime
 
 import discord
@@ -8,20 +7,13 @@ from config.settings import POKEMEOW_APPLICATION_ID
 from utils.cache.cache_list import timer_cache
 from utils.db.schedule_db_func import delete_user_schedule, upsert_user_schedule
 from utils.logs.pretty_log import pretty_log
+from utils.parsers.pokemeow_patterns import (
+    CATCHBOT_EMBED_PATTERN,
+    CATCHBOT_RUN_PATTERN,
+    CHECKLIST_CB_PATTERN,
+)
 from utils.pokemeow.get_pokemeow_reply import get_pokemeow_reply_member
 from config.aesthetic import Emojis
-# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-# 🎀 Regex Patterns
-# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-CATCHBOT_RUN_PATTERN = re.compile(r"in \*\*(\d+)([hHmM])\*\*", re.IGNORECASE)
-CATCHBOT_EMBED_PATTERN = re.compile(r"It will be back on .*?<t:(\d+):f>", re.IGNORECASE)
-CHECKLIST_CB_PATTERN = re.compile(
-    r"Your catch bot will be back on <t:(\d+):f>", re.IGNORECASE
-)
-CATCHBOT_RETURNED_PATTERN = re.compile(
-    r":confetti_ball: \*\*Your catchbot returned with \d+ Pokemon!?\*\*",
-    re.IGNORECASE,
-)
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -240,13 +232,9 @@ async def handle_cb_return_message(bot, message: discord.Message):
         if cb_setting == "off":
             return None
 
+        # 🔹 Clears the catchbot schedule from DB and cache
         await delete_user_schedule(bot, user.id, "catchbot")
 
-        # 🔹 Clear catchbot schedule from cache
-        from utils.cache.schedule_cache import remove_schedule_cached
-
-        remove_schedule_cached(user.id, "catchbot")
-
         pretty_log(
             tag="info",
             message=f"[CB RETURN] Cleared catchbot schedule for {user.name}",
@@ -308,7 +296,7 @@ async def extract_and_save_catchbot_schedule(
             )
             return "unchanged"
 
-        # 💾 Write to DB - Delete existing then insert new
+        # 💾 Write to DB - Delete existing then insert new (cache follows each write)
         await delete_user_schedule(bot, user.id, "catchbot")
         await upsert_user_schedule(
             bot=bot,
@@ -319,16 +307,6 @@ async def extract_and_save_catchbot_schedule(
             channel_id=channel_id,
         )
 
-        # 🗃️ Update cache - Remove old and fetch fresh
-        from utils.cache.schedule_cache import (
-            fetch_user_schedules_cached,
-            remove_schedule_cached,
-        )
-
-        remove_schedule_cached(user.id, "catchbot")
-        # Fetch updated schedules to refresh cache with new reminder_id
-        await fetch_user_schedules_cached(bot, user.id)
-
         pretty_log(
             tag="info",
             message=f"[CB SAVE] Stored schedule {timestamp} for {user.name}",
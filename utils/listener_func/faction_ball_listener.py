@@ -1,5 +1,3 @@
-import re
-
 import discord
 
 from config.faction_data import get_faction_by_emoji
@@ -7,6 +5,11 @@ from utils.cache.cache_list import daily_faction_ball_cache, user_info_cache
 from utils.db.daily_faction_ball_db import fetch_all_faction_balls, update_faction_ball
 from utils.db.user_info_db_func import set_user_info, update_faction
 from utils.logs.pretty_log import pretty_log
+from utils.parsers.pokemeow_patterns import (
+    FACTION_DAILY_BALL_PATTERN,
+    FACTION_TARGET_BALL_PATTERN,
+    FACTION_TEAM_AUTHOR_PATTERN,
+)
 from utils.pokemeow.get_pokemeow_reply import get_pokemeow_reply_member
 
 
@@ -25,10 +28,7 @@ async def extract_faction_ball_from_daily(bot, message: discord.Message):
         return
 
     # Regex to match: <:team_logo:ID> **|** Your Faction's daily ball-type is <:ball_emoji:ID> BallName
-    match = re.search(
-        r"(<:team_logo:\d+>) \*\*\|\*\* Your Faction's daily ball-type is (<:[^:]+:\d+>) (\w+ball)",
-        embed.description,
-    )
+    match = FACTION_DAILY_BALL_PATTERN.search(embed.description)
     if not match:
         return
 
@@ -94,7 +94,7 @@ async def extract_faction_ball_from_fa(bot, message: discord.Message):
     if not embed.author or not embed.author.name:
         return
 
-    author_match = re.search(r"Team (\w+)", embed.author.name)
+    author_match = FACTION_TEAM_AUTHOR_PATTERN.search(embed.author.name)
     if not author_match:
         return
 
@@ -133,10 +133,7 @@ async def extract_faction_ball_from_fa(bot, message: discord.Message):
     if not embed.description:
         return
 
-    ball_match = re.search(
-        r"<:([a-zA-Z0-9_]+):\d+>\s+\*\*Today's target Pokemon are\*\*",
-        embed.description,
-    )
+    ball_match = FACTION_TARGET_BALL_PATTERN.search(embed.description)
     if not ball_match:
         return
     daily_ball = ball_match.group(1)
@@ -1,5 +1,3 @@
-import re
-
 import discord
 
 from config.aesthetic import Emojis, FACTION_LOGO_EMOJIS
@@ -9,7 +7,9 @@ from utils.cache.cache_list import (
     user_info_cache,
     utility_cache,
 )
+from utils.cache.member_name_cache import find_member_by_name
 from utils.logs.pretty_log import pretty_log
+from utils.parsers.pokemeow_patterns import FIRST_BOLD_PATTERN, TEAM_LOGO_PATTERN
 from utils.pokemeow.get_pokemeow_reply import get_pokemeow_reply_member
 
 FISHING_COLOR = 0x87CEFA
@@ -30,7 +30,7 @@ async def faction_hunt_alert(bot, before: discord.Message, after: discord.Messag
         return
 
     # Regex to match: <:team_logo:ID>
-    team_logo_emoji = re.findall(r"<:team_logo:\d+>", description_text)
+    team_logo_emoji = TEAM_LOGO_PATTERN.findall(description_text)
 
     if len(team_logo_emoji) != 1:
         return
@@ -58,12 +58,14 @@ async def faction_hunt_alert(bot, before: discord.Message, after: discord.Messag
                 trainer_id = resolved_author.id if resolved_author else None
 
             if not trainer_id and after.embeds[0].description:
-                name_match = re.search(r"\*\*(.+?)\*\*", after.embeds[0].description)
+                name_match = FIRST_BOLD_PATTERN.search(after.embeds[0].description)
                 if name_match:
                     trainer_name = name_match.group(1)
-                    user = discord.utils.find(
-                        lambda m: m.display_name == trainer_name,
-                        after.guild.members,
+                    user = find_member_by_name(
+                        after.guild,
+                        trainer_name,
+                        case_sensitive=True,
+                        match_name=False,
                     )
                     fishing_trainer_id = user.id if user else None
 
@@ -77,8 +79,8 @@ async def faction_hunt_alert(bot, before: discord.Message, after: discord.Messag
     elif trainer_id:
         user_id = trainer_id
     elif trainer_name:
-        user = discord.utils.find(
-            lambda m: m.display_name == trainer_name, after.guild.members
+        user = find_member_by_name(
+            after.guild, trainer_name, case_sensitive=True, match_name=False
         )
         user_id = user.id if user else None
 
@@ -8,14 +8,11 @@ from discord.ext import commands
 from config.aesthetic import Emojis
 from config.settings import POKEMEOW_APPLICATION_ID, FISH_TIMER
 from utils.cache.cache_list import timer_cache  # 💜 import your cache
+from utils.essentials.timer_scheduler import command_timers
 from utils.logs.pretty_log import pretty_log
 from utils.pokemeow.get_pokemeow_reply import get_pokemeow_reply_member
 
 
-# 🗂 Track scheduled "command ready" tasks to avoid duplicates
-fish_ready_tasks = {}
-
-
 # 💜────────────────────────────────────────────
 #   Function: detect_pokemeow_reply
 #   Handles Pokemon timer notifications per user settings
@@ -47,18 +44,12 @@ async def fish_timer_handler(message: discord.Message):
         if setting == "off":
             return
 
-        # Cancel previous ready task if any
-        if member.id in fish_ready_tasks and not fish_ready_tasks[member.id].done():
-            fish_ready_tasks[member.id].cancel()
-
         # Schedule behavior depending on setting
         async def notify_ready():
             # 💜────────────────────────────────────────────
-            #   Fish Timer Notification Task
+            #   Fish Timer Notification (fired by scheduler)
             # 💜────────────────────────────────────────────
             try:
-                await asyncio.sleep(FISH_TIMER)
-
                 if setting == "on":
                     await message.channel.send(
                         f"{Emojis.fish_spawn} {member.mention}, your </fish spawn:1015311084812501026> command is ready! "
@@ -68,12 +59,6 @@ async def fish_timer_handler(message: discord.Message):
                         f"{Emojis.fish_spawn} **{member.display_name}**, your </fish spawn:1015311084812501026> command is ready!"
                     )
 
-            except asyncio.CancelledError:
-                # 💙 [CANCELLED] Scheduled ready notification cancelled
-                pretty_log(
-                    tag="info",
-                    message=f"Cancelled scheduled ready notification for {member}",
-                )
             except Exception as e:
                 # 💜 [MISSED] Timer ran correctly but message failed
                 # Trackable: include member ID and username
@@ -85,7 +70,13 @@ async def fish_timer_handler(message: discord.Message):
                     ),
                 )
 
-        fish_ready_tasks[member.id] = asyncio.create_task(notify_ready())
+        # Replaces (cancels) any pending Fish timer for this member
+        if command_timers.schedule("fish", member.id, FISH_TIMER, notify_ready):
+            # 💙 [CANCELLED] Previous scheduled ready notification replaced
+            pretty_log(
+                tag="info",
+                message=f"Cancelled scheduled ready notification for {member}",
+            )
 
     except Exception as e:
         pretty_log(
@@ -1,10 +1,12 @@
-import re
-
 import discord
 
 from config.aesthetic import *
 from config.fairy_tale_constants import FAIRY_TAIL__TEXT_CHANNELS, FAIRY_TAIL_SERVER_ID
 from utils.logs.pretty_log import pretty_log
+from utils.parsers.pokemeow_patterns import (
+    GOLDEN_STONE_EMOJI_PATTERN,
+    MEGA_CHAMBER_COMPLETED_PATTERN,
+)
 from utils.pokemeow.get_pokemeow_reply import get_pokemeow_reply_member
 
 #🌺🧸────────────────────────────────────────────🌺🧸
@@ -22,8 +24,7 @@ def get_golden_stone_info(message: str) -> tuple[str, str] | None:
     Returns:
         tuple[str, str] | None: (emoji_url, stone_name) if found, otherwise None.
     """
-    pattern = r"<:golden_([a-zA-Z0-9_]+):(\d+)>"
-    match = re.search(pattern, message)
+    match = GOLDEN_STONE_EMOJI_PATTERN.search(message)
     if match:
         raw_name, emoji_id = match.groups()
         # Format the stone name: remove underscores, title case
@@ -44,8 +45,7 @@ def get_mega_chamber(message: str) -> str | None:
         str | None: The challenge name (e.g. 'Mega Ampharos') if found, otherwise None.
     """
     # Look for bolded text after 'completed the' phrase
-    pattern = r"completed the .*?\*\*(.*?)\*\*"
-    match = re.search(pattern, message)
+    match = MEGA_CHAMBER_COMPLETED_PATTERN.search(message)
     if match:
         return match.group(1)
     return None
@@ -1,10 +1,9 @@
-import re
-
 import discord
 
 from config.aesthetic import Emojis
 from config.held_item import *
 from utils.logs.pretty_log import pretty_log
+from utils.parsers.pokemeow_patterns import HELD_ITEM_SPAWN_PATTERN
 from utils.pokemeow.get_pokemeow_reply import get_pokemeow_reply_member
 
 
@@ -33,16 +32,8 @@ async def held_item_ping(message: discord.Message):
 
     # --- Held item ---
     held_pokemon = None
-    # Regex: extract optional held item and Pokemon name
-    pattern = (
-        r"(?:<:[^:]+:\d+>\s*)?"  # optional leading NPC emoji
-        r"\*\*.+?\*\*\s*found a wild\s*"
-        r"(?P<teamlogo><:team_logo:\d+>)?\s*"  # optional team logo emoji
-        r"(?P<held><:held_item:\d+>)?\s*"  # optional held item emoji
-        r"(?:<:[^:]+:\d+>\s*)+"  # Pokemon emoji (+ optional dexCaught)
-        r"\*\*(?P<pokemon>[A-Za-z_]+)\*\*"  # pokemon name
-    )
-    matches = re.finditer(pattern, description_text)
+    # Extract optional held item and Pokemon name
+    matches = HELD_ITEM_SPAWN_PATTERN.finditer(description_text)
     for match in matches:
         pokemon_name = match.group("pokemon").lower()
         has_held_item = bool(match.group("held"))
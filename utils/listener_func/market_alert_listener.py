@@ -2,8 +2,6 @@
 #           💜 Market Alert Processor 💜
 # ────────────────────────────────────────────
 
-import re
-
 import discord
 from discord import Embed
 
@@ -11,15 +9,18 @@ from config.aesthetic import Emojis
 from config.rarity import rarity_meta
 from config.settings import *
 from utils.cache.cache_list import (
-    _market_alert_index,
-    _missing_pokemon_index,
-    market_alert_cache,
     market_value_cache,
-    missing_pokemon_cache,
     processed_market_feed_message_ids
 )
-from utils.db.market_value_db_func import set_market_value
+from utils.cache.market_alert_cache import fetch_alerts_for_pokemon
+from utils.cache.missing_pokemon_cache import fetch_missing_for_pokemon
+from utils.db.market_value_db_func import queue_market_value
 from utils.logs.pretty_log import pretty_log
+from utils.parsers.pokemeow_patterns import (
+    EMOJI_TAG_PATTERN,
+    MARKET_AUTHOR_PATTERN,
+    NUMBER_WITH_COMMAS_PATTERN,
+)
 from utils.visuals.name_helpers import format_display_pokemon_name
 from utils.logs.debug_logs import debug_enabled, debug_log, enable_debug
 PokeCoin = Emojis.PokeCoin
@@ -99,7 +100,7 @@ async def process_market_alert_message(
         debug_log(f"Processing embed in message.id={message.id}")
         embed_author_name = embed.author.name if embed.author else ""
 
-        match = re.match(r"(.+?)\s+#(\d+)", embed_author_name)
+        match = MARKET_AUTHOR_PATTERN.match(embed_author_name)
         if not match:
             pretty_log("debug", f"Could not parse embed author name: {embed_author_name}")
             return
@@ -108,8 +109,8 @@ async def process_market_alert_message(
         poke_dex = int(match.group(2))
         fields = {f.name: f.value for f in embed.fields}
 
-        listed_price_str = re.sub(r"<a?:\w+:\d+>", "", fields.get("Listed Price", "0"))
-        match_price = re.search(r"(\d[\d,]*)", listed_price_str)
+        listed_price_str = EMOJI_TAG_PATTERN.sub("", fields.get("Listed Price", "0"))
+        match_price = NUMBER_WITH_COMMAS_PATTERN.search(listed_price_str)
         listed_price = int(match_price.group(1).replace(",", "")) if match_price else 0
         original_id = fields.get("ID", "0")
         embed_color = embed.color.value
@@ -117,34 +118,23 @@ async def process_market_alert_message(
         author_icon_url = embed.author.icon_url if embed.author else None
         thumbnail_url = embed.thumbnail.url if embed.thumbnail else None
 
-        # 🧩 Build Market Index (if needed) - Fix the indexing structure
-        # The cache loader uses 3-tuples, but we need pokemon-name lookup
-        temp_index = {}
-        for alert in market_alert_cache:
-            key = alert["pokemon"].lower()
-            temp_index.setdefault(key, []).append(alert)
-
-        # 💼 Lookup both Market + Missing
-        alerts_to_check = temp_index.get(poke_name.lower(), [])
-        missing_matches = [
-            m
-            for m in missing_pokemon_cache
-            if m.get("pokemon_name", "").lower() == poke_name.lower()
-        ]
-
-        # 🩵 Combine users from both caches
-        all_user_ids = {a["user_id"] for a in alerts_to_check} | {
-            m["user_id"] for m in missing_matches
-        }
+        # 💼 Lookup both Market + Missing (persistent per-pokemon indexes)
+        alerts_to_check = fetch_alerts_for_pokemon(poke_name)
+        missing_matches = fetch_missing_for_pokemon(poke_name)
+
+        # 🩵 Combine users from both caches (first entry per user wins)
+        market_by_user: dict[int, dict] = {}
+        for a in alerts_to_check:
+            market_by_user.setdefault(a["user_id"], a)
+        missing_by_user: dict[int, dict] = {}
+        for m in missing_matches:
+            missing_by_user.setdefault(m["user_id"], m)
+        all_user_ids = market_by_user.keys() | missing_by_user.keys()
 
         for user_id in all_user_ids:
             # Identify state
-            market_alert_entry = next(
-                (a for a in alerts_to_check if a["user_id"] == user_id), None
-            )
-            missing_entry = next(
-                (m for m in missing_matches if m["user_id"] == user_id), None
-            )
+            market_alert_entry = market_by_user.get(user_id)
+            missing_entry = missing_by_user.get(user_id)
 
             has_market = bool(market_alert_entry)
             has_missing = bool(missing_entry)
@@ -202,7 +192,7 @@ async def process_market_alert_message(
             for name, value in fields.items():
                 if name == "ID":
                     continue
-                value_cleaned = re.sub(r"<a?:\w+:\d+>", PokeCoin, value)
+                value_cleaned = EMOJI_TAG_PATTERN.sub(PokeCoin, value)
                 new_embed.add_field(name=name, value=value_cleaned)
 
             # 🌸 Footer message
@@ -288,10 +278,10 @@ async def process_market_alert_message(
             # Update market value cache with new listing data
             # Extract additional market data
             poke_dex = int(poke_dex)
-            lowest_market_str = re.sub(
-                r"<a?:\w+:\d+>", "", fields.get("Lowest Market", "0")
+            lowest_market_str = EMOJI_TAG_PATTERN.sub(
+                "", fields.get("Lowest Market", "0")
             )
-            lowest_market_match = re.search(r"(\d[\d,]*)", lowest_market_str)
+            lowest_market_match = NUMBER_WITH_COMMAS_PATTERN.search(lowest_market_str)
             lowest_market = (
                 int(lowest_market_match.group(1).replace(",", ""))
                 if lowest_market_match
@@ -347,7 +337,8 @@ async def process_market_alert_message(
             )
             market_value_cache[cache_key] = cache_update
             if needs_update:
-                await set_market_value(
+                # DB write is buffered and coalesced per Pokémon (write-behind)
+                queue_market_value(
                     bot,
                     pokemon_name=poke_name,
                     dex_number=int(poke_dex),
@@ -360,5 +351,5 @@ async def process_market_alert_message(
                 )
                 pretty_log(
                     "market_value",
-                    f"Updated market cache & DB for {poke_name}: embed_lowest={lowest_market:,}, current={listed_price:,}, true_lowest={true_lowest:,}, seen={listing_seen}",
+                    f"Updated market cache & queued DB write for {poke_name}: embed_lowest={lowest_market:,}, current={listed_price:,}, true_lowest={true_lowest:,}, seen={listing_seen}",
                 )
@@ -1,8 +1,7 @@
-import re
-
 import discord
 
 from utils.logs.pretty_log import pretty_log
+from utils.parsers.pokemeow_patterns import MARKET_PURCHASE_PATTERN
 from utils.pokemeow.get_pokemeow_reply import get_pokemeow_reply_member
 from utils.db.missing_pokemon_db_func import remove_missing_pokemon
 from config.aesthetic import *
@@ -20,9 +19,7 @@ async def get_purchased_pokemon(bot, message: discord.Message):
         return
 
     # Look for the Pokémon name between the last bold '**' and 'for <:PokeCoin'
-    match = re.search(
-        r"\*\*.*?\*\*\s*.*?\*\*\s*(.*?)\s*\*\*\s*for\s+<:PokeCoin", content
-    )
+    match = MARKET_PURCHASE_PATTERN.search(content)
     if not match:
         return
 
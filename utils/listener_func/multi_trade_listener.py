@@ -1,4 +1,3 @@
-import re
 import discord
 
 from config.aesthetic import Emojis
@@ -6,8 +5,15 @@ from utils.cache.missing_pokemon_cache import (
     find_pokemon_in_user_cache_single,
     remove_missing,
 )
+from utils.cache.member_name_cache import find_member_by_name
 from utils.db.missing_pokemon_db_func import remove_missing_pokemon
 from utils.logs.pretty_log import pretty_log
+from utils.parsers.pokemeow_patterns import (
+    MULTI_TRADE_OWNER_PATTERN,
+    STATIC_EMOJI_TAG_PATTERN,
+    STATIC_EMOJI_TAG_SPACED_PATTERN,
+    TRADE_QUANTITY_SUFFIX_PATTERN,
+)
 
 import discord
 
@@ -15,24 +21,8 @@ import discord
 #   💖 Fetch Guild Member by Name (with Caching) 💖
 # 🌸──────────────────────────────────────────────
 async def fetch_member_by_name(guild: discord.Guild, name: str):
-    # Try cache first
-    member = discord.utils.find(
-        lambda m: m.name.lower() == name.lower()
-        or m.display_name.lower() == name.lower(),
-        guild.members,
-    )
-    if member:
-        return member
-
-    # Optional: attempt to fetch all members (requires privileged intent)
-    try:
-        async for m in guild.fetch_members(limit=None):
-            if m.name.lower() == name.lower() or m.display_name.lower() == name.lower():
-                return m
-    except Exception:
-        pass
-
-    return None
+    # Member name index (kept current by member events) — no REST crawl
+    return find_member_by_name(guild, name)
 
 
 # 🌸──────────────────────────────────────────────
@@ -57,12 +47,12 @@ async def handle_multitrade_message(bot, message: discord.Message):
 
     # 💬 Extract Pokémon per user
     for field in message.embeds[0].fields:
-        name_match = re.search(r"\s(.+?)'s Pokemon", field.name)
+        name_match = MULTI_TRADE_OWNER_PATTERN.search(field.name)
         if not name_match:
             continue
 
         username_raw = name_match.group(1).strip()
-        username = re.sub(r"<:.+?:\d+>\s*", "", username_raw)
+        username = STATIC_EMOJI_TAG_SPACED_PATTERN.sub("", username_raw)
 
         content = field.value.strip()
         if content.lower() == "none":
@@ -71,8 +61,8 @@ async def handle_multitrade_message(bot, message: discord.Message):
 
         pokemons = []
         for line in content.splitlines():
-            line_clean = re.sub(r"<:.+?:\d+>", "", line).strip()
-            name_only = re.sub(r"\s*x\d+$", "", line_clean)
+            line_clean = STATIC_EMOJI_TAG_PATTERN.sub("", line).strip()
+            name_only = TRADE_QUANTITY_SUFFIX_PATTERN.sub("", line_clean)
             if name_only:
                 pokemons.append(name_only)
 
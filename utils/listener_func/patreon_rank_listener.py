@@ -1,10 +1,16 @@
-import re
-
 import discord
 
 from utils.cache.cache_list import user_info_cache
+from utils.cache.member_name_cache import find_member_by_name
 from utils.db.user_info_db_func import set_user_info, update_patreon_tier
 from utils.logs.pretty_log import pretty_log
+from utils.parsers.pokemeow_patterns import (
+    EMOJI_TAG_PATTERN,
+    MARKDOWN_EMPHASIS_PATTERN,
+    NON_USERNAME_CHARS_PATTERN,
+    PATREON_RANK_EMOJI_PATTERN,
+    PATREON_RANK_TITLE_PATTERN,
+)
 
 BANNED_PHRASES = {"PokeMeow Clans — Perks Info", "PokeMeow Clans — Rank Info"}
 PATREON_RANKS = {
@@ -27,10 +33,10 @@ def extract_username_from_title(title: str) -> str:
     <:emoji:id>**_0rz_** -> _0rz_
     """
     # Remove custom emojis (<:name:id> or <a:name:id>)
-    no_emoji = re.sub(r"<a?:\w+:\d+>", "", title)
+    no_emoji = EMOJI_TAG_PATTERN.sub("", title)
 
     # Remove bold/italic markdown (** or __ or *)
-    no_format = re.sub(r"[*]{1,2}|_{2}", "", no_emoji)
+    no_format = MARKDOWN_EMPHASIS_PATTERN.sub("", no_emoji)
 
     # Final cleanup: strip spaces only
     return no_format.strip()
@@ -59,7 +65,7 @@ async def extract_patreon_rank_from_perks_embed(
     # Remove the "'s perks" suffix
     author_name = author_name.replace("'s perks", "")
     # Now clean lightly if you want
-    cleaned_name = re.sub(r"[^\w\d.]", "", author_name)
+    cleaned_name = NON_USERNAME_CHARS_PATTERN.sub("", author_name)
     # -> "khy.09"
 
     # Check if user in user info cache
@@ -70,9 +76,11 @@ async def extract_patreon_rank_from_perks_embed(
         user = message.guild.get_member(user_id)
     elif not user_id:
         # Upsert user name to DB and cache
-        user = discord.utils.find(
-            lambda m: m.name == cleaned_name,
-            message.guild.members,
+        user = find_member_by_name(
+            message.guild,
+            cleaned_name,
+            case_sensitive=True,
+            match_display_name=False,
         )
         if user:
             user_id = user.id
@@ -97,7 +105,7 @@ async def extract_patreon_rank_from_perks_embed(
         new_patreon_rank = "no_perks"
 
     else:
-        patreon_rank_match = re.search(r"\*\*(\w+)\s+Patreon\*\*", title)
+        patreon_rank_match = PATREON_RANK_TITLE_PATTERN.search(title)
         new_patreon_rank = patreon_rank_match.group(1)
         new_patreon_rank = new_patreon_rank.lower() if new_patreon_rank else None
 
@@ -134,9 +142,8 @@ async def extract_patreon_rank_from_pro_embed(
         user = guild.get_member(user_id)
     elif not user_id:
         # Upsert user name to DB and cache
-        user = discord.utils.find(
-            lambda m: m.name == cleaned_name,
-            guild.members,
+        user = find_member_by_name(
+            guild, cleaned_name, case_sensitive=True, match_display_name=False
         )
         if user:
             user_id = user.id
@@ -158,7 +165,7 @@ async def extract_patreon_rank_from_pro_embed(
     if "patreonlogo" not in embed_description:
         new_patreon_rank = "no_perks"
     else:
-        match = re.search(r"<:patreonlogo:\d+>\s*<:(\w+):\d+>", embed_description)
+        match = PATREON_RANK_EMOJI_PATTERN.search(embed_description)
         new_patreon_rank = match.group(1)
         new_patreon_rank = new_patreon_rank.lower() if new_patreon_rank else None
 
@@ -1,5 +1,4 @@
 import asyncio
-import re
 from datetime import datetime
 
 import discord
@@ -8,10 +7,10 @@ from discord.ext import commands
 from config.aesthetic import Emojis
 from config.settings import POKEMEOW_APPLICATION_ID, POKEMON_TIMER
 from utils.cache.cache_list import timer_cache  # 💜 import your cache
+from utils.cache.member_name_cache import find_member_by_name
+from utils.essentials.timer_scheduler import command_timers
 from utils.logs.pretty_log import pretty_log
-
-# 🗂 Track scheduled "command ready" tasks to avoid duplicates
-ready_tasks = {}
+from utils.parsers.pokemeow_patterns import WILD_SPAWN_TRAINER_PATTERN
 
 
 # 💜────────────────────────────────────────────
@@ -31,7 +30,7 @@ async def pokemon_timer_handler(message: discord.Message):
         if message.author.id != POKEMEOW_APPLICATION_ID:
             return
 
-        match = re.search(r"\*\*(.+?)\*\* found a wild", message.content)
+        match = WILD_SPAWN_TRAINER_PATTERN.search(message.content)
         if not match:
             return
 
@@ -39,11 +38,7 @@ async def pokemon_timer_handler(message: discord.Message):
         guild = message.guild
 
         # Match member case-insensitive
-        member = discord.utils.find(
-            lambda m: m.name.lower() == username.lower()
-            or m.display_name.lower() == username.lower(),
-            guild.members,
-        )
+        member = find_member_by_name(guild, username)
         if not member:
             return
 
@@ -58,18 +53,12 @@ async def pokemon_timer_handler(message: discord.Message):
         if setting == "off":
             return
 
-        # Cancel previous ready task if any
-        if member.id in ready_tasks and not ready_tasks[member.id].done():
-            ready_tasks[member.id].cancel()
-
         # Schedule behavior depending on setting
         async def notify_ready():
             # 💜────────────────────────────────────────────
-            #   Pokemon Timer Notification Task
+            #   Pokemon Timer Notification (fired by scheduler)
             # 💜────────────────────────────────────────────
             try:
-                await asyncio.sleep(POKEMON_TIMER)
-
                 if setting == "on":
                     await message.channel.send(
                         f"{member.mention}, your Pokemon command is ready! {Emojis.Pink_Sparkles}"
@@ -81,12 +70,6 @@ async def pokemon_timer_handler(message: discord.Message):
                 elif setting == "react":
                     await message.add_reaction(Emojis.Pokemon_Timer_React)
 
-            except asyncio.CancelledError:
-                # 💙 [CANCELLED] Scheduled ready notification cancelled
-                pretty_log(
-                    tag="info",
-                    message=f"Cancelled scheduled ready notification for {member}",
-                )
             except Exception as e:
                 # 💜 [MISSED] Timer ran correctly but message failed
                 # Trackable: include member ID and username
@@ -98,7 +81,13 @@ async def pokemon_timer_handler(message: discord.Message):
                     ),
                 )
 
-        ready_tasks[member.id] = asyncio.create_task(notify_ready())
+        # Replaces (cancels) any pending Pokemon timer for this member
+        if command_timers.schedule("pokemon", member.id, POKEMON_TIMER, notify_ready):
+            # 💙 [CANCELLED] Previous scheduled ready notification replaced
+            pretty_log(
+                tag="info",
+                message=f"Cancelled scheduled ready notification for {member}",
+            )
 
     except Exception as e:
         pretty_log(
@@ -1,4 +1,3 @@
-import re
 import time
 from datetime import datetime
 
@@ -8,6 +7,7 @@ from discord.ext import commands
 from config.aesthetic import Emojis
 from config.settings import POKEMEOW_APPLICATION_ID
 from utils.cache.cache_list import timer_cache, user_info_cache
+from utils.cache.member_name_cache import find_member_by_name
 from utils.db.schedule_db_func import (
     delete_user_schedule,
     fetch_user_schedule,
@@ -16,6 +16,12 @@ from utils.db.schedule_db_func import (
 )
 from utils.db.user_info_db_func import set_user_info
 from utils.logs.pretty_log import pretty_log
+from utils.parsers.pokemeow_patterns import (
+    QUEST_AVAILABLE_PATTERN,
+    QUEST_COMPLETED_PATTERN,
+    QUEST_ENTRY_PATTERN,
+    QUEST_NEXT_IN_PATTERN,
+)
 from utils.pokemeow.get_pokemeow_reply import get_pokemeow_reply_member
 
 PATREON_QUEST_INFO_MAP = {
@@ -107,7 +113,7 @@ async def handle_quest_checklist_message(bot: commands.Bot, message: discord.Mes
         )
         return
 
-    match = re.search(r"Your next quest is available <t:(\d+):R>", embed_description)
+    match = QUEST_AVAILABLE_PATTERN.search(embed_description)
     quest_ready_timestamp = None
     if match:
         quest_ready_timestamp = int(match.group(1))
@@ -168,7 +174,7 @@ def count_current_quests(embed_description: str) -> int:
     Counts the number of active quests in the embed description.
     Example: Each quest starts with '**Quest #N**:'
     """
-    return len(re.findall(r"\*\*Quest #\d+\*\*:", embed_description))
+    return len(QUEST_ENTRY_PATTERN.findall(embed_description))
 
 
 # ────────────────────────────────────────────
@@ -178,9 +184,7 @@ def parse_footer_timer_to_unix_seconds(footer_text: str) -> int | None:
     """
     Parses a timer string like 'Next quest in: 1 H 59 M 59 S' and returns the future Unix timestamp.
     """
-    match = re.search(
-        r"Next quest in:\s*((?:(\d+)\s*H)?\s*((\d+)\s*M)?\s*((\d+)\s*S)?)", footer_text
-    )
+    match = QUEST_NEXT_IN_PATTERN.search(footer_text)
     if not match:
         return None
 
@@ -342,19 +346,14 @@ async def handle_quest_complete_message(bot, message: discord.Message):
         return
 
     # Get the username from the message
-    match = re.search(
-        r":notepad_spiral:\s+\*\*(.+?)\*\* completed the quest", message_content
-    )
+    match = QUEST_COMPLETED_PATTERN.search(message_content)
     if not match:
         return
     raw_username = match.group(1)
 
     # Get the member object from the guild
     guild = message.guild
-    member = discord.utils.find(
-        lambda m: m.name == raw_username or m.display_name == raw_username,
-        guild.members,
-    )
+    member = find_member_by_name(guild, raw_username, case_sensitive=True)
     if not member:
         return
 
@@ -1,5 +1,3 @@
-import re
-
 import discord
 
 from config.aesthetic import Emojis
@@ -7,12 +5,20 @@ from config.rarity import *
 from config.settings import MAIN_SERVER_ID, Channels, Roles, users
 from utils.cache.cache_list import market_value_cache
 from utils.cache.processed_msg_ids import processed_catch_and_fish_msgs
-from utils.logs.debug_logs import debug_log, enable_debug
+from utils.logs.debug_logs import DebugGuard, enable_debug
 from utils.logs.pretty_log import pretty_log
+from utils.parsers.pokemeow_patterns import (
+    BROKE_OUT_POKEMON_PATTERN,
+    CATCH_BALL_PATTERN,
+    CAUGHT_POKEMON_PATTERN,
+    RAN_AWAY_POKEMON_PATTERN,
+    RARITY_FOOTER_PATTERN,
+)
 from utils.pokemeow.get_pokemeow_reply import get_pokemeow_reply_member
 
 # enable_debug(f"{__name__}.catch_and_fish_message_rare_spawn_handler")
 # enable_debug(f"{__name__}.build_rare_spawn_embed")
+_debug = DebugGuard(__name__)
 
 HALLOWEEN_COLOR = 0xFFA500  # orange
 
@@ -28,13 +34,13 @@ rare_rarity = ["legendary", "shiny"]
 # ❀─────────────────────────────────────────❀
 def extract_rarity_from_footer(footer_text: str) -> str:
     # Extract rarity from embed footer
-    rarity_match = re.search(r"Rarity:\s*([A-Za-z]+)", footer_text)
+    rarity_match = RARITY_FOOTER_PATTERN.search(footer_text)
     if rarity_match:
         rarity = rarity_match.group(1).strip().lower().replace(" ", "")
-        debug_log(f"Extracted rarity: {rarity}")
+        _debug.log(f"Extracted rarity: {rarity}")
         return rarity
     else:
-        debug_log(
+        _debug.log(
             f"Could not extract rarity from footer: {footer_text}",
             highlight=True,
         )
@@ -50,29 +56,28 @@ async def catch_and_fish_message_rare_spawn_handler(
     """
     Handles catch and fish messages from PokéMeow to identify rare spawns.
     """
-    debug_log("Entered catch_and_fish_message_rare_spawn_handler")
+    _debug.log("Entered catch_and_fish_message_rare_spawn_handler")
     embed = after.embeds[0]
     if not embed:
-        debug_log("No embed found in message.", highlight=True)
+        _debug.log("No embed found in message.", highlight=True)
         return
 
     embed_color = embed.color.value
     embed_description = embed.description or ""
-    debug_log(f"Embed color: {embed_color}, description: {embed_description!r}")
+    if _debug:
+        _debug.log(f"Embed color: {embed_color}, description: {embed_description!r}")
 
     # Get Ball Used
     ball_used = None
     ball_emoji = None
-    ball_match = re.search(
-        r"<:([a-zA-Z0-9_]+):\d+>\s*([A-Za-z]+ball)", embed_description, re.IGNORECASE
-    )
+    ball_match = CATCH_BALL_PATTERN.search(embed_description)
     if ball_match:
         ball_used = ball_match.group(2).lower()  # "pokeball"
         ball_emoji_name = ball_match.group(1)  # "pokeball"
         ball_emoji = getattr(Emojis, ball_emoji_name, None)
-        debug_log(f"Ball used: {ball_used}, Ball emoji: {ball_emoji}")
+        _debug.log(f"Ball used: {ball_used}, Ball emoji: {ball_emoji}")
     else:
-        debug_log("No ball used found in description.")
+        _debug.log("No ball used found in description.")
 
     # Check if it's NOT a rare spawn color, or if it's fishing but doesn't contain rarity triggers
     if (
@@ -86,7 +91,7 @@ async def catch_and_fish_message_rare_spawn_handler(
             )
         )
     ):
-        debug_log(
+        _debug.log(
             "Embed color not in rare spawn colors or missing fishing rarity triggers.",
             highlight=True,
         )
@@ -95,7 +100,7 @@ async def catch_and_fish_message_rare_spawn_handler(
     # Get Member
     member = await get_pokemeow_reply_member(before)
     if not member:
-        debug_log("Could not resolve member from message.", highlight=True)
+        _debug.log("Could not resolve member from message.", highlight=True)
         return
     if member.id not in valid_user_ids:
         return
@@ -106,50 +111,51 @@ async def catch_and_fish_message_rare_spawn_handler(
 
     skaia_server = bot.get_guild(MAIN_SERVER_ID)
     spawn_type = "pokemon" if embed_color != FISHING_COLOR else "fish"
-    debug_log(f"Spawn type determined: {spawn_type}")
+    _debug.log(f"Spawn type determined: {spawn_type}")
 
     # Determine context and extract Pokemon name
     pokemon_name = ""
     # Process rare spawn caught
     if "You caught" in embed_description:
         context = "caught"
-        catch_match = re.search(r"You caught a.*?\*\*([^*]+)\*\*", embed_description)
+        catch_match = CAUGHT_POKEMON_PATTERN.search(embed_description)
         if catch_match:
             pokemon_name = catch_match.group(1).strip()
-            debug_log(f"Extracted Pokemon name (caught): {pokemon_name}")
+            _debug.log(f"Extracted Pokemon name (caught): {pokemon_name}")
         else:
-            debug_log(
+            _debug.log(
                 "Could not extract Pokemon name from caught pattern.", highlight=True
             )
     elif "broke out" in embed_description:
         context = "broke_out"
-        broke_match = re.search(r"\*\*([^*]+)\*\*.*?broke out", embed_description)
+        broke_match = BROKE_OUT_POKEMON_PATTERN.search(embed_description)
         if broke_match:
             pokemon_name = broke_match.group(1).strip()
-            debug_log(f"Extracted Pokemon name from 'broke out': {pokemon_name}")
-        else:
-            debug_log(
+            _debug.log(f"Extracted Pokemon name from 'broke out': {pokemon_name}")
+        elif _debug:
+            _debug.log(
                 f"Could not match 'broke out' pattern in: {embed_description}",
                 highlight=True,
             )
     elif "ran away" in embed_description:
         context = "ran_away"
-        ran_match = re.search(r"\*\*([^*]+)\*\*.*?ran away", embed_description)
+        ran_match = RAN_AWAY_POKEMON_PATTERN.search(embed_description)
         if ran_match:
             pokemon_name = ran_match.group(1).strip()
-            debug_log(f"Extracted Pokemon name from 'ran away': {pokemon_name}")
+            _debug.log(f"Extracted Pokemon name from 'ran away': {pokemon_name}")
         else:
-            debug_log(
+            _debug.log(
                 "Could not extract Pokemon name from ran away pattern.", highlight=True
             )
 
     if not pokemon_name:
-        debug_log(
-            f"Could not extract Pokemon name from: {embed_description}", highlight=True
-        )
+        if _debug:
+            _debug.log(
+                f"Could not extract Pokemon name from: {embed_description}", highlight=True
+            )
         return
 
-    debug_log(
+    _debug.log(
         f"Rare spawn detected: {pokemon_name} ({context}) for {member.display_name}",
         highlight=True,
     )
@@ -166,14 +172,14 @@ async def catch_and_fish_message_rare_spawn_handler(
         if "shiny" in pokemon_name.lower():
             rarity = "shiny"
             pokemon_name = pokemon_name.replace("Shiny ", "")  # Clean for display
-            debug_log("Detected shiny fish spawn.")
+            _debug.log("Detected shiny fish spawn.")
         elif "golden" in pokemon_name.lower():
             rarity = "golden"
             pokemon_name = pokemon_name.replace("Golden ", "")  # Clean for display
-            debug_log("Detected golden fish spawn.")
+            _debug.log("Detected golden fish spawn.")
         elif "kyogre" in pokemon_name.lower() or "suicune" in pokemon_name.lower():
             rarity = "legendary"
-            debug_log("Detected legendary fish spawn.")
+            _debug.log("Detected legendary fish spawn.")
         pretty_log(
             tag="debug",
             message=f"Fish spawn rarity determined: {rarity}",
@@ -182,10 +188,10 @@ async def catch_and_fish_message_rare_spawn_handler(
     elif spawn_type == "pokemon":
         if embed_color == rarity_meta["legendary"]["color"]:
             rarity = "legendary"
-            debug_log("Detected legendary pokemon spawn.")
+            _debug.log("Detected legendary pokemon spawn.")
         elif embed_color == rarity_meta["shiny"]["color"]:
             rarity = "shiny"
-            debug_log("Detected shiny pokemon spawn.")
+            _debug.log("Detected shiny pokemon spawn.")
 
         # For event exclusive extract rarity from footer
         elif embed_color == rarity_meta["event_exclusive"]["color"]:
@@ -207,7 +213,7 @@ async def catch_and_fish_message_rare_spawn_handler(
             footer_text = embed.footer.text
             rarity = extract_rarity_from_footer(footer_text)
             if not rarity or rarity not in rare_rarity:
-                debug_log(
+                _debug.log(
                     f"Extracted rarity '{rarity}' is not in rare rarities.",
                     highlight=True,
                 )
@@ -217,7 +223,7 @@ async def catch_and_fish_message_rare_spawn_handler(
     display_pokemon_name = pokemon_name.title()
     image_url = embed.image.url if embed.image else None
 
-    debug_log(f"Building rare spawn embed for {display_pokemon_name} ({rarity})")
+    _debug.log(f"Building rare spawn embed for {display_pokemon_name} ({rarity})")
     content, embed = build_rare_spawn_embed(
         message=after,
         member=member,
@@ -234,7 +240,7 @@ async def catch_and_fish_message_rare_spawn_handler(
     if rarespawn_channel:
         try:
             await rarespawn_channel.send(content=content, embed=embed)
-            debug_log(
+            _debug.log(
                 f"Posted rare spawn of {pokemon_name} ({context}) for {member.display_name} in #{rarespawn_channel.name}",
                 highlight=True,
             )
@@ -260,7 +266,7 @@ def build_rare_spawn_embed(
     color,
     ball_emoji: str = None,
 ):
-    debug_log(f"Building embed for {pokemon_name} ({context})")
+    _debug.log(f"Building embed for {pokemon_name} ({context})")
     content = f"Attention all <@&{Roles.rare_spawn}> — {member.mention} has found a {rarity_emoji} [{pokemon_name}]({message.jump_url})!"
     footer_text = CONTEXT_MAP[context]["footer"]
     catch_status = CONTEXT_MAP[context]["emoji"]
@@ -281,11 +287,11 @@ def build_rare_spawn_embed(
     if lowest_market:
         display_lowest_market = f" {Emojis.PokeCoin} {lowest_market:,}"
         as_of = value_data.get("listing_seen", "")
-        debug_log(f"Market value found: {lowest_market} as of {as_of}")
+        _debug.log(f"Market value found: {lowest_market} as of {as_of}")
     else:
         display_lowest_market = f" {Emojis.PokeCoin} ?"
         as_of = "?"
-        debug_log("No market value found.")
+        _debug.log("No market value found.")
 
     embed = discord.Embed(color=color)
     embed.add_field(
@@ -298,5 +304,5 @@ def build_rare_spawn_embed(
     embed.color = color
     embed.set_image(url=image_url)
 
-    debug_log(f"Embed built for {pokemon_name} ({context})")
+    _debug.log(f"Embed built for {pokemon_name} ({context})")
     return content, embed
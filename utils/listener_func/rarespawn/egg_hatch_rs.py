@@ -1,10 +1,9 @@
-import re
-
 import discord
 
 from config.rarity import *
 from config.settings import Channels, Roles, users, MAIN_SERVER_ID
 from utils.logs.pretty_log import pretty_log
+from utils.parsers.pokemeow_patterns import EGG_HATCH_POKEMON_PATTERN
 from utils.pokemeow.get_pokemeow_reply import get_pokemeow_reply_member
 from utils.cache.processed_msg_ids import processed_egg_hatches
 from .catch_and_fish import build_rare_spawn_embed
@@ -60,7 +59,7 @@ async def egg_rarespawn_handler(bot:discord.Client, message: discord.Message):
     pokemon_name = None
     if content:
         # Pattern: "just hatched a <:447:...> **Riolu**!"
-        hatch_match = re.search(r"just hatched a.*?\*\*([^*]+)\*\*", content)
+        hatch_match = EGG_HATCH_POKEMON_PATTERN.search(content)
         if hatch_match:
             pokemon_name = hatch_match.group(1).strip()
             pretty_log("debug", f"Egg hatch detected: {pokemon_name}")
@@ -1,11 +1,13 @@
-import re
-
 import discord
 
 from config.aesthetic import Emojis
 from config.rarity import *
 from config.settings import Channels, Roles
 from utils.logs.pretty_log import pretty_log
+from utils.parsers.pokemeow_patterns import (
+    SWAP_CONTENT_POKEMON_PATTERN,
+    SWAP_EMBED_POKEMON_PATTERN,
+)
 from utils.pokemeow.get_pokemeow_reply import get_pokemeow_reply_member
 
 from .catch_and_fish import build_rare_spawn_embed
@@ -38,9 +40,7 @@ async def swap_rarespawn_handler(bot, message: discord.Message):
     # Try to extract from embed description first
     if embed and embed.description:
         # Pattern: "received a <:Common:...> <:273:...> **Seedot** from a swap!"
-        swap_match = re.search(
-            r"received a.*?\*\*([^*]+)\*\*.*?from a swap", embed.description
-        )
+        swap_match = SWAP_EMBED_POKEMON_PATTERN.search(embed.description)
         if swap_match:
             pokemon_name = swap_match.group(1).strip()
             pretty_log("debug", f"Swap detected (embed): {pokemon_name}")
@@ -48,7 +48,7 @@ async def swap_rarespawn_handler(bot, message: discord.Message):
     # Fallback to message content if embed extraction failed
     if not pokemon_name and content:
         # Pattern: "khy.09 received: <:Common:...> <:273:...> **Seedot**"
-        content_match = re.search(r"received:.*?\*\*([^*]+)\*\*", content)
+        content_match = SWAP_CONTENT_POKEMON_PATTERN.search(content)
         if content_match:
             pokemon_name = content_match.group(1).strip()
             pretty_log("debug", f"Swap detected (content): {pokemon_name}")
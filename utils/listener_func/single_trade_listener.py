@@ -1,9 +1,9 @@
-import re
 import discord
 
 from config.aesthetic import Emojis
 from utils.db.missing_pokemon_db_func import remove_missing_pokemon
 from utils.logs.pretty_log import pretty_log
+from utils.parsers.pokemeow_patterns import SINGLE_TRADE_PATTERN
 from utils.pokemeow.get_pokemeow_reply import get_pokemeow_reply_member
 from utils.cache.missing_pokemon_cache import (
     find_pokemon_in_user_cache_single,
@@ -23,12 +23,8 @@ async def handle_single_trade_message(bot, message: discord.Message):
     if not content or ":handshake:" not in content:
         return
 
-    # 🎀 Regex: Capture Receiver + Pokémon name
-    trade_pattern = re.compile(
-        r"(?P<receiver>(?:<@!\d+>|:\w+:)? ?\w+(?:\.\w+|_\w+)?(?: \w+)?) received a\s+(?:[:<][^:>]+[:>]?\s*)*(?P<pokemon>[A-Za-zéÉ'\-\.]+)\s+from",
-        re.IGNORECASE,
-    )
-    matches = trade_pattern.findall(content)
+    # 🎀 Capture Receiver + Pokémon name
+    matches = SINGLE_TRADE_PATTERN.findall(content)
     if not matches:
         return
 
@@ -1,5 +1,3 @@
-import re
-
 import discord
 
 from utils.db.spooky_hour_db import (
@@ -9,6 +7,7 @@ from utils.db.spooky_hour_db import (
 )
 from config.fairy_tale_constants import FAIRY_TAIL__ROLES
 from utils.logs.pretty_log import pretty_log
+from utils.parsers.pokemeow_patterns import FULL_TIMESTAMP_PATTERN
 from config.settings import MAIN_SERVER_ID
 BUMP_CHANNEL_ID = 1370878801277358080
 SPOOKY_HOUR_ROLE_ID = FAIRY_TAIL__ROLES.ethereal
@@ -24,7 +23,7 @@ def extract_spooky_hour_ts(text: str):
     """
     for line in text.splitlines():
         if "**Spooky Hour**" in line:
-            match = re.search(r"<t:(\d+):f>", line)
+            match = FULL_TIMESTAMP_PATTERN.search(line)
             if match:
                 return int(match.group(1))
     return None
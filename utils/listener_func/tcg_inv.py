@@ -1,10 +1,17 @@
-import re
 import typing
 
 import discord
 
+from utils.cache.member_name_cache import find_member_by_name
 from utils.logs.debug_logs import debug_log, enable_debug
 from utils.logs.pretty_log import pretty_log
+from utils.parsers.pokemeow_patterns import (
+    TCG_OWNER_PATTERN,
+    TCG_PACK_CATEGORY_PATTERN,
+    TCG_PACK_ID_PATTERN,
+    TCG_PACK_LINE_PATTERN,
+    TCG_PAGE_FOOTER_PATTERN,
+)
 
 #enable_debug(f"{__name__}.parse_tcg_inventory_embed")
 
@@ -18,17 +25,12 @@ async def extract_username_and_fetch_member(
     Returns None if not found.
     """
 
-    match = re.search(r"([\w.]+)'s", title)
+    match = TCG_OWNER_PATTERN.search(title)
     if not match:
         return None
     username = match.group(1)
-    # Try to find member by name (case-insensitive)
-    for member in guild.members:
-        if member.name.lower() == username.lower() or (
-            member.display_name and member.display_name.lower() == username.lower()
-        ):
-            return member
-    return None
+    # Try to find member by name (case-insensitive, indexed)
+    return find_member_by_name(guild, username)
 
 
 _tcg_pack_cache = {}
@@ -66,7 +68,7 @@ async def parse_tcg_inventory_embed(
     # pretty_log(tag="debug", message=f"Embed footer: {footer}")
 
     # Extract page number from footer (e.g., 'Page 1 / 4')
-    page_match = re.search(r"Page (\d+) / (\d+)", footer)
+    page_match = TCG_PAGE_FOOTER_PATTERN.search(footer)
     if not page_match:
         debug_log("No page info found in footer.")
         return None
@@ -91,18 +93,18 @@ async def parse_tcg_inventory_embed(
     )
 
     # Extract lines with pack info (lines starting with a number and a pack code)
-    lines = [l for l in desc.split("\n") if re.match(r"\s*\d+\. ", l)]
+    lines = [l for l in desc.split("\n") if TCG_PACK_LINE_PATTERN.match(l)]
     debug_log(f"Found {len(lines)} lines with pack info on this page.")
     parsed_pack_ids = []
     skipped_lines = []
     for line in lines:
         # Only log skipped lines, not every line
-        pack_id_match = re.search(r"`([a-z0-9]+-pack-\d+)`", line)
+        pack_id_match = TCG_PACK_ID_PATTERN.search(line)
         if pack_id_match:
             pack_id = pack_id_match.group(1)
             parsed_pack_ids.append(pack_id)
             # Category is the prefix, e.g., aq-pack, ng1-pack, etc.
-            cat_match = re.match(r"([a-z0-9]+-pack)", pack_id)
+            cat_match = TCG_PACK_CATEGORY_PATTERN.match(pack_id)
             if cat_match:
                 category = cat_match.group(1)
                 if category not in _tcg_pack_cache:
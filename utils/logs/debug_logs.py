@@ -1,5 +1,5 @@
 # utils/loggers/smart_debug.py
-import inspect
+import sys
 from datetime import datetime
 import discord
 
@@ -8,17 +8,57 @@ import discord
 # -----------------------------
 DEBUG_TOGGLES: dict[str, bool] = {}
 
+# Enabled "module.function" keys, and the same keys grouped per module.
+# Both stay empty unless something calls enable_debug(), so the common
+# disabled path is a single truthiness check.
+_ENABLED: set[str] = set()
+_ENABLED_BY_MODULE: dict[str, set[str]] = {}
+
+# 🌸 pastel pink + underline for highlights
+COLOR_PASTEL_PINK = "\033[38;2;255;182;193m\033[4m"
+COLOR_RESET = "\033[0m"
+
 
 def enable_debug(func_path: str):
     DEBUG_TOGGLES[func_path] = True
+    _ENABLED.add(func_path)
+    module_name = func_path.rpartition(".")[0]
+    _ENABLED_BY_MODULE.setdefault(module_name, set()).add(func_path)
 
 
 def disable_debug(func_path: str):
     DEBUG_TOGGLES[func_path] = False
+    _ENABLED.discard(func_path)
+    module_name = func_path.rpartition(".")[0]
+    keys = _ENABLED_BY_MODULE.get(module_name)
+    if keys is not None:
+        keys.discard(func_path)
+        if not keys:
+            del _ENABLED_BY_MODULE[module_name]
 
 
 def debug_enabled(func_path: str) -> bool:
-    return DEBUG_TOGGLES.get(func_path, False)
+    return func_path in _ENABLED
+
+
+# -----------------------------
+# 🔹 Shared emitter
+# -----------------------------
+def _emit(frame, message: str, highlight: bool, force: bool):
+    """Resolve the caller key from a raw frame and print if it is enabled."""
+    func_name = frame.f_code.co_name
+    module_name = frame.f_globals.get("__name__", "__main__")
+
+    if not force and f"{module_name}.{func_name}" not in _ENABLED:
+        return
+
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    log_line = f"[{timestamp}] [🧪 {func_name}] {message}"
+
+    if highlight:
+        log_line = f"{COLOR_PASTEL_PINK}{log_line}{COLOR_RESET}"
+
+    print(log_line)
 
 
 # -----------------------------
@@ -29,27 +69,38 @@ def debug_log(
 ):
     if disabled:
         return
+    # Nothing enabled anywhere → skip frame lookup entirely
+    if not _ENABLED and not force:
+        return
 
-    stack = inspect.stack()
-    caller_frame = stack[1]
-    func_name = caller_frame.function
-    module_name = caller_frame.frame.f_globals.get("__name__", "__main__")
-    key = f"{module_name}.{func_name}"
+    _emit(sys._getframe(1), message, highlight, force)
 
-    if not debug_enabled(key) and not force:
-        return
 
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    log_line = f"[{timestamp}] [🧪 {func_name}] {message}"
+# -----------------------------
+# 🔹 Per-module guard
+# -----------------------------
+class DebugGuard:
+    """
+    Module-scoped debug logger. Disabled calls cost one dict lookup.
+    Usage:
+        _debug = DebugGuard(__name__)
+        _debug.log("message")
+        if _debug:  # skip building expensive messages entirely
+            _debug.log(f"{expensive()}")
+    """
 
-    # 🌸 pastel pink + underline for highlights
-    COLOR_PASTEL_PINK = "\033[38;2;255;182;193m\033[4m"
-    COLOR_RESET = "\033[0m"
+    __slots__ = ("module_name",)
 
-    if highlight:
-        log_line = f"{COLOR_PASTEL_PINK}{log_line}{COLOR_RESET}"
+    def __init__(self, module_name: str):
+        self.module_name = module_name
 
-    print(log_line)
+    def __bool__(self) -> bool:
+        return self.module_name in _ENABLED_BY_MODULE
+
+    def log(self, message: str, highlight: bool = False, force: bool = False):
+        if not force and self.module_name not in _ENABLED_BY_MODULE:
+            return
+        _emit(sys._getframe(1), message, highlight, force)
 
 
 # -----------------------------
@@ -60,6 +111,9 @@ def debug_message_content(message: discord.Message, force: bool = True):
     Dumps the raw message content and embeds for inspection.
     If force=True, prints regardless of debug toggles.
     """
+    if not force and not _ENABLED:
+        return
+
     debug_log("Raw message content dump:", force=force)
     debug_log(f"Message ID: {message.id}", force=force)
     debug_log(f"Author: {message.author} ({message.author.id})", force=force)
@@ -1,7 +1,17 @@
 # 🌸───────────────────────────────────────────────🌸
 #                Pretty Logger (Pink)
+#   pretty_log() only enqueues; a background thread
+#   prints, and warn/error/critical lines are batched
+#   into one Discord post per flush interval.
 # 🌸───────────────────────────────────────────────🌸
+import asyncio
+import atexit
+import queue
+import sys
+import threading
+import time
 import traceback
+from collections import deque
 from datetime import datetime
 from discord.ext import commands
 import discord
@@ -46,6 +56,193 @@ COLOR_RESET = "\033[0m"
 # Critical logs to Discord channel
 CRITICAL_LOG_CHANNEL_ID = 1411294325899264091  # replace if needed
 
+# 🌸───────────────────────────────────────────────🌸
+#                Log Levels / Suppression
+# 🌸───────────────────────────────────────────────🌸
+LEVEL_DEBUG = 10
+LEVEL_INFO = 20
+LEVEL_WARN = 30
+LEVEL_ERROR = 40
+LEVEL_CRITICAL = 50
+
+# Tags not listed here (incl. "" and custom tags) log at LEVEL_INFO
+TAG_LEVELS = {
+    "debug": LEVEL_DEBUG,
+    "warn": LEVEL_WARN,
+    "error": LEVEL_ERROR,
+    "critical": LEVEL_CRITICAL,
+}
+
+DISCORD_TAGS = frozenset({"critical", "error", "warn"})
+TRACE_TAGS = frozenset({"error", "critical"})
+
+_min_level = LEVEL_DEBUG
+_muted_tags: set[str] = set()
+# Tags skipped before any formatting happens (levels below _min_level + muted)
+_suppressed: frozenset[str] = frozenset()
+# True once LEVEL_INFO is filtered, so unlisted custom tags are dropped too
+_info_suppressed = False
+
+
+def _rebuild_suppressed():
+    global _suppressed, _info_suppressed
+    below = {tag for tag, level in TAG_LEVELS.items() if level < _min_level}
+    _info_suppressed = LEVEL_INFO < _min_level
+    if _info_suppressed:
+        below |= {tag for tag in MEW_TAGS if tag not in TAG_LEVELS}
+        below.add("")
+    _suppressed = frozenset(below | _muted_tags)
+
+
+def set_log_level(level: int):
+    """Drop every tag below this level (e.g. LEVEL_INFO hides debug logs)."""
+    global _min_level
+    _min_level = level
+    _rebuild_suppressed()
+
+
+def mute_tag(tag: str):
+    """Suppress a single tag regardless of level."""
+    _muted_tags.add(tag)
+    _rebuild_suppressed()
+
+
+def unmute_tag(tag: str):
+    _muted_tags.discard(tag)
+    _rebuild_suppressed()
+
+
+# 🌸───────────────────────────────────────────────🌸
+#                Console Writer (background thread)
+# 🌸───────────────────────────────────────────────🌸
+# Records: (created, color, head, exc_info) — formatted off the caller's path
+_console_queue: queue.SimpleQueue = queue.SimpleQueue()
+_console_thread: threading.Thread | None = None
+_STOP = object()
+
+
+def _format_console(record) -> str:
+    created, color, head, exc_info = record
+    now = datetime.fromtimestamp(created).strftime("%H:%M:%S")
+    line = f"{color}[{now}] {head}{COLOR_RESET}"
+    if exc_info is not None:
+        line += "\n" + "".join(traceback.format_exception(*exc_info)).rstrip()
+    return line
+
+
+def _console_writer():
+    while True:
+        record = _console_queue.get()
+        if record is _STOP:
+            return
+        try:
+            print(_format_console(record))
+        except Exception:
+            pass
+
+
+def _ensure_console_writer():
+    global _console_thread
+    if _console_thread is None or not _console_thread.is_alive():
+        _console_thread = threading.Thread(
+            target=_console_writer, name="pretty-log-writer", daemon=True
+        )
+        _console_thread.start()
+
+
+def flush_console_logs(timeout: float = 2.0):
+    """Drain the console queue and stop the writer (called at exit)."""
+    global _console_thread
+    if _console_thread is None:
+        return
+    _console_queue.put(_STOP)
+    _console_thread.join(timeout)
+    _console_thread = None
+
+
+atexit.register(flush_console_logs)
+
+# 🌸───────────────────────────────────────────────🌸
+#                Discord Batching
+# 🌸───────────────────────────────────────────────🌸
+DISCORD_FLUSH_SECONDS = 5.0
+DISCORD_MAX_PENDING = 200
+DISCORD_MAX_POST = 2000
+
+# head → [first full record, repeat count]; insertion order = send order
+_discord_pending: dict[str, list] = {}
+_discord_dropped = 0
+_discord_task: asyncio.Task | None = None
+
+
+def _queue_discord(bot: commands.Bot, head: str, exc_info):
+    global _discord_dropped, _discord_task
+    entry = _discord_pending.get(head)
+    if entry is not None:
+        entry[1] += 1
+    elif len(_discord_pending) >= DISCORD_MAX_PENDING:
+        _discord_dropped += 1
+    else:
+        _discord_pending[head] = [exc_info, 1]
+
+    if _discord_task is None or _discord_task.done():
+        _discord_task = bot.loop.create_task(_discord_flusher(bot))
+
+
+def _render_discord(head: str, exc_info, count: int) -> str:
+    text = head if count == 1 else f"{head} (×{count})"
+    if exc_info is not None:
+        trace = "".join(traceback.format_exception(*exc_info))
+        text += f"\n```py\n{trace}```"
+    if len(text) > DISCORD_MAX_POST:
+        text = text[: DISCORD_MAX_POST - 3] + "..."
+    return text
+
+
+def _take_discord_batch() -> str:
+    """Pop pending entries that fit into one post (always at least one)."""
+    global _discord_dropped
+    parts: list[str] = []
+    size = 0
+    for head in list(_discord_pending):
+        exc_info, count = _discord_pending[head]
+        text = _render_discord(head, exc_info, count)
+        if parts and size + len(text) + 1 > DISCORD_MAX_POST:
+            break
+        parts.append(text)
+        size += len(text) + 1
+        del _discord_pending[head]
+
+    if _discord_dropped and not _discord_pending:
+        note = f"⚠️ {_discord_dropped} log line(s) dropped (buffer full)"
+        if size + len(note) + 1 <= DISCORD_MAX_POST:
+            parts.append(note)
+            _discord_dropped = 0
+    return "\n".join(parts)
+
+
+async def _discord_flusher(bot: commands.Bot):
+    """Send at most one merged post per interval until the buffer is empty."""
+    while _discord_pending or _discord_dropped:
+        await asyncio.sleep(DISCORD_FLUSH_SECONDS)
+        batch = _take_discord_batch()
+        if not batch:
+            continue
+        try:
+            channel = bot.get_channel(CRITICAL_LOG_CHANNEL_ID)
+            if channel:
+                await channel.send(batch)
+        except Exception:
+            _console_queue.put(
+                (
+                    time.time(),
+                    COLOR_ERROR,
+                    "[❌ Logger Error] Failed to send log to channel",
+                    sys.exc_info(),
+                )
+            )
+
+
 # 🌸───────────────────────────────────────────────🌸
 #                Pretty Logger Function
 # 🌸───────────────────────────────────────────────🌸
@@ -57,45 +254,43 @@ def pretty_log(
     bot: commands.Bot = None,
     include_trace: bool = True,
 ):
-    """Pretty pink logger with Discord integration."""
+    """Pretty pink logger with Discord integration (non-blocking)."""
+    # 🌸 Suppressed tags never get formatted
+    if tag in _suppressed or (_info_suppressed and tag not in TAG_LEVELS):
+        return
 
     # 🌸 Build prefix only if tag is not empty
     prefix = MEW_TAGS.get(tag, tag) if tag else None
     prefix_part = f"[{prefix}] " if prefix else ""
 
     label_str = f"[{label}] " if label else ""
+    head = f"{prefix_part}{label_str}{message}"
 
     # 🌸 choose color
-    if tag in ("critical", "error"):
+    if tag in TRACE_TAGS:
         color = COLOR_ERROR
     elif tag == "warn":
         color = COLOR_WARN
     else:
         color = COLOR_PINK
-    now = datetime.now().strftime("%H:%M:%S")
 
-    # print to console
-    log_message = f"{color}[{now}] {prefix_part}{label_str}{message}{COLOR_RESET}"
-    print(log_message)
+    # Capture the active exception now; it is formatted later by the writers
+    exc_info = None
+    if include_trace and tag in TRACE_TAGS:
+        exc_info = sys.exc_info()
+        if exc_info[0] is None:
+            exc_info = None
 
-    # show traceback
-    if include_trace and tag in ("error", "critical"):
-        traceback.print_exc()
+    # print to console (background thread)
+    _ensure_console_writer()
+    _console_queue.put((time.time(), color, head, exc_info))
 
-    # send to Discord channel if critical
+    # send to Discord channel if critical (batched per interval)
     bot_to_use = bot or BOT_INSTANCE
-    if bot_to_use and tag in ("critical", "error", "warn"):
+    if bot_to_use and tag in DISCORD_TAGS:
         try:
-            channel = bot_to_use.get_channel(CRITICAL_LOG_CHANNEL_ID)
-            if channel:
-                full_message = f"{prefix_part}{label_str}{message}"
-                if include_trace and tag in ("error", "critical"):
-                    full_message += f"\n```py\n{traceback.format_exc()}```"
-                if len(full_message) > 2000:
-                    full_message = full_message[:1997] + "..."
-                bot_to_use.loop.create_task(channel.send(full_message))
+            _queue_discord(bot_to_use, head, exc_info)
         except Exception:
             print(
                 f"{COLOR_ERROR}[❌ Logger Error] Failed to send log to channel{COLOR_RESET}"
             )
-            traceback.print_exc()
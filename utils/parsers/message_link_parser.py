@@ -1,6 +1,51 @@
+import asyncio
+import re
+
 import discord
 from discord.ext import commands
 
+# https://discord.com/channels/<guild>/<channel>/<message> (also ptb./canary.)
+MESSAGE_LINK_RE = re.compile(
+    r"(?:https?://)?(?:\w+\.)?discord(?:app)?\.com/channels/(\d+|@me)/(\d+)/(\d+)"
+)
+# Concurrent message fetches per batch; discord.py waits out any 429s itself
+FETCH_CONCURRENCY = 5
+
+
+# 🌸───────────────────────────────────────────────
+# 🐾 Parse Message Link(s)
+# ───────────────────────────────────────────────
+def parse_message_link(message_link: str) -> tuple[int, int] | None:
+    """Return (channel_id, message_id) for a message link, or None."""
+    match = MESSAGE_LINK_RE.search(message_link or "")
+    if not match:
+        return None
+    return int(match.group(2)), int(match.group(3))
+
+
+def find_message_links(text: str) -> list[str]:
+    """All message links in a pasted blob (spaces, commas or newlines between)."""
+    return [match.group(0) for match in MESSAGE_LINK_RE.finditer(text or "")]
+
+
+# 🌸───────────────────────────────────────────────
+# 🐾 Resolve Channel (gateway cache first)
+# ───────────────────────────────────────────────
+async def resolve_channel(bot: commands.Bot, channel_id: int):
+    """Channel from the gateway cache, falling back to one REST fetch."""
+    channel = bot.get_channel(channel_id)
+    if channel is None:
+        channel = await bot.fetch_channel(channel_id)
+    return channel
+
+
+def _fetch_error(e: Exception) -> str:
+    if isinstance(e, discord.NotFound):
+        return "❌ Message not found. Maybe it disappeared? 🕵️‍♂️"
+    if isinstance(e, discord.Forbidden):
+        return "❌ I don’t have permission to peek at that message! 🙅‍♀️"
+    return f"❌ Unexpected error fetching message: {e} 😿"
+
 
 # 🌸───────────────────────────────────────────────
 # 🐾 Fetch Message from Link Helper
@@ -16,27 +61,97 @@ async def fetch_message_from_link(bot: commands.Bot, message_link: str):
     if not message_link or "/" not in message_link:
         return False, None, "❌ Oopsie! That doesn’t look like a valid message link. 🐾"
 
-    # Step 2: Extract guild, channel, and message IDs
-    try:
-        parts = message_link.strip().split("/")
-        guild_id = int(parts[4])
-        channel_id = int(parts[5])
-        message_id = int(parts[6])
-    except (IndexError, ValueError):
+    # Step 2: Extract channel and message IDs
+    ids = parse_message_link(message_link)
+    if ids is None:
         return (
             False,
             None,
             "❌ Oopsie! That message link looks wrong. Please double-check! 🐾",
         )
+    channel_id, message_id = ids
 
     # Step 3: Fetch the message lovingly
     try:
-        channel = await bot.fetch_channel(channel_id)
+        channel = await resolve_channel(bot, channel_id)
         message = await channel.fetch_message(message_id)
         return True, message, None
-    except discord.NotFound:
-        return False, None, "❌ Message not found. Maybe it disappeared? 🕵️‍♂️"
-    except discord.Forbidden:
-        return False, None, "❌ I don’t have permission to peek at that message! 🙅‍♀️"
     except Exception as e:
-        return False, None, f"❌ Unexpected error fetching message: {e} 😿"
+        return False, None, _fetch_error(e)
+
+
+# 🌸───────────────────────────────────────────────
+# 🐾 Fetch Many Messages from Links
+# Returns: list of (success, message, error_msg), in link order
+# 🌸───────────────────────────────────────────────
+async def fetch_messages_from_links(bot: commands.Bot, message_links: list[str]):
+    """
+    Fetch several linked messages concurrently (at most FETCH_CONCURRENCY
+    in flight). Each channel is resolved once per batch.
+    """
+    slots = asyncio.Semaphore(FETCH_CONCURRENCY)
+    channels: dict[int, asyncio.Task] = {}
+
+    async def fetch_one(message_link: str):
+        ids = parse_message_link(message_link)
+        if ids is None:
+            return (
+                False,
+                None,
+                "❌ Oopsie! That message link looks wrong. Please double-check! 🐾",
+            )
+        channel_id, message_id = ids
+        if channel_id not in channels:
+            channels[channel_id] = asyncio.ensure_future(
+                resolve_channel(bot, channel_id)
+            )
+        try:
+            channel = await channels[channel_id]
+            async with slots:
+                message = await channel.fetch_message(message_id)
+            return True, message, None
+        except Exception as e:
+            return False, None, _fetch_error(e)
+
+    return await asyncio.gather(*(fetch_one(link) for link in message_links))
+
+
+# 🌸───────────────────────────────────────────────
+# 🐾 Fetch Message Range (first → last link, same channel)
+# Returns: (success: bool, messages: list[discord.Message], error_msg: str | None)
+# 🌸───────────────────────────────────────────────
+async def fetch_message_range(
+    bot: commands.Bot, first_link: str, last_link: str, limit: int = 200
+):
+    """
+    Every message between two links (inclusive), oldest first, up to limit.
+    Uses channel history, so it's one request per 100 messages.
+    Ask for one more than you keep to tell whether the range was cut off.
+    """
+    first = parse_message_link(first_link)
+    last = parse_message_link(last_link)
+    if first is None or last is None:
+        return (
+            False,
+            [],
+            "❌ Oopsie! That message link looks wrong. Please double-check! 🐾",
+        )
+    if first[0] != last[0]:
+        return False, [], "❌ Both links need to be in the same channel! 🐾"
+
+    channel_id = first[0]
+    first_id, last_id = sorted((first[1], last[1]))
+    try:
+        channel = await resolve_channel(bot, channel_id)
+        messages = [
+            message
+            async for message in channel.history(
+                limit=limit,
+                after=discord.Object(id=first_id - 1),
+                before=discord.Object(id=last_id + 1),
+                oldest_first=True,
+            )
+        ]
+        return True, messages, None
+    except Exception as e:
+        return False, [], _fetch_error(e)
@@ -0,0 +1,121 @@
+# 🌸──────────────────────────────────────────────
+#        🐾 PokéMeow Pattern Bench 🐾
+#   Re-validates every registry pattern against the
+#   sample corpus and times each one.
+#   Run from the repo root:
+#       python -m utils.parsers.pattern_bench
+#       python -m utils.parsers.pattern_bench --number 20000
+#   Exits 1 if any sample no longer parses as expected.
+# 🌸──────────────────────────────────────────────
+import argparse
+import sys
+import timeit
+
+from utils.parsers.pokemeow_patterns import PATTERNS
+from utils.parsers.pokemeow_samples import SAMPLES
+
+
+# ❀─────────────────────────────────────────❀
+#      💖 Run One Sample
+# ❀─────────────────────────────────────────❀
+def run_sample(sample: dict):
+    """Call the sample's pattern the way its listener does and return the result."""
+    pattern = PATTERNS[sample["pattern"]]
+    call = sample.get("call", "search")
+    text = sample["text"]
+
+    if call == "sub":
+        return pattern.sub(sample.get("repl", ""), text)
+    if call == "findall":
+        return pattern.findall(text)
+    match = getattr(pattern, call)(text)
+    return match.groups() if match else None
+
+
+def _timed_call(sample: dict):
+    """Zero-arg callable doing only the regex call, for timeit."""
+    pattern = PATTERNS[sample["pattern"]]
+    call = sample.get("call", "search")
+    text = sample["text"]
+    if call == "sub":
+        repl = sample.get("repl", "")
+        return lambda: pattern.sub(repl, text)
+    method = getattr(pattern, call)
+    return lambda: method(text)
+
+
+# ❀─────────────────────────────────────────❀
+#      💖 Validate Corpus
+# ❀─────────────────────────────────────────❀
+def validate() -> list[str]:
+    """Return one message per failing sample (empty list = all good)."""
+    failures = []
+    covered = set()
+    for i, sample in enumerate(SAMPLES):
+        name = sample["pattern"]
+        if name not in PATTERNS:
+            failures.append(f"#{i} {name}: not in the pattern registry")
+            continue
+        covered.add(name)
+
+        expect = sample["expect"]
+        got = run_sample(sample)
+        if got != expect:
+            failures.append(f"#{i} {name}: expected {expect!r}, got {got!r}")
+
+    for name in sorted(set(PATTERNS) - covered):
+        failures.append(f"{name}: no sample in the corpus")
+    return failures
+
+
+# ❀─────────────────────────────────────────❀
+#      💖 Benchmark
+# ❀─────────────────────────────────────────❀
+def benchmark(number: int = 10_000) -> list[tuple[str, str, float]]:
+    """Time every sample; returns (pattern, call, µs per call), slowest first."""
+    results = []
+    for sample in SAMPLES:
+        if sample["pattern"] not in PATTERNS:
+            continue
+        seconds = timeit.timeit(_timed_call(sample), number=number)
+        results.append(
+            (sample["pattern"], sample.get("call", "search"), seconds / number * 1e6)
+        )
+    results.sort(key=lambda r: r[2], reverse=True)
+    return results
+
+
+def main(argv: list[str] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Validate and time the PokéMeow regex registry."
+    )
+    parser.add_argument(
+        "--number", type=int, default=10_000, help="calls per sample (default 10000)"
+    )
+    parser.add_argument(
+        "--validate-only", action="store_true", help="skip the timing run"
+    )
+    args = parser.parse_args(argv)
+
+    failures = validate()
+    for failure in failures:
+        print(f"❌ {failure}")
+    print(
+        f"{len(SAMPLES) - len(failures)}/{len(SAMPLES)} samples OK "
+        f"across {len(PATTERNS)} patterns"
+    )
+
+    if not args.validate_only:
+        results = benchmark(args.number)
+        width = max(len(name) for name, _, _ in results)
+        print(f"\n{'pattern'.ljust(width)}  call      µs/call")
+        for name, call, micros in results:
+            print(f"{name.ljust(width)}  {call:<8}  {micros:7.3f}")
+        total = sum(micros for _, _, micros in results)
+        print(f"\nWhole corpus: {total:.1f} µs per pass ({len(results)} samples)")
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
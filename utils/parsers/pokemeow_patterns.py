@@ -0,0 +1,156 @@
+# 🌸──────────────────────────────────────────────
+#        🐾 PokéMeow Message Patterns 🐾
+#   Every regex the listeners run against PokéMeow
+#   messages/embeds, compiled once at import.
+#   When PokéMeow changes a message format, fix it
+#   here and re-check with:
+#       python -m utils.parsers.pattern_bench
+# 🌸──────────────────────────────────────────────
+import re
+
+# ❀─────────────────────────────────────────❀
+#      💖 Shared Markup
+# ❀─────────────────────────────────────────❀
+EMOJI_TAG_PATTERN = re.compile(r"<a?:\w+:\d+>")  # static or animated emoji
+STATIC_EMOJI_TAG_PATTERN = re.compile(r"<:.+?:\d+>")
+STATIC_EMOJI_TAG_SPACED_PATTERN = re.compile(r"<:.+?:\d+>\s*")
+EMOJI_NAME_PATTERN = re.compile(r"<:([a-zA-Z0-9_]+):[0-9]+>")
+FIRST_BOLD_PATTERN = re.compile(r"\*\*(.+?)\*\*")
+NUMBER_WITH_COMMAS_PATTERN = re.compile(r"(\d[\d,]*)")
+FULL_TIMESTAMP_PATTERN = re.compile(r"<t:(\d+):f>")
+
+# ❀─────────────────────────────────────────❀
+#      💖 Spawns (;p / ;f)
+# ❀─────────────────────────────────────────❀
+WILD_SPAWN_TRAINER_PATTERN = re.compile(r"\*\*(.+?)\*\* found a wild")
+HELD_ITEM_SPAWN_PATTERN = re.compile(
+    r"(?:<:[^:]+:\d+>\s*)?"  # optional leading NPC emoji
+    r"\*\*.+?\*\*\s*found a wild\s*"
+    r"(?P<teamlogo><:team_logo:\d+>)?\s*"  # optional team logo emoji
+    r"(?P<held><:held_item:\d+>)?\s*"  # optional held item emoji
+    r"(?:<:[^:]+:\d+>\s*)+"  # Pokemon emoji (+ optional dexCaught)
+    r"\*\*(?P<pokemon>[A-Za-z_]+)\*\*"  # pokemon name
+)
+FISH_NAME_PATTERN = re.compile(
+    r"\*\*(?:(Shiny|Golden)\s+)?([A-Za-z_]+)\*\*", re.IGNORECASE
+)
+
+# ❀─────────────────────────────────────────❀
+#      💖 Catch Results / Rare Spawns
+# ❀─────────────────────────────────────────❀
+RARITY_FOOTER_PATTERN = re.compile(r"Rarity:\s*([A-Za-z]+)")
+CATCH_BALL_PATTERN = re.compile(
+    r"<:([a-zA-Z0-9_]+):\d+>\s*([A-Za-z]+ball)", re.IGNORECASE
+)
+CAUGHT_POKEMON_PATTERN = re.compile(r"You caught a.*?\*\*([^*]+)\*\*")
+BROKE_OUT_POKEMON_PATTERN = re.compile(r"\*\*([^*]+)\*\*.*?broke out")
+RAN_AWAY_POKEMON_PATTERN = re.compile(r"\*\*([^*]+)\*\*.*?ran away")
+SWAP_EMBED_POKEMON_PATTERN = re.compile(r"received a.*?\*\*([^*]+)\*\*.*?from a swap")
+SWAP_CONTENT_POKEMON_PATTERN = re.compile(r"received:.*?\*\*([^*]+)\*\*")
+EGG_HATCH_POKEMON_PATTERN = re.compile(r"just hatched a.*?\*\*([^*]+)\*\*")
+
+# ❀─────────────────────────────────────────❀
+#      💖 Battles / Battle Tower / Chambers
+# ❀─────────────────────────────────────────❀
+BATTLE_CHALLENGE_PATTERN = re.compile(
+    r"(?:<:\w+?:\d+>\s*)?\*\*(.+?)\*\* challenged (?:<:\w+?:\d+>\s*)?\*\*(.+?)\*\*"
+)
+BATTLE_ENEMY_ID_PATTERN = re.compile(r"Enemy ID:\s*(\d+)")
+NPC_SET_LINE_PATTERN = re.compile(r"- Set\s+<:([a-zA-Z0-9_]+):(\d+)>\s+\*\*(.*?)\*\*")
+GOLDEN_STONE_EMOJI_PATTERN = re.compile(r"<:golden_([a-zA-Z0-9_]+):(\d+)>")
+MEGA_CHAMBER_COMPLETED_PATTERN = re.compile(r"completed the .*?\*\*(.*?)\*\*")
+
+# ❀─────────────────────────────────────────❀
+#      💖 Catchbot
+# ❀─────────────────────────────────────────❀
+CATCHBOT_RUN_PATTERN = re.compile(r"in \*\*(\d+)([hHmM])\*\*", re.IGNORECASE)
+CATCHBOT_EMBED_PATTERN = re.compile(r"It will be back on .*?<t:(\d+):f>", re.IGNORECASE)
+CHECKLIST_CB_PATTERN = re.compile(
+    r"Your catch bot will be back on <t:(\d+):f>", re.IGNORECASE
+)
+CATCHBOT_SPENT_PATTERN = re.compile(
+    r"You spent <:[^:]+:\d+> \*\*[\d,]+ PokeCoins\*\* to run your catch bot\.",
+    re.IGNORECASE,
+)
+
+# ❀─────────────────────────────────────────❀
+#      💖 Quests
+# ❀─────────────────────────────────────────❀
+QUEST_AVAILABLE_PATTERN = re.compile(r"Your next quest is available <t:(\d+):R>")
+QUEST_ENTRY_PATTERN = re.compile(r"\*\*Quest #\d+\*\*:")
+QUEST_NEXT_IN_PATTERN = re.compile(
+    r"Next quest in:\s*((?:(\d+)\s*H)?\s*((\d+)\s*M)?\s*((\d+)\s*S)?)"
+)
+QUEST_COMPLETED_PATTERN = re.compile(
+    r":notepad_spiral:\s+\*\*(.+?)\*\* completed the quest"
+)
+
+# ❀─────────────────────────────────────────❀
+#      💖 Market / Auctions
+# ❀─────────────────────────────────────────❀
+MARKET_AUTHOR_PATTERN = re.compile(r"(.+?)\s+#(\d+)")
+MARKET_PURCHASE_PATTERN = re.compile(
+    r"\*\*.*?\*\*\s*.*?\*\*\s*(.*?)\s*\*\*\s*for\s+<:PokeCoin"
+)
+AUCTION_ENDS_PATTERN = re.compile(r"Ends <t:(\d+):R>")
+
+# ❀─────────────────────────────────────────❀
+#      💖 Pokédex Embeds
+# ❀─────────────────────────────────────────❀
+DEX_NAME_NUMBER_PATTERN = re.compile(r"(.+?)\s*#(\d+)")
+DEX_AUTHOR_PATTERN = re.compile(r"^(.+?)\s+#(\d+)$")
+
+# ❀─────────────────────────────────────────❀
+#      💖 Factions
+# ❀─────────────────────────────────────────❀
+TEAM_LOGO_PATTERN = re.compile(r"<:team_logo:\d+>")
+FACTION_DAILY_BALL_PATTERN = re.compile(
+    r"(<:team_logo:\d+>) \*\*\|\*\* Your Faction's daily ball-type is (<:[^:]+:\d+>) (\w+ball)"
+)
+FACTION_TEAM_AUTHOR_PATTERN = re.compile(r"Team (\w+)")
+FACTION_TARGET_BALL_PATTERN = re.compile(
+    r"<:([a-zA-Z0-9_]+):\d+>\s+\*\*Today's target Pokemon are\*\*"
+)
+
+# ❀─────────────────────────────────────────❀
+#      💖 Patreon Rank
+# ❀─────────────────────────────────────────❀
+MARKDOWN_EMPHASIS_PATTERN = re.compile(r"[*]{1,2}|_{2}")
+NON_USERNAME_CHARS_PATTERN = re.compile(r"[^\w\d.]")
+PATREON_RANK_TITLE_PATTERN = re.compile(r"\*\*(\w+)\s+Patreon\*\*")
+PATREON_RANK_EMOJI_PATTERN = re.compile(r"<:patreonlogo:\d+>\s*<:(\w+):\d+>")
+
+# ❀─────────────────────────────────────────❀
+#      💖 Trades
+# ❀─────────────────────────────────────────❀
+MULTI_TRADE_OWNER_PATTERN = re.compile(r"\s(.+?)'s Pokemon")
+TRADE_QUANTITY_SUFFIX_PATTERN = re.compile(r"\s*x\d+$")
+SINGLE_TRADE_PATTERN = re.compile(
+    r"(?P<receiver>(?:<@!\d+>|:\w+:)? ?\w+(?:\.\w+|_\w+)?(?: \w+)?) received a\s+(?:[:<][^:>]+[:>]?\s*)*(?P<pokemon>[A-Za-zéÉ'\-\.]+)\s+from",
+    re.IGNORECASE,
+)
+
+# ❀─────────────────────────────────────────❀
+#      💖 TCG Inventory
+# ❀─────────────────────────────────────────❀
+TCG_OWNER_PATTERN = re.compile(r"([\w.]+)'s")
+TCG_PAGE_FOOTER_PATTERN = re.compile(r"Page (\d+) / (\d+)")
+TCG_PACK_LINE_PATTERN = re.compile(r"\s*\d+\. ")
+TCG_PACK_ID_PATTERN = re.compile(r"`([a-z0-9]+-pack-\d+)`")
+TCG_PACK_CATEGORY_PATTERN = re.compile(r"([a-z0-9]+-pack)")
+
+# ❀─────────────────────────────────────────❀
+#      💖 Box Pages (;list pokemon)
+# ❀─────────────────────────────────────────❀
+BOX_DEX_LINE_PATTERN = re.compile(
+    r"`\s*(\d+)\s*`\s*(?:<:.+?:\d+>\s*)*(.+?)(?=\s*<:.+?:\d+>|$)"
+)
+VARIANT_PREFIX_PATTERN = re.compile(r"^(shiny|golden)\s+", flags=re.IGNORECASE)
+
+
+# 🌐 Registry: name → compiled pattern (used by the benchmark harness)
+PATTERNS: dict[str, re.Pattern] = {
+    name: value
+    for name, value in globals().items()
+    if name.endswith("_PATTERN") and isinstance(value, re.Pattern)
+}
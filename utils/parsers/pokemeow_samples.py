@@ -0,0 +1,379 @@
+# 🌸──────────────────────────────────────────────
+#        🐾 PokéMeow Sample Corpus 🐾
+#   PokéMeow message/embed text reconstructed from the
+#   listeners' parsing code (not captured from live
+#   traffic), one entry per shape a listener handles.
+#   Each sample names the registry pattern, how the
+#   listener calls it, and what it expects back:
+#     search / match → match.groups(), or None for "no match"
+#     findall        → list of matches
+#     sub            → resulting string (uses "repl", default "")
+#   Used by utils.parsers.pattern_bench.
+# 🌸──────────────────────────────────────────────
+
+SAMPLES: list[dict] = [
+    # ❀ Shared markup
+    {
+        "pattern": "EMOJI_TAG_PATTERN",
+        "call": "sub",
+        "text": "<:PokeCoin:1234567890123456789> 12,500",
+        "expect": " 12,500",
+    },
+    {
+        "pattern": "EMOJI_TAG_PATTERN",
+        "call": "sub",
+        "text": "<a:sparkle:1234567890123456789> **Gold Patreon** <:patreonlogo:111>",
+        "expect": " **Gold Patreon** ",
+    },
+    {
+        "pattern": "STATIC_EMOJI_TAG_PATTERN",
+        "call": "sub",
+        "text": "<:shiny:1111> <:pikachu:2222> Pikachu",
+        "expect": "  Pikachu",
+    },
+    {
+        "pattern": "STATIC_EMOJI_TAG_SPACED_PATTERN",
+        "call": "sub",
+        "text": "<:team_logo:987654321> mewlover",
+        "expect": "mewlover",
+    },
+    {
+        "pattern": "EMOJI_NAME_PATTERN",
+        "call": "search",
+        "text": "<:npc_gym_misty:1180000000000000001> Misty",
+        "expect": ('npc_gym_misty',),
+    },
+    {
+        "pattern": "FIRST_BOLD_PATTERN",
+        "call": "search",
+        "text": "**mewlover** fished a wild <:rod:1> **Magikarp**!",
+        "expect": ('mewlover',),
+    },
+    {
+        "pattern": "NUMBER_WITH_COMMAS_PATTERN",
+        "call": "search",
+        "text": " 1,250,000",
+        "expect": ('1,250,000',),
+    },
+    {
+        "pattern": "FULL_TIMESTAMP_PATTERN",
+        "call": "search",
+        "text": ":jack_o_lantern: Spooky Hour ends <t:1761087600:f>",
+        "expect": ('1761087600',),
+    },
+    # ❀ Spawns
+    {
+        "pattern": "WILD_SPAWN_TRAINER_PATTERN",
+        "call": "search",
+        "text": "**mewlover** found a wild <:pokeball:1> **Eevee**!",
+        "expect": ('mewlover',),
+    },
+    {
+        "pattern": "WILD_SPAWN_TRAINER_PATTERN",
+        "call": "search",
+        "text": "You caught a **Eevee**!",
+        "expect": None,
+    },
+    {
+        "pattern": "HELD_ITEM_SPAWN_PATTERN",
+        "call": "findall",
+        "text": (
+            "<:npc:1001> **mewlover** found a wild <:team_logo:1002> "
+            "<:held_item:1003> <:eevee:1004> <:dexCaught:1005> **Eevee**!"
+        ),
+        "expect": [('<:team_logo:1002>', '<:held_item:1003>', 'Eevee')],
+    },
+    {
+        "pattern": "HELD_ITEM_SPAWN_PATTERN",
+        "call": "findall",
+        "text": "**mewlover** found a wild <:pidgey:1004> **Pidgey**!",
+        "expect": [('', '', 'Pidgey')],
+    },
+    {
+        "pattern": "FISH_NAME_PATTERN",
+        "call": "findall",
+        "text": "**mewlover** fished a wild <:shiny:1> **Shiny Gyarados**!",
+        "expect": [('', 'mewlover'), ('Shiny', 'Gyarados')],
+    },
+    # ❀ Catch results / rare spawns
+    {
+        "pattern": "RARITY_FOOTER_PATTERN",
+        "call": "search",
+        "text": "Rarity: Legendary | Dex #150",
+        "expect": ('Legendary',),
+    },
+    {
+        "pattern": "CATCH_BALL_PATTERN",
+        "call": "search",
+        "text": "<:Masterball:1200000000000000001> Masterball used!",
+        "expect": ('Masterball', 'Masterball'),
+    },
+    {
+        "pattern": "CAUGHT_POKEMON_PATTERN",
+        "call": "search",
+        "text": "**mewlover** You caught a Legendary <:mewtwo:1> **Mewtwo**!",
+        "expect": ('Mewtwo',),
+    },
+    {
+        "pattern": "BROKE_OUT_POKEMON_PATTERN",
+        "call": "search",
+        "text": "Oh no! The <:mewtwo:1> **Mewtwo** broke out!",
+        "expect": ('Mewtwo',),
+    },
+    {
+        "pattern": "RAN_AWAY_POKEMON_PATTERN",
+        "call": "search",
+        "text": "The wild <:zapdos:1> **Zapdos** ran away!",
+        "expect": ('Zapdos',),
+    },
+    {
+        "pattern": "SWAP_EMBED_POKEMON_PATTERN",
+        "call": "search",
+        "text": "**mewlover** received a Legendary <:articuno:1> **Articuno** from a swap!",
+        "expect": ('Articuno',),
+    },
+    {
+        "pattern": "SWAP_CONTENT_POKEMON_PATTERN",
+        "call": "search",
+        "text": "mewlover received: <:moltres:1> **Moltres** (Legendary)",
+        "expect": ('Moltres',),
+    },
+    {
+        "pattern": "EGG_HATCH_POKEMON_PATTERN",
+        "call": "search",
+        "text": ":egg: **mewlover** just hatched a <:shiny_togepi:1> **Shiny Togepi**!",
+        "expect": ('Shiny Togepi',),
+    },
+    # ❀ Battles / battle tower / chambers
+    {
+        "pattern": "BATTLE_CHALLENGE_PATTERN",
+        "call": "search",
+        "text": "<:trainer:1> **mewlover** challenged <:npc_gym_brock:2> **Brock** to a battle!",
+        "expect": ('mewlover', 'Brock'),
+    },
+    {
+        "pattern": "BATTLE_ENEMY_ID_PATTERN",
+        "call": "search",
+        "text": "Enemy ID: 41 | Turn 1",
+        "expect": ('41',),
+    },
+    {
+        "pattern": "NPC_SET_LINE_PATTERN",
+        "call": "search",
+        "text": "You unlocked a new battle icon!\n- Set <:npc_gym_misty:118000> **Misty**",
+        "expect": ('npc_gym_misty', '118000', 'Misty'),
+    },
+    {
+        "pattern": "GOLDEN_STONE_EMOJI_PATTERN",
+        "call": "search",
+        "text": "You received <:golden_charizardite_x:1190000> x1!",
+        "expect": ('charizardite_x', '1190000'),
+    },
+    {
+        "pattern": "MEGA_CHAMBER_COMPLETED_PATTERN",
+        "call": "search",
+        "text": "**mewlover** completed the <:chamber:1> **Mega Charizard X Chamber**!",
+        "expect": ('Mega Charizard X Chamber',),
+    },
+    # ❀ Catchbot
+    {
+        "pattern": "CATCHBOT_RUN_PATTERN",
+        "call": "search",
+        "text": "Your catch bot is now running! It will return in **12h**",
+        "expect": ('12', 'h'),
+    },
+    {
+        "pattern": "CATCHBOT_EMBED_PATTERN",
+        "call": "search",
+        "text": "Your catchbot is out catching Pokemon!\nIt will be back on :clock: <t:1761120000:f>",
+        "expect": ('1761120000',),
+    },
+    {
+        "pattern": "CHECKLIST_CB_PATTERN",
+        "call": "search",
+        "text": ":robot: Your catch bot will be back on <t:1761120000:f>",
+        "expect": ('1761120000',),
+    },
+    {
+        "pattern": "CATCHBOT_SPENT_PATTERN",
+        "call": "search",
+        "text": "You spent <:PokeCoin:1> **25,000 PokeCoins** to run your catch bot.",
+        "expect": (),
+    },
+    # ❀ Quests
+    {
+        "pattern": "QUEST_AVAILABLE_PATTERN",
+        "call": "search",
+        "text": "You have no quests left!\nYour next quest is available <t:1761100000:R>",
+        "expect": ('1761100000',),
+    },
+    {
+        "pattern": "QUEST_ENTRY_PATTERN",
+        "call": "findall",
+        "text": "**Quest #1**: Catch 10 Pokemon\n**Quest #2**: Fish 5 Pokemon\n**Quest #3**: Win 3 battles",
+        "expect": ['**Quest #1**:', '**Quest #2**:', '**Quest #3**:'],
+    },
+    {
+        "pattern": "QUEST_NEXT_IN_PATTERN",
+        "call": "search",
+        "text": "Next quest in: 2H 15M 30S",
+        "expect": ('2H 15M 30S', '2', '15M', '15', '30S', '30'),
+    },
+    {
+        "pattern": "QUEST_COMPLETED_PATTERN",
+        "call": "search",
+        "text": ":notepad_spiral: **mewlover** completed the quest **Catch 10 Pokemon**!",
+        "expect": ('mewlover',),
+    },
+    # ❀ Market / auctions
+    {
+        "pattern": "MARKET_AUTHOR_PATTERN",
+        "call": "match",
+        "text": "Shiny Charizard #6",
+        "expect": ('Shiny Charizard', '6'),
+    },
+    {
+        "pattern": "MARKET_PURCHASE_PATTERN",
+        "call": "search",
+        "text": "**mewlover** purchased **<:shiny:1> Shiny Charizard** for <:PokeCoin:2> **1,250,000**",
+        "expect": ('<:shiny:1> Shiny Charizard',),
+    },
+    {
+        "pattern": "AUCTION_ENDS_PATTERN",
+        "call": "findall",
+        "text": "Lot 1 · Ends <t:1761100000:R>\nLot 2 · Ends <t:1761103600:R>\nLot 3 · Ends <t:1761100000:R>",
+        "expect": ['1761100000', '1761103600', '1761100000'],
+    },
+    # ❀ Pokédex embeds
+    {
+        "pattern": "DEX_NAME_NUMBER_PATTERN",
+        "call": "match",
+        "text": "Golden Mewtwo #150",
+        "expect": ('Golden Mewtwo', '150'),
+    },
+    {
+        "pattern": "DEX_AUTHOR_PATTERN",
+        "call": "match",
+        "text": "Mega Rayquaza #384",
+        "expect": ('Mega Rayquaza', '384'),
+    },
+    # ❀ Factions
+    {
+        "pattern": "TEAM_LOGO_PATTERN",
+        "call": "findall",
+        "text": "<:team_logo:1> Team Aqua\n<:team_logo:1> Pikachu\n<:team_logo:1> Eevee",
+        "expect": ['<:team_logo:1>', '<:team_logo:1>', '<:team_logo:1>'],
+    },
+    {
+        "pattern": "FACTION_DAILY_BALL_PATTERN",
+        "call": "search",
+        "text": "<:team_logo:1234> **|** Your Faction's daily ball-type is <:Ultraball:5678> Ultraball",
+        "expect": ('<:team_logo:1234>', '<:Ultraball:5678>', 'Ultraball'),
+    },
+    {
+        "pattern": "FACTION_TEAM_AUTHOR_PATTERN",
+        "call": "search",
+        "text": "Team Magma Headquarters",
+        "expect": ('Magma',),
+    },
+    {
+        "pattern": "FACTION_TARGET_BALL_PATTERN",
+        "call": "search",
+        "text": "<:Greatball:4321> **Today's target Pokemon are**\nPikachu, Eevee, Snorlax",
+        "expect": ('Greatball',),
+    },
+    # ❀ Patreon rank
+    {
+        "pattern": "MARKDOWN_EMPHASIS_PATTERN",
+        "call": "sub",
+        "text": "**mewlover's** __profile__",
+        "expect": "mewlover's profile",
+    },
+    {
+        "pattern": "NON_USERNAME_CHARS_PATTERN",
+        "call": "sub",
+        "text": "mew.lover's profile!",
+        "expect": 'mew.loversprofile',
+    },
+    {
+        "pattern": "PATREON_RANK_TITLE_PATTERN",
+        "call": "search",
+        "text": "mewlover's profile **Diamond Patreon**",
+        "expect": ('Diamond',),
+    },
+    {
+        "pattern": "PATREON_RANK_EMOJI_PATTERN",
+        "call": "search",
+        "text": "<:patreonlogo:1111> <:diamond:2222> Patreon supporter",
+        "expect": ('diamond',),
+    },
+    # ❀ Trades
+    {
+        "pattern": "MULTI_TRADE_OWNER_PATTERN",
+        "call": "search",
+        "text": "<:team_logo:1> mewlover's Pokemon",
+        "expect": ('mewlover',),
+    },
+    {
+        "pattern": "TRADE_QUANTITY_SUFFIX_PATTERN",
+        "call": "sub",
+        "text": "Shiny Pikachu x3",
+        "expect": 'Shiny Pikachu',
+    },
+    {
+        "pattern": "SINGLE_TRADE_PATTERN",
+        "call": "findall",
+        "text": ":handshake: mewlover received a Pikachu from pikafan!",
+        "expect": [(':handshake: mewlover', 'Pikachu')],
+    },
+    # ❀ TCG inventory
+    {
+        "pattern": "TCG_OWNER_PATTERN",
+        "call": "search",
+        "text": "mew.lover's TCG Inventory",
+        "expect": ('mew.lover',),
+    },
+    {
+        "pattern": "TCG_PAGE_FOOTER_PATTERN",
+        "call": "search",
+        "text": "Page 2 / 7",
+        "expect": ('2', '7'),
+    },
+    {
+        "pattern": "TCG_PACK_LINE_PATTERN",
+        "call": "match",
+        "text": " 3. <:pack:1> Base Set Pack `base-pack-3` x2",
+        "expect": (),
+    },
+    {
+        "pattern": "TCG_PACK_ID_PATTERN",
+        "call": "search",
+        "text": " 3. <:pack:1> Base Set Pack `base-pack-3` x2",
+        "expect": ('base-pack-3',),
+    },
+    {
+        "pattern": "TCG_PACK_CATEGORY_PATTERN",
+        "call": "match",
+        "text": "jungle2-pack-12",
+        "expect": ('jungle2-pack',),
+    },
+    # ❀ Box pages
+    {
+        "pattern": "BOX_DEX_LINE_PATTERN",
+        "call": "search",
+        "text": "`  25 ` <:pikachu:1> Pikachu <:caught:2>",
+        "expect": ('25', 'Pikachu'),
+    },
+    {
+        "pattern": "BOX_DEX_LINE_PATTERN",
+        "call": "search",
+        "text": "`133` <:shiny:1> <:eevee:2> Shiny Eevee",
+        "expect": ('133', 'Shiny Eevee'),
+    },
+    {
+        "pattern": "VARIANT_PREFIX_PATTERN",
+        "call": "sub",
+        "text": "Golden Magikarp",
+        "expect": 'Magikarp',
+    },
+]
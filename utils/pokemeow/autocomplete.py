@@ -1,15 +1,12 @@
 # -------------------- 🐾 Pokemon Autocomplete Module -------------------- #
 
-import ast
-import os
 import re
+from functools import lru_cache
 
 import discord
 from discord import app_commands
 from utils.group_func.market_alert.market_alert_db_func import *
-
-# ==================== 💠 Config ==================== #
-WEAKNESS_CHART_FILE = os.path.join("config", "weakness_chart.py")
+from utils.pokemeow import pokedex
 
 
 def format_price(n: int) -> str:
@@ -21,40 +18,14 @@ def format_price(n: int) -> str:
     return str(n)
 
 
-# ==================== 📖 Load Weakness Chart ==================== #
-def load_weakness_chart():
-    with open(WEAKNESS_CHART_FILE, "r", encoding="utf-8") as f:
-        content = f.read()
-
-    parsed = ast.parse(content)
-    weakness_chart = None
-    for node in parsed.body:
-        if isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Name):
-            if node.targets[0].id == "weakness_chart":
-                weakness_chart = ast.literal_eval(node.value)
-
-    if weakness_chart is None:
-        raise ValueError("Could not find weakness_chart dict in the file.")
-
-    return weakness_chart
-
-
-WEAKNESS_CHART = load_weakness_chart()
-
-
 # ==================== 🗂 Build Weakness Indexes ==================== #
-def build_weakness_indexes(weakness_chart: dict):
+# Built on first use (not at import) so the Pokédex artifact stays lazy
+@lru_cache(maxsize=1)
+def build_weakness_indexes():
     dex_to_key = {}
     key_normalized = {}
-    for key, data in weakness_chart.items():
-        dex_raw = data.get("dex")
-        try:
-            dex_int = int(dex_raw) if dex_raw is not None else None
-        except Exception:
-            dex_int = None
-
-        if dex_int is not None:
-            dex_to_key[dex_int] = key
+    for key, dex_int in pokedex.items():
+        dex_to_key[dex_int] = key
 
         norm = key.lower().replace("-", " ").replace("_", " ").strip()
         key_normalized[norm] = key
@@ -64,22 +35,18 @@ def build_weakness_indexes(weakness_chart: dict):
     return dex_to_key, key_normalized
 
 
-DEX_TO_KEY, KEY_NORMALIZED = build_weakness_indexes(WEAKNESS_CHART)
-
-# Pre-build clean list
-POKEMON_LIST: list[tuple[str, int]] = [
-    (key.title(), int(data.get("dex", 0)))
-    for key, data in WEAKNESS_CHART.items()
-    if data.get("dex") is not None
-]
+@lru_cache(maxsize=1)
+def pokemon_normalized() -> list[tuple[str, str, int]]:
+    """(Title Name, normalized name, dex) per chart entry, in chart order."""
+    entries = []
+    for key, dex in pokedex.items():
+        name = key.title()
+        norm = re.sub(r"[^\w\s]", "", name.lower()).replace(" ", "")
+        entries.append((name, norm, dex))
+    return entries
 
 
 # ==================== 🐉 Unified Mega/Golden/Shiny Formatter ==================== #
-POKEMON_NORMALIZED: list[tuple[str, str, int]] = []
-for name, dex in POKEMON_LIST:
-    norm = re.sub(r"[^\w\s]", "", name.lower()).replace(" ", "")
-    POKEMON_NORMALIZED.append((name, norm, dex))
-
 
 def old_format_display_name(raw_name: str) -> str:
     """
@@ -127,6 +94,143 @@ def format_display_name(raw_name: str) -> str:
     return display_name
 
 
+# ==================== 🌲 Search Indexes (built on first search) ==================== #
+AUTOCOMPLETE_LIMIT = 25
+FUZZY_MIN_SCORE = 0.4
+
+
+@lru_cache(maxsize=1)
+def pokemon_display() -> list[str]:
+    """"Display Name #Dex" per chart entry, in pokemon_normalized() order."""
+    return [
+        f"{format_display_name(name)} #{dex}".title()
+        for name, _, dex in pokemon_normalized()
+    ]
+
+
+def _grams(text: str, n: int) -> set[str]:
+    return {text[i : i + n] for i in range(len(text) - n + 1)}
+
+
+@lru_cache(maxsize=1)
+def build_search_indexes():
+    """
+    Build the autocomplete indexes:
+    - prefix trie: node → entry ids ranked by name length, then chart order
+    - 1/2/3-gram index: gram → entry ids (substring candidates + fuzzy scoring)
+    - dex index: dex → entry ids
+    """
+    entries = pokemon_normalized()
+    ranked = sorted(range(len(entries)), key=lambda i: (len(entries[i][1]), i))
+
+    trie: dict = {}
+    grams: dict[str, set[int]] = {}
+    by_dex: dict[int, list[int]] = {}
+    for i in ranked:
+        _, norm, dex = entries[i]
+        node = trie
+        for ch in norm:
+            node = node.setdefault(ch, {})
+            node.setdefault("#", []).append(i)
+        for n in (1, 2, 3):
+            for gram in _grams(norm, n):
+                grams.setdefault(gram, set()).add(i)
+        by_dex.setdefault(dex, []).append(i)
+
+    return trie, grams, by_dex
+
+
+def _prefix_matches(query: str) -> list[int]:
+    node = build_search_indexes()[0]
+    for ch in query:
+        node = node.get(ch)
+        if node is None:
+            return []
+    return node["#"]
+
+
+def _substring_matches(query: str) -> list[int]:
+    """Entries containing the query, ranked by match position then length."""
+    entries = pokemon_normalized()
+    gram_index = build_search_indexes()[1]
+    n = min(3, len(query))
+    candidates = None
+    for gram in _grams(query, n):
+        ids = gram_index.get(gram)
+        if not ids:
+            return []
+        candidates = set(ids) if candidates is None else candidates & ids
+    hits = []
+    for i in candidates or ():
+        pos = entries[i][1].find(query)
+        if pos > 0:
+            hits.append((pos, len(entries[i][1]), i))
+    hits.sort()
+    return [i for _, _, i in hits]
+
+
+def _fuzzy_matches(query: str) -> list[int]:
+    """Typo-tolerant matches ranked by shared-trigram (Dice) similarity."""
+    query_grams = _grams(query, 3)
+    if not query_grams:
+        return []
+    entries = pokemon_normalized()
+    gram_index = build_search_indexes()[1]
+    shared: dict[int, int] = {}
+    for gram in query_grams:
+        for i in gram_index.get(gram, ()):
+            shared[i] = shared.get(i, 0) + 1
+
+    scored = []
+    for i, count in shared.items():
+        norm = entries[i][1]
+        score = 2 * count / (len(query_grams) + max(1, len(norm) - 2))
+        if score >= FUZZY_MIN_SCORE:
+            scored.append((-score, len(norm), i))
+    scored.sort()
+    return [i for _, _, i in scored]
+
+
+@lru_cache(maxsize=2048)
+def ranked_pokemon_choices(query: str) -> tuple[app_commands.Choice[str], ...]:
+    """
+    Top matches for a normalized query (cached per query):
+    dex match → exact prefix → substring → fuzzy typo tolerance.
+    """
+    entries = pokemon_normalized()
+    display_names = pokemon_display()
+    if not query:
+        tiers = [range(min(AUTOCOMPLETE_LIMIT, len(entries)))]
+    elif query.isdigit():
+        dex_index = build_search_indexes()[2]
+        tiers = [dex_index.get(int(query), ()), _substring_matches(query)]
+    else:
+        tiers = [_prefix_matches(query), _substring_matches(query)]
+
+    results: list[app_commands.Choice[str]] = []
+    seen = set()
+
+    def take(ids) -> bool:
+        for i in ids:
+            display = display_names[i]
+            if display in seen:
+                continue
+            seen.add(display)
+            results.append(
+                app_commands.Choice(name=display, value=entries[i][0])
+            )
+            if len(results) >= AUTOCOMPLETE_LIMIT:
+                return True
+        return False
+
+    for ids in tiers:
+        if take(ids):
+            return tuple(results)
+    if query and not query.isdigit() and len(results) < AUTOCOMPLETE_LIMIT:
+        take(_fuzzy_matches(query))
+    return tuple(results)
+
+
 # ==================== 🌟 Autocomplete Functions ==================== #
 async def pokemon_autocomplete(
     interaction: discord.Interaction, current: str
@@ -136,36 +240,7 @@ async def pokemon_autocomplete(
     Matches both names and dex numbers.
     """
     current_simple = re.sub(r"[^\w\s]", "", (current or "").lower()).replace(" ", "")
-    results: list[app_commands.Choice[str]] = []
-    seen = set()
-
-    # Check if input looks numeric (dex search)
-    dex_query = None
-    if current_simple.isdigit():
-        try:
-            dex_query = int(current_simple)
-        except ValueError:
-            dex_query = None
-
-    for name, norm, dex in POKEMON_NORMALIZED:
-        # Match by name
-        if not current_simple or current_simple in norm:
-            display_name = format_display_name(name)
-            display = f"{display_name} #{dex}"
-            if display not in seen:
-                results.append(app_commands.Choice(name=display.title(), value=name))
-                seen.add(display)
-
-        # Match by dex number
-        if dex_query is not None and dex_query == dex:
-            display_name = format_display_name(name)
-            display = f"{display_name} #{dex}"
-            if display not in seen:
-                results.append(app_commands.Choice(name=display, value=name))
-                seen.add(display)
-
-        if len(results) >= 25:
-            break
+    results = list(ranked_pokemon_choices(current_simple))
 
     if not results:
         results.append(
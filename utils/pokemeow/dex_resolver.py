@@ -0,0 +1,116 @@
+# -------------------- 🧭 Pokémon Name/Dex Resolver -------------------- #
+# Every name↔dex lookup goes through the hash indexes below, built from
+# the compiled Pokédex, the Paldea/Galar dex and the rarity lists. The
+# chart indexes are built on first lookup, so importing this module never
+# loads the Pokédex. All lookups are O(1); nothing here scans a chart.
+#
+# Dex numbering used across the bot:
+#   - base dex            → chart dex (e.g. 25)
+#   - shiny               → base + 1000 (typed input: "1" + 3-digit dex)
+#   - golden              → base + 9000 (typed input: "9" + 3-digit dex)
+#   - mega / forms (7xxx) → own chart dex, never offset
+# ---------------------------------------------------------------------- #
+
+from functools import lru_cache
+
+from config.paldea_galar_dict import dex as paldea_galar_dex
+from config.pokemons import (
+    common_mons,
+    exclusive_mons,
+    legendary_mons,
+    rare_mons,
+    superrare_mons,
+    uncommon_mons,
+)
+from utils.pokemeow import pokedex
+
+SHINY_DEX_OFFSET = 1000
+GOLDEN_DEX_OFFSET = 9000
+FORM_DEX_START = 7000
+
+# Highest precedence first — a name keeps the first rarity it is found in
+RARITY_LISTS = (
+    ("legendary", legendary_mons),
+    ("super rare", superrare_mons),
+    ("rare", rare_mons),
+    ("uncommon", uncommon_mons),
+    ("common", common_mons),
+)
+
+
+# ==================== 🗂 Index Build ==================== #
+def _first_wins(pairs) -> dict:
+    index = {}
+    for key, value in pairs:
+        index.setdefault(key, value)
+    return index
+
+
+@lru_cache(maxsize=1)
+def _chart_indexes() -> tuple[dict[str, int], dict[int, str]]:
+    """Chart name → chart dex, and chart dex → first chart name (chart order)."""
+    name_to_dex = dict(pokedex.items())
+    dex_to_name = _first_wins((dex, name) for name, dex in pokedex.items())
+    return name_to_dex, dex_to_name
+
+
+# Paldea/Galar dex (exact-case names) in both directions
+PALDEA_DEX_TO_NAME: dict[int, str] = paldea_galar_dex
+PALDEA_NAME_TO_DEX: dict[str, int] = _first_wins(
+    (name, num) for num, name in paldea_galar_dex.items()
+)
+
+# Lowercased name → rarity / exclusivity
+RARITY_BY_NAME: dict[str, str] = _first_wins(
+    (mon.lower(), rarity) for rarity, mons in RARITY_LISTS for mon in mons
+)
+EXCLUSIVE_NAMES: frozenset[str] = frozenset(mon.lower() for mon in exclusive_mons)
+
+
+# ==================== 🔍 Lookups ==================== #
+def chart_name_for_dex(dex: int) -> str | None:
+    """First chart name with this dex (matches the old chart-order scans)."""
+    return _chart_indexes()[1].get(dex)
+
+
+def chart_dex_for_name(name: str) -> int | None:
+    """Chart dex for an exact chart key (lowercase, mega forms hyphenated)."""
+    return _chart_indexes()[0].get(name)
+
+
+def paldea_dex_for_name(name: str) -> int | None:
+    """Paldea/Galar dex number for an exact-case name."""
+    return PALDEA_NAME_TO_DEX.get(name)
+
+
+def rarity_for_name(name: str) -> str | None:
+    """Listed rarity (legendary → common) for a lowercased base name."""
+    return RARITY_BY_NAME.get(name)
+
+
+def is_exclusive_name(name: str) -> bool:
+    return name in EXCLUSIVE_NAMES
+
+
+# ==================== ✨ Variant Offsets ==================== #
+def split_variant_dex(dex_text: str) -> tuple[int, str]:
+    """
+    Split typed dex input into (base_dex, prefix).
+    "9xxx" → golden, "1xxx" → shiny, anything else → no prefix.
+    """
+    if len(dex_text) > 3 and dex_text[0] == "9":
+        return int(dex_text[1:]), "Golden "
+    if len(dex_text) > 3 and dex_text[0] == "1":
+        return int(dex_text[1:]), "Shiny "
+    return int(dex_text), ""
+
+
+def apply_variant_offset(chart_dex: int, prefix: str) -> int:
+    """Apply the shiny/golden dex offset; 7xxx forms are returned unchanged."""
+    if chart_dex >= FORM_DEX_START:
+        return chart_dex
+    if prefix == "Shiny ":
+        return chart_dex + SHINY_DEX_OFFSET
+    if prefix == "Golden ":
+        return chart_dex + GOLDEN_DEX_OFFSET
+    return chart_dex
@@ -1,5 +1,4 @@
-from config.weakness_chart import weakness_chart
-from config.weakness_chart import weakness_chart
+from utils.pokemeow import dex_resolver
 from utils.logs.debug_logs import debug_log, enable_debug
 from utils.logs.pretty_log import pretty_log
 
@@ -9,17 +8,14 @@ enable_debug(f"{__name__}.resolve_pokemon_input")
 
 def get_name_via_dex(dex: int) -> str | None:
     """Returns the Pokémon name corresponding to the given dex number."""
-    for name, data in weakness_chart.items():
-        if data.get("dex") == f"{dex:04d}":
-            return name
-        return None
+    return dex_resolver.chart_name_for_dex(dex)
 
 
 def get_dex_by_name(pokemon: str):
     """Returns the dex number corresponding to the given Pokémon name."""
-    data = weakness_chart.get(pokemon.lower())
-    if data:
-        return data.get("dex")
+    chart_dex = dex_resolver.chart_dex_for_name(pokemon.lower())
+    if chart_dex is not None:
+        return f"{chart_dex:04d}"
     return None
 
 def resolve_pokemon_input(pokemon_input: str):
@@ -39,10 +35,9 @@ def resolve_pokemon_input(pokemon_input: str):
             pokemon_input = pokemon_input.lower()
 
         # Get info from weakness chart
-        chart_data = weakness_chart.get(pokemon_input.lower())
-        if not chart_data or "dex" not in chart_data:
+        dex_number = dex_resolver.chart_dex_for_name(pokemon_input.lower())
+        if dex_number is None:
             debug_log(f"[resolve_pokemon_input] No Pokémon found with name {pokemon_input}")
             raise ValueError(f"No Pokémon found with name {pokemon_input}")
-        dex_number = int(chart_data["dex"])
         debug_log(f"[resolve_pokemon_input] Resolved name input to {pokemon_input} (Dex #{dex_number})")
         return pokemon_input, dex_number
\ No newline at end of file
@@ -0,0 +1,315 @@
+# -------------------- 📘 Pokédex Accessor -------------------- #
+# Single entry point for weakness-chart data.
+#
+# config/weakness_chart.py is a ~60k-line dict literal; importing it (or
+# re-parsing it with ast) on every restart is slow and keeps thousands of
+# small lists alive. The build step below compiles it once into
+# config/pokedex.bin, a compact binary artifact:
+#   - dex numbers as uint16
+#   - types as two uint8 indexes into TYPE_ORDER (0xFF = none)
+#   - each multiplier bucket ("0x", "1/4x", ...) as one uint32 type bitmask
+# The artifact is loaded lazily on first access. Its header carries a
+# SHA-256 of weakness_chart.py, so a stale artifact is rebuilt on load.
+#
+# Rebuild after editing the chart (or let the bot do it on startup):
+#   python -m utils.pokemeow.pokedex
+# Fail (exit 1) if the committed artifact is out of date:
+#   python -m utils.pokemeow.pokedex --check
+# ------------------------------------------------------------ #
+
+import hashlib
+import os
+import struct
+import sys
+from array import array
+
+from utils.logs.pretty_log import pretty_log
+
+# ==================== 💠 Config ==================== #
+POKEDEX_ARTIFACT = os.path.join("config", "pokedex.bin")
+WEAKNESS_CHART_SOURCE = os.path.join("config", "weakness_chart.py")
+
+ARTIFACT_MAGIC = b"PDX1"
+ARTIFACT_VERSION = 2
+# magic, version, n_types, n_buckets, n_rows, sha256 of WEAKNESS_CHART_SOURCE
+_HEADER = struct.Struct("<4sHBBI32s")
+NO_SOURCE_HASH = bytes(32)
+
+TYPE_ORDER = (
+    "normal",
+    "fire",
+    "water",
+    "electric",
+    "grass",
+    "ice",
+    "fighting",
+    "poison",
+    "ground",
+    "flying",
+    "psychic",
+    "bug",
+    "rock",
+    "ghost",
+    "dragon",
+    "dark",
+    "steel",
+    "fairy",
+)
+MULTIPLIER_KEYS = ("0x", "1/4x", "1/2x", "1x", "2x", "4x")
+NO_TYPE = 0xFF
+
+TYPE_INDEX = {name: i for i, name in enumerate(TYPE_ORDER)}
+
+
+# ==================== 🗜 Compiled Pokédex ==================== #
+class CompiledPokedex:
+    """Column-oriented Pokédex decoded from the binary artifact."""
+
+    __slots__ = ("names", "row_of", "dex", "type1", "type2", "masks")
+
+    def __init__(self, names, dex, type1, type2, masks):
+        self.names: list[str] = names
+        self.row_of: dict[str, int] = {name: i for i, name in enumerate(names)}
+        self.dex: array = dex
+        self.type1: array = type1
+        self.type2: array = type2
+        self.masks: dict[str, array] = masks
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+def _mask_to_types(mask: int) -> list[str]:
+    return [TYPE_ORDER[i] for i in range(len(TYPE_ORDER)) if mask >> i & 1]
+
+
+def _little_endian(arr: array) -> array:
+    if sys.byteorder != "little":
+        arr.byteswap()
+    return arr
+
+
+def source_hash(path: str = WEAKNESS_CHART_SOURCE) -> bytes | None:
+    """SHA-256 of the chart source, or None if it isn't on disk."""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).digest()
+    except OSError:
+        return None
+
+
+# ==================== 🔨 Build Step ==================== #
+def compile_chart(chart: dict, chart_hash: bytes = NO_SOURCE_HASH) -> bytes:
+    """Compile a weakness_chart dict into the binary artifact format."""
+    names = list(chart)
+    dex = array("H")
+    type1 = array("B")
+    type2 = array("B")
+    masks = {key: array("I") for key in MULTIPLIER_KEYS}
+
+    for name in names:
+        data = chart[name]
+        dex.append(int(data["dex"]))
+
+        types = [TYPE_INDEX[t] for t in data.get("types", [])]
+        type1.append(types[0] if types else NO_TYPE)
+        type2.append(types[1] if len(types) > 1 else NO_TYPE)
+
+        for key in MULTIPLIER_KEYS:
+            mask = 0
+            for t in data.get(key, ()):
+                mask |= 1 << TYPE_INDEX[t]
+            masks[key].append(mask)
+
+    names_blob = "\n".join(names).encode("utf-8")
+    parts = [
+        _HEADER.pack(
+            ARTIFACT_MAGIC,
+            ARTIFACT_VERSION,
+            len(TYPE_ORDER),
+            len(MULTIPLIER_KEYS),
+            len(names),
+            chart_hash,
+        ),
+        struct.pack("<I", len(names_blob)),
+        names_blob,
+        _little_endian(dex).tobytes(),
+        type1.tobytes(),
+        type2.tobytes(),
+    ]
+    parts.extend(_little_endian(masks[key]).tobytes() for key in MULTIPLIER_KEYS)
+    return b"".join(parts)
+
+
+def _compile_source() -> bytes:
+    from config.weakness_chart import weakness_chart
+
+    return compile_chart(weakness_chart, source_hash() or NO_SOURCE_HASH)
+
+
+def _write_artifact(payload: bytes, path: str = POKEDEX_ARTIFACT):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def build_artifact(path: str = POKEDEX_ARTIFACT) -> int:
+    """Compile config/weakness_chart.py into the artifact. Returns row count."""
+    payload = _compile_source()
+    _write_artifact(payload, path)
+    return len(decode_artifact(payload))
+
+
+# ==================== 📖 Loader ==================== #
+def decode_artifact(
+    payload: bytes, expected_hash: bytes | None = None
+) -> CompiledPokedex:
+    """Decode an artifact, rejecting it if expected_hash differs from its own."""
+    magic, version, n_types, n_buckets, n_rows, chart_hash = _HEADER.unpack_from(
+        payload, 0
+    )
+    if magic != ARTIFACT_MAGIC or version != ARTIFACT_VERSION:
+        raise ValueError("Unsupported pokedex artifact format")
+    if n_types != len(TYPE_ORDER) or n_buckets != len(MULTIPLIER_KEYS):
+        raise ValueError("Pokedex artifact does not match TYPE_ORDER/MULTIPLIER_KEYS")
+    if expected_hash is not None and chart_hash != expected_hash:
+        raise ValueError(
+            f"Pokedex artifact is stale ({WEAKNESS_CHART_SOURCE} changed since build)"
+        )
+
+    offset = _HEADER.size
+    (names_len,) = struct.unpack_from("<I", payload, offset)
+    offset += 4
+    names = [
+        sys.intern(n)
+        for n in payload[offset : offset + names_len].decode("utf-8").split("\n")
+    ]
+    offset += names_len
+
+    def take(typecode: str) -> array:
+        nonlocal offset
+        arr = array(typecode)
+        size = arr.itemsize * n_rows
+        arr.frombytes(payload[offset : offset + size])
+        offset += size
+        return _little_endian(arr) if arr.itemsize > 1 else arr
+
+    dex = take("H")
+    type1 = take("B")
+    type2 = take("B")
+    masks = {key: take("I") for key in MULTIPLIER_KEYS}
+    return CompiledPokedex(names, dex, type1, type2, masks)
+
+
+_POKEDEX: CompiledPokedex | None = None
+
+
+def load() -> CompiledPokedex:
+    """Return the compiled Pokédex, loading (or building) it on first use."""
+    global _POKEDEX
+    if _POKEDEX is not None:
+        return _POKEDEX
+
+    try:
+        with open(POKEDEX_ARTIFACT, "rb") as f:
+            _POKEDEX = decode_artifact(f.read(), expected_hash=source_hash())
+    except (OSError, ValueError, struct.error) as e:
+        pretty_log(
+            "warn",
+            f"Pokédex artifact unavailable ({e}); rebuilding from weakness_chart",
+            label="📘 POKEDEX",
+        )
+        payload = _compile_source()
+        _POKEDEX = decode_artifact(payload)
+        try:
+            _write_artifact(payload)
+        except OSError:
+            pass
+    return _POKEDEX
+
+
+def check_artifact(path: str = POKEDEX_ARTIFACT) -> str | None:
+    """Return why the artifact on disk is out of date, or None if it is current."""
+    chart_hash = source_hash()
+    if chart_hash is None:
+        return f"{WEAKNESS_CHART_SOURCE} not found"
+    try:
+        with open(path, "rb") as f:
+            decode_artifact(f.read(), expected_hash=chart_hash)
+    except (OSError, ValueError, struct.error) as e:
+        return str(e)
+    return None
+
+
+# ==================== 🔍 Accessors ==================== #
+def contains(name: str) -> bool:
+    return name in load().row_of
+
+
+def get_dex(name: str) -> int | None:
+    """Chart dex number for an exact chart key, or None."""
+    pdx = load()
+    row = pdx.row_of.get(name)
+    return None if row is None else pdx.dex[row]
+
+
+def get_types(name: str) -> tuple[str, ...]:
+    pdx = load()
+    row = pdx.row_of.get(name)
+    if row is None:
+        return ()
+    return tuple(
+        TYPE_ORDER[t] for t in (pdx.type1[row], pdx.type2[row]) if t != NO_TYPE
+    )
+
+
+def get_multipliers(name: str) -> dict[str, list[str]]:
+    """Non-empty multiplier buckets for a Pokémon, e.g. {"2x": ["fire"], ...}."""
+    pdx = load()
+    row = pdx.row_of.get(name)
+    if row is None:
+        return {}
+    result = {}
+    for key in MULTIPLIER_KEYS:
+        mask = pdx.masks[key][row]
+        if mask:
+            result[key] = _mask_to_types(mask)
+    return result
+
+
+def get_entry(name: str) -> dict | None:
+    """Decode one row into the original weakness_chart entry shape."""
+    pdx = load()
+    row = pdx.row_of.get(name)
+    if row is None:
+        return None
+    entry = get_multipliers(name)
+    entry["dex"] = f"{pdx.dex[row]:04d}"
+    entry["types"] = list(get_types(name))
+    return entry
+
+
+def items():
+    """Yield (name, dex) pairs in chart order."""
+    pdx = load()
+    return zip(pdx.names, pdx.dex)
+
+
+def names() -> list[str]:
+    return load().names
+
+
+# ==================== 🔨 CLI ==================== #
+if __name__ == "__main__":
+    if "--check" in sys.argv[1:]:
+        problem = check_artifact()
+        if problem:
+            print(f"❌ {POKEDEX_ARTIFACT}: {problem}")
+            print("   Rebuild with: python -m utils.pokemeow.pokedex")
+            sys.exit(1)
+        print(f"✅ {POKEDEX_ARTIFACT} matches {WEAKNESS_CHART_SOURCE}")
+        sys.exit(0)
+
+    rows = build_artifact()
+    print(f"Compiled {rows} Pokémon into {POKEDEX_ARTIFACT}")
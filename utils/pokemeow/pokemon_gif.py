@@ -4,12 +4,13 @@ from typing import Literal
 
 
 from config.pokemon_gifs import *
-from utils.logs.debug_logs import debug_log, enable_debug
+from utils.logs.debug_logs import DebugGuard, enable_debug
 from utils.logs.pretty_log import pretty_log
 from utils.db.market_value_db_func import fetch_image_link_cache
 from utils.functions.pokemon_func import format_names_for_market_value_lookup, get_dex_number_by_name
 
 # enable_debug(f"{__name__}.get_pokemon_gif")
+_debug = DebugGuard(__name__)
 hyphen_mon_names = [
     "jangmo-o",
     "hakamo-o",
@@ -56,23 +57,24 @@ def get_pokemon_gif_from_local_data(input_name: str):
     golden = False
     form: Literal["regular", "mega", "gmax"] = "regular"
     region_suffix = ""
-    debug_log(f"Input Pokémon name: {input_name}")
+    _debug.log(f"Input Pokémon name: {input_name}")
     # Normalize input
     name_parts = input_name.lower().replace("_", "-").split()
-    debug_log(f"Normalized name_parts: {name_parts}")
+    if _debug:
+        _debug.log(f"Normalized name_parts: {name_parts}")
     dex_number = None
     if "golden" in name_parts:
         golden = True
         name_parts.remove("golden")
-        debug_log("Detected 'golden' in name_parts, setting golden=True")
+        _debug.log("Detected 'golden' in name_parts, setting golden=True")
 
     if "shiny" in name_parts:
         shiny = True
         name_parts.remove("shiny")
-        debug_log("Detected 'shiny' in name_parts, setting shiny=True")
+        _debug.log("Detected 'shiny' in name_parts, setting shiny=True")
 
     remaining_name = "-".join(name_parts)
-    debug_log(f"Remaining name after removing shiny/golden: {remaining_name}")
+    _debug.log(f"Remaining name after removing shiny/golden: {remaining_name}")
 
     regions = {
         "alolan": "-alola",
@@ -83,7 +85,7 @@ def get_pokemon_gif_from_local_data(input_name: str):
     for region_prefix, suffix in regions.items():
         if remaining_name.startswith(region_prefix + "-"):
             region_suffix = suffix
-            debug_log(
+            _debug.log(
                 f"Detected region prefix '{region_prefix}', applying suffix '{suffix}' and stripping prefix from remaining_name."
             )
             remaining_name = remaining_name[len(region_prefix) + 1 :]
@@ -91,11 +93,11 @@ def get_pokemon_gif_from_local_data(input_name: str):
 
     if remaining_name.startswith("mega-"):
         form = "mega"
-        debug_log("Detected 'mega-' prefix, setting form='mega'")
+        _debug.log("Detected 'mega-' prefix, setting form='mega'")
         remaining_name = remaining_name.replace("mega-", "")
     elif remaining_name.startswith(("gigantamax-", "gmax-")):
         form = "gmax"
-        debug_log("Detected 'gigantamax-' or 'gmax-' prefix, setting form='gmax'")
+        _debug.log("Detected 'gigantamax-' or 'gmax-' prefix, setting form='gmax'")
         remaining_name = remaining_name.replace("gigantamax-", "").replace("gmax-", "")
 
     # 🔹 Special gmax aliases
@@ -105,13 +107,13 @@ def get_pokemon_gif_from_local_data(input_name: str):
         "eternamax-eternatus": "eternatus",
     }
     if form == "gmax" and remaining_name in gmax_aliases:
-        debug_log(
+        _debug.log(
             f"Gmax alias detected for '{remaining_name}', replacing with '{gmax_aliases[remaining_name]}'"
         )
         remaining_name = gmax_aliases[remaining_name]
 
     base_name = f"{remaining_name}{region_suffix}".lower()
-    debug_log(f"Base name for sprites: {base_name}")
+    _debug.log(f"Base name for sprites: {base_name}")
     # Remove "shiny" and "golden" from the input for comparison
     compare_name = (
         input_name.lower()
@@ -125,7 +127,7 @@ def get_pokemon_gif_from_local_data(input_name: str):
         base_name = base_name.replace("-", "")
 
     attr_name = remaining_name.replace("-", "_")
-    debug_log(f"Attribute name for URL lookup: {attr_name}")
+    _debug.log(f"Attribute name for URL lookup: {attr_name}")
 
     gif_url = None
 
@@ -139,9 +141,9 @@ def get_pokemon_gif_from_local_data(input_name: str):
             golden_base_name.split()
         )  # Replace spaces with hyphens
         golden_base_name_attr = golden_base_name.replace("-", "_")
-        debug_log(f"Golden base name for dex lookup: {golden_base_name}")
+        _debug.log(f"Golden base name for dex lookup: {golden_base_name}")
         dex_number = get_dex_number_by_name(golden_base_name)
-        debug_log(f"Dex number for golden form: {dex_number}")
+        _debug.log(f"Dex number for golden form: {dex_number}")
         pretty_log(
             tag="debug",
             message=(
@@ -151,12 +153,12 @@ def get_pokemon_gif_from_local_data(input_name: str):
         if form == "mega":
             golden_attr_name = f"mega_{attr_name}"
             gif_url = getattr(GOLDEN_MEGA_POKEMON_URL, golden_attr_name, None)
-            debug_log(
+            _debug.log(
                 f"Golden mega form: attr_name={golden_attr_name}, gif_url={gif_url}"
             )
         elif form == "gmax":
             gif_url = getattr(GOLDEN_POKEMON_URL, f"gmax_{attr_name}", None)
-            debug_log(
+            _debug.log(
                 f"Golden gmax form: attr_name=gmax_{attr_name}, gif_url={gif_url}"
             )
         else:
@@ -164,11 +166,11 @@ def get_pokemon_gif_from_local_data(input_name: str):
                 # Pad dex_number to 3 digits
                 padded_dex = str(dex_number).zfill(3)
                 gif_url = f"https://graphics.tppcrpg.net/xy/golden/{padded_dex}M.gif"
-                debug_log(f"Golden regular form: direct gif_url={gif_url}")
+                _debug.log(f"Golden regular form: direct gif_url={gif_url}")
 
             else:
                 gif_url = getattr(GOLDEN_POKEMON_URL, golden_base_name_attr, None)
-                debug_log(
+                _debug.log(
                     f"Golden regular form: no dex number, fallback gif_url={gif_url}"
                 )
 